@@ -0,0 +1,353 @@
+# Import packages
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from tab_df.logics import Dataset, STRING_STORAGES
+from common.cache import CachedDataset, get_file_hash
+from common.disk_cache import DiskCache, DEFAULT_DISK_CACHE_DIR
+from common.ingest import CSV_ENGINES, DEFAULT_CSV_ENGINE, get_file_size
+from common.precompute import DEFAULT_COLUMNS_PER_TASK, DEFAULT_MAX_WORKERS, find_columns_by_kind, profile_columns
+from common.sketches import DISTINCT_MODES
+
+# pyarrow is only needed to write the profiles as Parquet files
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Formats of the profile written for each CSV file
+OUTPUT_FORMATS = ['json', 'parquet']
+
+
+def find_csv_files(paths):
+    """
+    --------------------
+    Description
+    --------------------
+    -> find_csv_files (function): Function that lists the CSV files to be profiled: files are kept as provided and directories are replaced by the CSV files they contain, in alphabetical order
+
+    --------------------
+    Parameters
+    --------------------
+    -> paths (list): Paths of CSV files or directories
+
+    --------------------
+    Returns
+    --------------------
+    -> (list): Paths of the CSV files, without duplicates
+
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.csv'))))
+        else:
+            files.append(path)
+    return list(dict.fromkeys(files))
+
+
+def profile_to_record(profile):
+    """
+    --------------------
+    Description
+    --------------------
+    -> profile_to_record (function): Function that converts a common.profile_store.ColumnProfile to plain Python values that can be written as JSON or Parquet: the summary and the most frequent values as lists of dicts (values as displayed in the tabs), the data of the charts as lists of rows and the details as a dict
+
+    --------------------
+    Parameters
+    --------------------
+    -> profile (ColumnProfile): Profile of a column
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Profile with its kind, column, summary, frequent, charts and details
+
+    """
+    summary = pd.DataFrame(profile.summary)
+    frequent = profile.frequent
+    charts = {}
+    for name, chart in profile.charts.items():
+        # The charts are rebuilt from their data, Timestamps are written in ISO format and NaN as null
+        if isinstance(getattr(chart, 'data', None), pd.DataFrame):
+            charts[name] = json.loads(chart.data.to_json(orient='records', date_format='iso'))
+    return {
+        'kind': profile.kind,
+        'column': str(profile.col_name),
+        'summary': [{'description': str(description), 'value': str(value)} for description, value in zip(summary['Description'], summary['Value'])],
+        'frequent': [
+            {'value': str(value), 'occurrence': int(occurrence), 'percentage': float(percentage)}
+            for value, occurrence, percentage in zip(frequent['value'], frequent['occurrence'], frequent['percentage'])
+        ],
+        'charts': charts,
+        'details': json.loads(json.dumps(profile.details, default=str)),
+    }
+
+
+def profile_dataset(file_path, cache_dir=None, string_storage='python', compact_dtypes=False, csv_engine=DEFAULT_CSV_ENGINE):
+    """
+    --------------------
+    Description
+    --------------------
+    -> profile_dataset (function): Function run by the worker processes that parses a CSV file once and computes the overview of the DataFrame tab with tab_df.logics.Dataset, then finds the columns of each kind to be profiled.
+    With a disk cache directory, the parsed dataframe is written to (or memory-mapped from) its Feather file in the common.disk_cache.DiskCache, so the tasks profiling its columns read only their pages instead of parsing the CSV file again.
+
+    --------------------
+    Parameters
+    --------------------
+    -> file_path (str): Path of the CSV file
+    -> cache_dir (str): Directory of the disk cache, None to disable it (optional)
+    -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES
+    -> compact_dtypes (bool): Flag stating if numeric columns are downcast and low-cardinality text columns encoded as category
+    -> csv_engine (str): Engine parsing the CSV file, one of common.ingest.CSV_ENGINES
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Overview of the dataset as a record (record), lists of columns names stored by kind (cols_by_kind), path of the Feather file in the disk cache if any (disk_path), number of rows (n_rows) and of bytes of the CSV file (n_bytes) and wall time of the task in seconds (seconds)
+
+    """
+    start = time.perf_counter()
+    disk_cache = DiskCache(directory=cache_dir) if cache_dir else None
+    dataset = Dataset(file_path, string_storage=string_storage, compact_dtypes=compact_dtypes, csv_engine=csv_engine)
+    cached_dataset = CachedDataset(get_file_hash(file_path), file_path, dataset)
+    cached_dataset.load(disk_cache=disk_cache)
+    dataset.set_data()
+    cols_by_kind = find_columns_by_kind(file_path=file_path, df=cached_dataset.df)
+    summary = dataset.get_summary()
+    record = {
+        'kind': 'dataset',
+        'column': None,
+        'summary': [{'description': str(description), 'value': str(value)} for description, value in zip(summary['Description'], summary['Value'])],
+        'frequent': [],
+        'charts': {},
+        'details': json.loads(json.dumps({
+            'table': json.loads(dataset.table.to_json(orient='records')) if dataset.table is not None else [],
+            'ingestion': dataset.ingestion,
+            'timings': dataset.timings,
+        }, default=str)),
+    }
+    return {
+        'record': record,
+        'cols_by_kind': {kind: [str(col_name) for col_name in cols_list] for kind, cols_list in cols_by_kind.items()},
+        'disk_path': cached_dataset.disk_path,
+        'n_rows': dataset.n_rows,
+        'n_bytes': get_file_size(file_path),
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def profile_column_slice(kind, cols_list, file_path, disk_path=None, string_storage='python', compact_dtypes=False, distinct_mode='exact'):
+    """
+    --------------------
+    Description
+    --------------------
+    -> profile_column_slice (function): Function run by the worker processes that profiles a slice of columns of the same kind with common.precompute.profile_columns(), reading them from the Feather file of the disk cache if any, otherwise from the CSV file, and converts the profiles to records (see profile_to_record)
+
+    --------------------
+    Parameters
+    --------------------
+    -> kind (str): Kind of the columns, one of common.profile_store.COLUMN_KINDS
+    -> cols_list (list): Names of the columns to be profiled
+    -> file_path (str): Path of the CSV file
+    -> disk_path (str): Path of the Feather file of the dataset in the disk cache (optional)
+    -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES
+    -> compact_dtypes (bool): Flag stating if the columns read from the CSV file are compacted (see common.dtypes.optimize_dtypes)
+    -> distinct_mode (str): Way of counting the unique values, one of common.sketches.DISTINCT_MODES
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Records of the profiled columns (records) and wall time of the task in seconds (seconds)
+
+    """
+    start = time.perf_counter()
+    if disk_path is not None:
+        profiles = profile_columns(kind, cols_list, disk_path=disk_path, string_storage=string_storage, distinct_mode=distinct_mode)
+    else:
+        profiles = profile_columns(kind, cols_list, file_path=file_path, string_storage=string_storage, compact_dtypes=compact_dtypes, distinct_mode=distinct_mode)
+    return {'records': [profile_to_record(profile) for profile in profiles], 'seconds': time.perf_counter() - start}
+
+
+def write_profile(output_path, profile, output_format='json'):
+    """
+    --------------------
+    Description
+    --------------------
+    -> write_profile (function): Function that writes the profile of a CSV file as a JSON document, or as a Parquet file with one row per profiled column (the overview of the dataset first), the charts and details being JSON strings and the other information of the file being stored in the metadata of the schema
+
+    --------------------
+    Parameters
+    --------------------
+    -> output_path (str): Path of the profile file
+    -> profile (dict): Profile of the CSV file: its records and information (file, rows, bytes, seconds, throughput)
+    -> output_format (str): Format of the file, one of OUTPUT_FORMATS
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    if output_format == 'json':
+        with open(output_path, 'w', encoding='utf-8') as output_file:
+            json.dump(profile, output_file, indent=2)
+        return
+
+    schema = pa.schema([
+        ('kind', pa.string()),
+        ('column', pa.string()),
+        ('summary', pa.list_(pa.struct([('description', pa.string()), ('value', pa.string())]))),
+        ('frequent', pa.list_(pa.struct([('value', pa.string()), ('occurrence', pa.int64()), ('percentage', pa.float64())]))),
+        ('charts', pa.string()),
+        ('details', pa.string()),
+    ])
+    rows = [dict(record, charts=json.dumps(record['charts']), details=json.dumps(record['details'])) for record in profile['columns']]
+    information = {name: value for name, value in profile.items() if name != 'columns'}
+    table = pa.Table.from_pylist(rows, schema=schema).replace_schema_metadata({'csv_explorer_profile': json.dumps(information)})
+    pq.write_table(table, output_path)
+
+
+def get_throughput(n_rows, n_bytes, seconds):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_throughput (function): Function that computes the throughput of a profiling run
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows profiled
+    -> n_bytes (int): Number of bytes of the CSV files profiled
+    -> seconds (float): Time spent in seconds
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Rows per second, None if no time was measured
+    -> (float): MB per second, None if no time was measured
+
+    """
+    if seconds <= 0:
+        return None, None
+    return n_rows / seconds, n_bytes / 1024 ** 2 / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile every column of one or many CSV files without Streamlit, on a pool of worker processes, and write one profile per file")
+    parser.add_argument("paths", nargs="+", help="CSV files or directories containing CSV files")
+    parser.add_argument("--output", default=".", help="Directory of the profiles (one <file name>.profile.<format> per CSV file)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="json")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="Number of worker processes")
+    parser.add_argument("--columns-per-task", type=int, default=DEFAULT_COLUMNS_PER_TASK, help="Maximum number of columns profiled by a single task")
+    parser.add_argument("--files-in-flight", type=int, default=None, help="Maximum number of files being profiled at once (default set to the number of workers)")
+    parser.add_argument("--string-storage", choices=STRING_STORAGES, default="python")
+    parser.add_argument("--compact-dtypes", action="store_true")
+    parser.add_argument("--distinct-mode", choices=DISTINCT_MODES, default="exact")
+    parser.add_argument("--csv-engine", choices=CSV_ENGINES, default=os.environ.get("CSV_EXPLORER_CSV_ENGINE", DEFAULT_CSV_ENGINE))
+    parser.add_argument("--cache-dir", default=os.environ.get("CSV_EXPLORER_DISK_CACHE_DIR", DEFAULT_DISK_CACHE_DIR), help="Directory of the disk cache the columns are read from once a file has been parsed")
+    parser.add_argument("--no-cache", action="store_true", help="Read the columns of each task from the CSV file instead of the disk cache")
+    args = parser.parse_args()
+
+    if args.format == "parquet" and pq is None:
+        parser.error("pyarrow is needed to write Parquet profiles")
+    files = find_csv_files(args.paths)
+    if not files:
+        parser.error("no CSV file found")
+    os.makedirs(args.output, exist_ok=True)
+    cache_dir = None if args.no_cache else args.cache_dir
+    files_in_flight = args.files_in_flight or args.workers
+
+    # Each file is first parsed by one task, then its columns are profiled by slices on the whole pool
+    queue = list(files)
+    states = {}
+    futures = {}
+    n_failed = 0
+    n_files = n_rows = n_bytes = 0
+    batch_start = time.perf_counter()
+    print(f"{'file':<40} {'rows':>10} {'MB':>8} {'columns':>8} {'task (s)':>9} {'rows/s':>11} {'MB/s':>8}")
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        while queue or futures:
+            while queue and len(states) < files_in_flight:
+                file_path = queue.pop(0)
+                states[file_path] = {'n_pending': 1, 'seconds': 0.0, 'columns': [], 'errors': []}
+                futures[executor.submit(profile_dataset, file_path, cache_dir, args.string_storage, args.compact_dtypes, args.csv_engine)] = (file_path, None)
+
+            done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+            for future in done:
+                file_path, kind = futures.pop(future)
+                state = states[file_path]
+                state['n_pending'] -= 1
+                if future.exception() is not None:
+                    state['errors'].append(f"{kind or 'dataset'}: {future.exception()}")
+                elif kind is None:
+                    result = future.result()
+                    state.update(n_rows=result['n_rows'], n_bytes=result['n_bytes'], seconds=result['seconds'])
+                    state['columns'].append(result['record'])
+                    for column_kind, cols_list in result['cols_by_kind'].items():
+                        for start in range(0, len(cols_list), args.columns_per_task):
+                            cols_slice = cols_list[start:start + args.columns_per_task]
+                            futures[executor.submit(profile_column_slice, column_kind, cols_slice, file_path, result['disk_path'], args.string_storage, args.compact_dtypes, args.distinct_mode)] = (file_path, column_kind)
+                            state['n_pending'] += 1
+                else:
+                    result = future.result()
+                    state['seconds'] += result['seconds']
+                    state['columns'].extend(result['records'])
+                if state['n_pending']:
+                    continue
+
+                # Every task of the file has finished: write its profile
+                del states[file_path]
+                for error in state['errors']:
+                    print(f"Failed to profile {file_path}: {error}", file=sys.stderr)
+                if 'n_rows' not in state:
+                    n_failed += 1
+                    continue
+                rows_per_second, mb_per_second = get_throughput(state['n_rows'], state['n_bytes'], state['seconds'])
+                profile = {
+                    'file': os.path.abspath(file_path),
+                    'n_rows': state['n_rows'],
+                    'n_bytes': state['n_bytes'],
+                    'task_seconds': state['seconds'],
+                    'rows_per_second': rows_per_second,
+                    'mb_per_second': mb_per_second,
+                    'errors': state['errors'],
+                    'columns': state['columns'],
+                }
+                write_profile(os.path.join(args.output, f"{Path(file_path).stem}.profile.{args.format}"), profile, output_format=args.format)
+                n_failed += bool(state['errors'])
+                n_files += 1
+                n_rows += state['n_rows']
+                n_bytes += state['n_bytes']
+                print(f"{Path(file_path).name[:40]:<40} {state['n_rows']:>10} {state['n_bytes'] / 1024 ** 2:>8.1f} {len(state['columns']) - 1:>8} {state['seconds']:>9.2f} "
+                      f"{rows_per_second or 0:>11.0f} {mb_per_second or 0:>8.1f}")
+
+    # Throughput of the whole batch, to size the batch nodes
+    seconds = time.perf_counter() - batch_start
+    rows_per_second, mb_per_second = get_throughput(n_rows, n_bytes, seconds)
+    print(f"Profiled {n_files} files ({n_rows} rows, {n_bytes / 1024 ** 2:.1f} MB) in {seconds:.2f} s with {args.workers} workers: "
+          f"{rows_per_second or 0:.0f} rows/s, {mb_per_second or 0:.1f} MB/s")
+    if n_failed:
+        print(f"{n_failed} files failed", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@ import streamlit as st
 import pandas as pd
 import sys
 import os
+import logging
+import tracemalloc
 from pathlib import Path
 
 # Set Python path
@@ -15,6 +17,14 @@ from tab_df.display import display_tab_df_content
 from tab_num.display import display_tab_num_content
 from tab_text.display import display_tab_text_content
 from tab_date.display import display_tab_date_content
+from common.cache import DatasetCache, get_file_hash, get_upload_id
+from common.ingest import DEFAULT_CSV_ENGINE
+from common.disk_cache import DiskCache, DEFAULT_DISK_CACHE_DIR, DEFAULT_DISK_MAX_AGE
+from common.profile_store import ProfileStore, DEFAULT_MAX_PROFILES, COLUMN_KINDS
+from common.precompute import ProfilePrecomputer, DEFAULT_MAX_WORKERS, find_columns_by_kind
+from common.progressive import ProgressiveRefiner
+from common.streaming import DEFAULT_CHUNKSIZE
+from common.instrumentation import logger as performance_logger
 
 # Set Streamlit Page Configuration
 st.set_page_config(
@@ -24,16 +34,44 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-# Set objects in Streamlit session state
-st.session_state["file_path"] = None
-st.session_state["df"] = None
-st.session_state["dataset"] = None
-st.session_state["selected_num_col"] = None
-st.session_state["num_column"] = None
-st.session_state["selected_text_col"] = None
-st.session_state["text_column"] = None
-st.session_state["selected_date_col"] = None
-st.session_state["date_column"] = None
+# Set objects in Streamlit session state (only on the first run so they are kept across reruns)
+for key in ["file_path", "chunksize", "lazy", "string_storage", "compact_dtypes", "precompute_key", "file_hash", "df", "dataset", "cached_dataset", "show_performance", "distinct_mode", "progressive", "selected_num_col", "num_column", "selected_text_col", "text_column", "selected_date_col", "date_column"]:
+    if key not in st.session_state:
+        st.session_state[key] = None
+if "profile_store" not in st.session_state:
+    st.session_state["profile_store"] = ProfileStore(max_profiles=int(os.environ.get("CSV_EXPLORER_MAX_PROFILES", DEFAULT_MAX_PROFILES)))
+if "precomputer" not in st.session_state:
+    st.session_state["precomputer"] = ProfilePrecomputer()
+if "refiner" not in st.session_state:
+    st.session_state["refiner"] = ProgressiveRefiner()
+if "dataset_cache" not in st.session_state:
+    # Parsed datasets are kept on disk as Feather files shared by all sessions (disabled if CSV_EXPLORER_DISK_CACHE_MB is 0)
+    disk_budget = int(os.environ.get("CSV_EXPLORER_DISK_CACHE_MB", 10240)) * 1024 ** 2
+    disk_cache = None
+    if disk_budget > 0:
+        disk_cache = DiskCache(
+            directory=os.environ.get("CSV_EXPLORER_DISK_CACHE_DIR", DEFAULT_DISK_CACHE_DIR),
+            max_bytes=disk_budget,
+            max_age=float(os.environ.get("CSV_EXPLORER_DISK_CACHE_DAYS", DEFAULT_DISK_MAX_AGE / 86400)) * 86400,
+        )
+    # Profiles of evicted datasets are invalidated with them, CSV files are parsed on all cores by pyarrow unless CSV_EXPLORER_CSV_ENGINE is pandas
+    st.session_state["dataset_cache"] = DatasetCache(
+        memory_budget=int(os.environ.get("CSV_EXPLORER_CACHE_MB", 1024)) * 1024 ** 2,
+        on_evict=lambda key: st.session_state.profile_store.invalidate(dataset_key=key),
+        disk_cache=disk_cache,
+        csv_engine=os.environ.get("CSV_EXPLORER_CSV_ENGINE", DEFAULT_CSV_ENGINE),
+    )
+
+# Stages recorded in the tabs are appended as JSON lines to CSV_EXPLORER_METRICS_FILE (the handler is only added once per process)
+metrics_file = os.environ.get("CSV_EXPLORER_METRICS_FILE")
+if metrics_file and not any(getattr(handler, "baseFilename", None) == os.path.abspath(metrics_file) for handler in performance_logger.handlers):
+    handler = logging.FileHandler(metrics_file)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    performance_logger.addHandler(handler)
+    performance_logger.setLevel(logging.INFO)
+# Memory allocated by each stage is only measured with CSV_EXPLORER_TRACE_MEMORY=1, as tracing slows every allocation down
+if os.environ.get("CSV_EXPLORER_TRACE_MEMORY") == "1" and not tracemalloc.is_tracing():
+    tracemalloc.start()
 
 # Display Title
 st.title("CSV Explorer")
@@ -41,15 +79,107 @@ st.title("CSV Explorer")
 # Add Window to upload CSV file
 with st.expander("ℹ️ - Streamlit application for performing data exploration on a CSV", expanded=True):
     st.session_state.file_path = st.file_uploader("Choose a CSV file")
+    # Streaming mode reads the CSV file chunk by chunk instead of loading it as a whole
+    if st.checkbox("Streaming mode for large files"):
+        st.session_state.chunksize = int(st.number_input("Rows per chunk", min_value=1000, value=DEFAULT_CHUNKSIZE, step=100000))
+    else:
+        st.session_state.chunksize = None
+    # Columns on demand only read the header and first rows, then the analysed column when it is selected
+    st.session_state.lazy = st.checkbox("Load columns on demand (wide files)")
+    # Arrow-backed strings store the text columns in contiguous buffers instead of one Python object per value
+    st.session_state.string_storage = "pyarrow" if st.checkbox("Arrow-backed text columns (string[pyarrow])") else "python"
+    # Compact dtypes downcast the numeric columns and encode the low-cardinality text columns as category
+    st.session_state.compact_dtypes = st.checkbox("Compact dtypes (downcast numbers, categorical text)")
+    # Background precomputation profiles every column on a pool of worker processes right after the upload
+    precompute = st.checkbox("Precompute all column profiles in the background")
+    if precompute:
+        max_workers = int(st.number_input("Worker processes", min_value=1, value=int(os.environ.get("CSV_EXPLORER_WORKERS", DEFAULT_MAX_WORKERS))))
+    # Performance details show the time, rows and memory of each stage computed in a tab
+    st.session_state.show_performance = st.checkbox("Show performance details")
+    # Approximate distinct counts estimate the number of unique values of large columns with a mergeable HyperLogLog sketch instead of a hash table of all values
+    st.session_state.distinct_mode = "approximate" if st.checkbox("Approximate distinct counts (HyperLogLog)") else "exact"
+    # Progressive profiling first displays the profile of a random sample of large columns, then their exact profile once computed in the background
+    st.session_state.progressive = st.checkbox("Progressive profiling (sample first, exact values in the background)")
 
-# If a CSV file is uploaded, display the different tabs
+# If a CSV file is uploaded, load it once (cached on the hash of its content) and display the different tabs
 if st.session_state.file_path is not None:
+    load = st.session_state.chunksize is None and not st.session_state.lazy
+    # The content of the upload is hashed once, the hash is reused by the reruns until another file is uploaded
+    upload_id = get_upload_id(st.session_state.file_path)
+    if st.session_state.file_hash is None or st.session_state.file_hash[0] != upload_id:
+        st.session_state.file_hash = (upload_id, get_file_hash(st.session_state.file_path))
+    st.session_state.cached_dataset = st.session_state.dataset_cache.get_or_load(st.session_state.file_path, load=load, string_storage=st.session_state.string_storage, compact_dtypes=st.session_state.compact_dtypes, key=st.session_state.file_hash[1])
+    st.session_state.dataset = st.session_state.cached_dataset.dataset
+    st.session_state.df = st.session_state.cached_dataset.df
+    if st.session_state.df is None and st.session_state.chunksize is None:
+        # The tabs receive a lazy dataset reading each column on demand (from the disk cache if the file has been parsed before)
+        st.session_state.df = st.session_state.cached_dataset.get_lazy_dataset(disk_cache=st.session_state.dataset_cache.disk_cache)
+
+    precomputer = st.session_state.precomputer
+    profile_store = st.session_state.profile_store
+    if precompute:
+        # (Re)start the precomputation when a new file is uploaded or the settings change (the previous tasks are cancelled)
+        precompute_key = (st.session_state.cached_dataset.key, st.session_state.chunksize, st.session_state.cached_dataset.df is None, st.session_state.string_storage, st.session_state.compact_dtypes, max_workers, st.session_state.distinct_mode)
+        if st.session_state.precompute_key != precompute_key:
+            dataset_key = st.session_state.cached_dataset.key
+            cols_by_kind = {kind: profile_store.get_columns(dataset_key, kind) for kind in COLUMN_KINDS}
+            if any(cols_list is None for cols_list in cols_by_kind.values()):
+                cols_by_kind = find_columns_by_kind(file_path=st.session_state.file_path, df=st.session_state.df, chunksize=st.session_state.chunksize)
+                for kind, cols_list in cols_by_kind.items():
+                    profile_store.put_columns(dataset_key, kind, cols_list)
+            precomputer.max_workers = max_workers
+            # A lazy dataset is only profiled from the disk cache, reading the CSV file once per task would be slower than loading it
+            df = st.session_state.cached_dataset.df if st.session_state.cached_dataset.disk_path is None else st.session_state.df
+            precomputer.start(dataset_key, cols_by_kind, df=df, file_path=st.session_state.file_path, chunksize=st.session_state.chunksize,
+                              disk_path=st.session_state.cached_dataset.disk_path, string_storage=st.session_state.string_storage,
+                              compact_dtypes=st.session_state.compact_dtypes, distinct_mode=st.session_state.distinct_mode)
+            st.session_state.precompute_key = precompute_key
+
+        # Move the profiles computed so far to the store shared by the tabs
+        precomputer.collect(profile_store)
+        if precomputer.n_columns:
+            st.progress(precomputer.n_done / precomputer.n_columns)
+            st.caption(f"{precomputer.n_done} of {precomputer.n_columns} columns profiled in the background")
+            if precomputer.is_running():
+                st.button("Refresh")
+        else:
+            st.caption("Background precomputation needs the CSV file to be loaded in memory or in the disk cache (streaming mode and columns on demand off).")
+        for error in precomputer.errors:
+            st.warning(error)
+    elif st.session_state.precompute_key is not None:
+        precomputer.cancel()
+        st.session_state.precompute_key = None
+
+    # Move the exact profiles refined so far to the store, so the tabs display them instead of the sample profiles
+    refiner = st.session_state.refiner
+    if st.session_state.progressive:
+        refiner.collect(profile_store)
+        for error in refiner.pop_errors():
+            st.warning(error)
+    elif refiner.is_running():
+        refiner.cancel()
+
     tab_df, tab_num, tab_text, tab_date = st.tabs(["DataFrame", "Numeric Serie", "Text Serie", "Datetime Serie"])
-    #with tab_df:
-        #display_tab_df_content(file_path=st.session_state.file_path)
+    with tab_df:
+        display_tab_df_content(file_path=st.session_state.file_path, chunksize=st.session_state.chunksize, lazy=st.session_state.cached_dataset.df is None)
     with tab_num:
-        display_tab_num_content(df=st.session_state.dataset.df)
-    #with tab_text:
-        #display_tab_text_content(df=st.session_state.dataset.df)
-    #with tab_date:
-        #display_tab_date_content(file_path=st.session_state.file_path, df=st.session_state.df)
\ No newline at end of file
+        display_tab_num_content(file_path=st.session_state.file_path, df=st.session_state.df, chunksize=st.session_state.chunksize)
+    with tab_text:
+        display_tab_text_content(file_path=st.session_state.file_path, df=st.session_state.df, chunksize=st.session_state.chunksize)
+    with tab_date:
+        display_tab_date_content(file_path=st.session_state.file_path, df=st.session_state.df, chunksize=st.session_state.chunksize)
+
+    # Once everything has been displayed, wait for an exact profile and rerun so it replaces its sample profile in place (a rerun requested by the user interrupts the wait)
+    if refiner.is_running():
+        status = st.empty()
+        while refiner.is_running() and not refiner.collect(profile_store):
+            status.caption(f"Computing the exact profile of {len(refiner.futures)} column(s) on all rows...")
+            refiner.wait(timeout=0.5)
+        (getattr(st, "rerun", None) or st.experimental_rerun)()
+else:
+    # Cancel the profiles being refined when the file is removed
+    st.session_state.refiner.cancel()
+    if st.session_state.precompute_key is not None:
+        # Cancel the precomputation when the file is removed
+        st.session_state.precomputer.cancel()
+        st.session_state.precompute_key = None
\ No newline at end of file
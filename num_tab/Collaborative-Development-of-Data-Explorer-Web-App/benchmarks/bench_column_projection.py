@@ -0,0 +1,122 @@
+# Import packages
+import argparse
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from common.lazy import LazyDataset
+from common.precompute import find_columns_by_kind
+from tab_num.logics import NumericColumn
+
+
+def write_wide_csv(file_path, n_rows, n_cols, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> write_wide_csv (function): Function that writes a wide CSV file: float columns alternating with low-cardinality text columns
+
+    --------------------
+    Parameters
+    --------------------
+    -> file_path (str): Path of the CSV file to be written
+    -> n_rows (int): Number of rows
+    -> n_cols (int): Number of columns
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    labels = np.array(["red", "green", "blue", "yellow"], dtype=object)
+    columns = {}
+    for i in range(n_cols):
+        columns[f"col_{i}"] = rng.normal(100, 20, n_rows).round(2) if i % 2 == 0 else labels[rng.integers(0, len(labels), n_rows)]
+    pd.DataFrame(columns).to_csv(file_path, index=False)
+
+
+def first_interaction(df, file_path):
+    """
+    --------------------
+    Description
+    --------------------
+    -> first_interaction (function): Function that does what the tabs do before displaying the first numeric column: listing the columns of each kind, then profiling the first numeric column
+
+    --------------------
+    Parameters
+    --------------------
+    -> df (pd.DataFrame or common.lazy.LazyDataset): Loaded dataframe or lazy dataset
+    -> file_path (str): Path of the CSV file
+
+    --------------------
+    Returns
+    --------------------
+    -> (common.profile_store.ColumnProfile): Profile of the first numeric column
+
+    """
+    cols_by_kind = find_columns_by_kind(file_path=file_path, df=df)
+    return NumericColumn(file_path=file_path, df=df).get_profile(cols_by_kind["num"][0])
+
+
+def measure(func):
+    """
+    --------------------
+    Description
+    --------------------
+    -> measure (function): Function that runs func once and returns its wall time in seconds and the peak memory allocated meanwhile in MB (tracked by tracemalloc)
+
+    --------------------
+    Parameters
+    --------------------
+    -> func (callable): Function without parameters to be measured
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Wall time in seconds
+    -> (float): Peak memory in MB
+
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare loading a wide CSV file as a whole against reading only the selected column on demand, up to the profile of the first numeric column")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 500_000])
+    parser.add_argument("--cols", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'cols':>6} {'full load (s)':>14} {'on demand (s)':>14} {'full peak (MB)':>15} {'on demand peak (MB)':>20}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in args.rows:
+            file_path = os.path.join(tmp_dir, f"wide_{n_rows}.csv")
+            write_wide_csv(file_path, n_rows, args.cols, rng)
+            full_time, full_peak = measure(lambda: first_interaction(pd.read_csv(file_path), file_path))
+            lazy_time, lazy_peak = measure(lambda: first_interaction(LazyDataset(file_path), file_path))
+            print(f"{n_rows:>10} {args.cols:>6} {full_time:>14.3f} {lazy_time:>14.3f} {full_peak:>15.1f} {lazy_peak:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Import packages
+import argparse
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from tab_df.logics import Dataset
+
+
+def write_csv(file_path, n_rows, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> write_csv (function): Function that writes a CSV file shaped like usual tabular exports: integer IDs and counts, a small integer code, a float amount, low-cardinality categories and a free-text column
+
+    --------------------
+    Parameters
+    --------------------
+    -> file_path (str): Path of the CSV file to be written
+    -> n_rows (int): Number of rows
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    countries = np.array(["France", "Germany", "Italy", "Spain", "United Kingdom", "United States"], dtype=object)
+    statuses = np.array(["open", "closed", "pending"], dtype=object)
+    pd.DataFrame({
+        "id": np.arange(n_rows),
+        "quantity": rng.integers(0, 1000, n_rows),
+        "code": rng.integers(-50, 50, n_rows),
+        "amount": rng.normal(100, 20, n_rows).round(2),
+        "country": countries[rng.integers(0, len(countries), n_rows)],
+        "status": statuses[rng.integers(0, len(statuses), n_rows)],
+        "comment": pd.Series(rng.integers(0, n_rows, n_rows)).astype(str).radd("comment "),
+    }).to_csv(file_path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the memory used by a dataset loaded with the dtypes parsed by pandas and with compact dtypes")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'string storage':>15} {'parsed (MB)':>12} {'compact (MB)':>13} {'ratio':>6} {'load (s)':>9} {'compact load (s)':>17}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in args.rows:
+            file_path = os.path.join(tmp_dir, f"dtypes_{n_rows}.csv")
+            write_csv(file_path, n_rows, rng)
+            for string_storage in ["python", "pyarrow"]:
+                timings = {}
+                memory = {}
+                for compact_dtypes in [False, True]:
+                    dataset = Dataset(file_path, string_storage=string_storage, compact_dtypes=compact_dtypes)
+                    start = time.perf_counter()
+                    dataset.set_df()
+                    timings[compact_dtypes] = time.perf_counter() - start
+                    memory[compact_dtypes] = dataset.df.memory_usage(index=False, deep=True).sum() / 1024 ** 2
+                print(f"{n_rows:>10} {string_storage:>15} {memory[False]:>12.1f} {memory[True]:>13.1f} {memory[False] / memory[True]:>5.1f}x {timings[False]:>9.3f} {timings[True]:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
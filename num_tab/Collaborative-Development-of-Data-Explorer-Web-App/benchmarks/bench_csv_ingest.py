@@ -0,0 +1,44 @@
+# Import packages
+import argparse
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from common.ingest import ingest_csv
+from tab_df.logics import STRING_STORAGES
+from bench_compact_dtypes import write_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the parsing throughput of the pandas C parser and of the multithreaded pyarrow CSV reader, and check that both give the same dataframe")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'file (MB)':>10} {'storage':>8} {'pandas (s)':>11} {'pandas (MB/s)':>14} {'pyarrow (s)':>12} {'pyarrow (MB/s)':>15} {'threads':>8} {'same':>5}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in args.rows:
+            file_path = os.path.join(tmp_dir, f"ingest_{n_rows}.csv")
+            write_csv(file_path, n_rows, rng)
+            expected, pandas_details = ingest_csv(file_path, engine="pandas")
+            for string_storage in STRING_STORAGES:
+                df, details = ingest_csv(file_path, engine="pyarrow", string_storage=string_storage)
+                same = df.astype(expected.dtypes.to_dict()).equals(expected)
+                print(f"{n_rows:>10} {details['n_bytes'] / 1024 ** 2:>10.1f} {string_storage:>8} {pandas_details['seconds']:>11.3f} {pandas_details['throughput']:>14.1f} "
+                      f"{details['seconds']:>12.3f} {details['throughput']:>15.1f} {details['n_threads']:>8} {str(same):>5}")
+                if details['fallback']:
+                    print(f"  fallback to pandas: {details['fallback']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from tab_date.logics import count_date_buckets
+
+
+def make_dates(n_rows, n_years, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_dates (function): Function that generates random dates with a time of day spread over n_years years from 1970-01-01, with 1% of missing values
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of dates
+    -> n_years (int): Span of the dates in years
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Datetime serie
+
+    """
+    span = int(n_years * 365.2425 * 86_400 * 10 ** 9)
+    dates = pd.Series(pd.to_datetime(rng.integers(0, span, n_rows)))
+    dates[rng.random(n_rows) < 0.01] = pd.NaT
+    return dates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare counting the dates per adaptive bucket on their int64 representation against counting them per year and per day with value_counts(), and the number of rows sent to the chart")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--years", type=float, nargs="+", default=[0.01, 1, 30])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'years':>6} {'bucket':>8} {'bars':>6} {'buckets (s)':>12} {'per year (s)':>13} {'per day (s)':>12} {'day rows':>9}")
+    for n_rows in args.rows:
+        for n_years in args.years:
+            dates = make_dates(n_rows, n_years, rng)
+            start = time.perf_counter()
+            bucket, bucket_counts = count_date_buckets(dates)
+            bucket_time = time.perf_counter() - start
+            start = time.perf_counter()
+            dates.dt.year.value_counts().reset_index()
+            year_time = time.perf_counter() - start
+            start = time.perf_counter()
+            day_counts = dates.dt.normalize().value_counts().reset_index()
+            day_time = time.perf_counter() - start
+            print(f"{n_rows:>10} {n_years:>6g} {bucket:>8} {len(bucket_counts):>6} {bucket_time:>12.3f} {year_time:>13.3f} {day_time:>12.3f} {len(day_counts):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom classes
+from tab_date.logics import DateColumn
+
+
+def make_repetitive_dates(n_rows, n_distinct, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_repetitive_dates (function): Function that generates a text column of day first dates with a time drawn from n_distinct consecutive hours, with 1% of missing values
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows
+    -> n_distinct (int): Number of distinct dates
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Text serie of dates
+
+    """
+    hours = pd.date_range('1970-01-01', periods=n_distinct, freq='h').strftime('%d/%m/%Y %H:%M').to_numpy(dtype=object)
+    texts = hours[rng.integers(0, n_distinct, n_rows)]
+    texts[rng.random(n_rows) < 0.01] = None
+    return pd.Series(texts)
+
+
+def profile(texts, factorize):
+    """
+    --------------------
+    Description
+    --------------------
+    -> profile (function): Function that converts a text column to datetime, then computes its summary and most frequent values, and returns the time of the conversion and of the whole profile
+
+    --------------------
+    Parameters
+    --------------------
+    -> texts (pd.Series): Text serie of dates
+    -> factorize (bool): Whether the distinct values are parsed once (None to let DateColumn choose)
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Conversion time in seconds
+    -> (float): Profile time in seconds
+    -> (DateColumn): Profiled instance
+
+    """
+    date_col = DateColumn(df=pd.DataFrame({"date": texts}))
+    date_col.set_data("date")
+    start = time.perf_counter()
+    date_col.convert_serie_to_date(factorize=factorize)
+    conversion = time.perf_counter() - start
+    date_col.get_summary()
+    date_col.set_frequent()
+    return conversion, time.perf_counter() - start, date_col
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare parsing every row of a repetitive date column against parsing its distinct values once and broadcasting the dates through the codes")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--distinct", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>12} {'distinct':>9} {'per row (s)':>12} {'per distinct (s)':>17} {'profile per row (s)':>20} {'profile per distinct (s)':>25} {'auto':>5}")
+    for n_rows in args.rows:
+        for n_distinct in args.distinct:
+            texts = make_repetitive_dates(n_rows, n_distinct, rng)
+            row_conversion, row_profile, row_col = profile(texts, factorize=False)
+            distinct_conversion, distinct_profile, distinct_col = profile(texts, factorize=True)
+            if not distinct_col.serie.equals(row_col.serie) or distinct_col.n_unique != row_col.n_unique:
+                print(f"Warning: results differ for {n_rows} rows and {n_distinct} distinct values")
+            auto_col = DateColumn(df=pd.DataFrame({"date": texts}))
+            auto_col.set_data("date")
+            auto_col.convert_serie_to_date()
+            print(f"{n_rows:>12} {n_distinct:>9} {row_conversion:>12.3f} {distinct_conversion:>17.3f} {row_profile:>20.3f} {distinct_profile:>25.3f} {str(auto_col.codes is not None):>5}")
+
+
+if __name__ == "__main__":
+    main()
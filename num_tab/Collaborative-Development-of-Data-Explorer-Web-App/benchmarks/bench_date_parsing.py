@@ -0,0 +1,75 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom classes
+from tab_date.logics import DateColumn
+
+
+def make_date_strings(n_rows, seed=0):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_date_strings (function): Function that generates a text column of dates: mostly day first dates with a time, some ISO formatted dates and a few free-form ones
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows
+    -> seed (int): Seed of the random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Text serie of dates
+
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.Series(pd.Timestamp('2000-01-01') + pd.to_timedelta(rng.integers(0, 20 * 365 * 24 * 60, n_rows), unit='min'))
+    texts = dates.dt.strftime('%d/%m/%Y %H:%M').copy()
+    iso = rng.random(n_rows) < 0.4
+    texts[iso] = dates[iso].dt.strftime('%Y-%m-%d %H:%M:%S')
+    free_form = rng.random(n_rows) < 0.001
+    texts[free_form] = dates[free_form].dt.strftime('%A %d %B %Y')
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare DateColumn.convert_serie_to_date (format inference) against pd.to_datetime(format='mixed')")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'rows':>12} {'mixed (s)':>11} {'inferred (s)':>13} {'speedup':>9}  formats")
+    for n_rows in args.rows:
+        texts = make_date_strings(n_rows, args.seed)
+
+        start = time.perf_counter()
+        expected = pd.to_datetime(texts, format='mixed', dayfirst=True)
+        mixed = time.perf_counter() - start
+
+        date_col = DateColumn(df=pd.DataFrame({"date": texts}))
+        date_col.set_data("date")
+        start = time.perf_counter()
+        date_col.convert_serie_to_date()
+        inferred = time.perf_counter() - start
+
+        if not date_col.serie.equals(expected):
+            print(f"Warning: results differ from the mixed parser for {n_rows} rows")
+        print(f"{n_rows:>12} {mixed:>11.3f} {inferred:>13.3f} {mixed / inferred:>8.1f}x  {date_col.format_counts}")
+
+
+if __name__ == "__main__":
+    main()
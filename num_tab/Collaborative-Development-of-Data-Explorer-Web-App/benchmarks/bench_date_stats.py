@@ -0,0 +1,101 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom classes
+from tab_date.logics import DateColumn
+
+
+def run_separate_methods(date_col):
+    """
+    --------------------
+    Description
+    --------------------
+    -> run_separate_methods (function): Function that computes the date summary by calling each set_* method of tab_date.logics.DateColumn one after the other (one scan of the serie per statistic)
+
+    --------------------
+    Parameters
+    --------------------
+    -> date_col (DateColumn): Instance with self.serie already converted to datetime
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    date_col.set_unique()
+    date_col.set_missing()
+    date_col.set_weekend()
+    date_col.set_weekday()
+    date_col.set_future()
+    date_col.set_empty_1900()
+    date_col.set_empty_1970()
+    date_col.set_min()
+    date_col.set_max()
+
+
+def time_call(func, repeat):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_call (function): Function that runs func several times and returns the best wall time in seconds
+
+    --------------------
+    Parameters
+    --------------------
+    -> func (callable): Function without parameters to be timed
+    -> repeat (int): Number of runs
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Best wall time in seconds
+
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the fused DateColumn.set_date_stats kernel against the separate set_* methods")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--missing-ratio", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    start, end = pd.Timestamp("1990-01-01").value, pd.Timestamp("2030-01-01").value
+    print(f"{'rows':>12} {'separate (s)':>14} {'fused (s)':>12} {'speedup':>9}")
+    for n_rows in args.rows:
+        # Generate a serie with placeholder dates, dates in the future and missing values
+        serie = pd.Series(pd.to_datetime(rng.integers(start, end, n_rows)))
+        serie[rng.random(n_rows) < 0.01] = pd.Timestamp("1900-01-01")
+        serie[rng.random(n_rows) < args.missing_ratio] = pd.NaT
+
+        date_col = DateColumn()
+        date_col.serie = serie
+        separate = time_call(lambda: run_separate_methods(date_col), args.repeat)
+        fused = time_call(date_col.set_date_stats, args.repeat)
+        print(f"{n_rows:>12} {separate:>14.4f} {fused:>12.4f} {separate / fused:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
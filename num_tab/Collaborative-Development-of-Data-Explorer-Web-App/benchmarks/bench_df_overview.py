@@ -0,0 +1,80 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom classes
+from tab_df.logics import Dataset
+
+
+def make_dataframe(n_rows, n_cols, duplicate_ratio, missing_ratio, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_dataframe (function): Function that generates a dataframe with one text column out of ten, the other ones being numeric, with missing values and duplicated rows
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows
+    -> n_cols (int): Number of columns
+    -> duplicate_ratio (float): Share of rows copied from other rows
+    -> missing_ratio (float): Share of missing values in the numeric columns
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Generated dataframe
+
+    """
+    n_unique = n_rows - int(n_rows * duplicate_ratio)
+    columns = {}
+    for i in range(n_cols):
+        if i % 10 == 9:
+            columns[f"text_{i}"] = pd.Series(rng.integers(0, 10_000, n_unique)).astype(str).to_numpy(dtype=object)
+        else:
+            values = rng.normal(size=n_unique)
+            values[rng.random(n_unique) < missing_ratio] = np.nan
+            columns[f"num_{i}"] = values
+    df = pd.DataFrame(columns)
+    return pd.concat([df, df.sample(n_rows - n_unique, replace=True, random_state=0)], ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each part of the tab_df.logics.Dataset overview and compare the duplicates count against DataFrame.duplicated()")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cols", type=int, default=100)
+    parser.add_argument("--duplicate-ratio", type=float, default=0.01)
+    parser.add_argument("--missing-ratio", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    df = make_dataframe(args.rows, args.cols, args.duplicate_ratio, args.missing_ratio, np.random.default_rng(args.seed))
+    dataset = Dataset(None)
+    dataset.df = df
+    dataset.set_data()
+    # Deep accounting of the object columns for comparison with the default shallow one
+    dataset.memory_mode = "deep"
+    dataset.run_timed("table (deep)", dataset.set_table)
+    print(dataset.get_timings().to_string(index=False))
+    print(f"{'total':>20} {sum(dataset.timings.values()):.4f}")
+
+    start = time.perf_counter()
+    n_duplicates = int(df.duplicated().sum())
+    print(f"DataFrame.duplicated(): {time.perf_counter() - start:.4f} s ({n_duplicates} duplicates, Dataset found {dataset.n_duplicates})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Import packages
+import argparse
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from common.cache import DatasetCache
+from common.disk_cache import DiskCache
+from common.precompute import profile_columns
+from tab_df.logics import STRING_STORAGES
+from bench_compact_dtypes import write_csv
+
+
+def time_call(func):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_call (function): Function that runs func once and returns its result and wall time in seconds
+
+    --------------------
+    Parameters
+    --------------------
+    -> func (callable): Function without parameters to be timed
+
+    --------------------
+    Returns
+    --------------------
+    -> (object): Result of func
+    -> (float): Wall time in seconds
+
+    """
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare parsing a CSV file against memory-mapping its Feather file from the disk cache, for the whole dataset and for a single column")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'storage':>8} {'parse CSV (s)':>14} {'disk cache hit (s)':>19} {'one column profile (s)':>23} {'file (MB)':>10}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        disk_cache = DiskCache(directory=os.path.join(tmp_dir, "cache"))
+        for n_rows in args.rows:
+            file_path = os.path.join(tmp_dir, f"disk_cache_{n_rows}.csv")
+            write_csv(file_path, n_rows, rng)
+            for string_storage in STRING_STORAGES:
+                # First load parses the CSV file and writes the Feather file, the second one (new session) memory-maps it
+                _, parse = time_call(lambda: DatasetCache(disk_cache=disk_cache).get_or_load(file_path, string_storage=string_storage))
+                entry, hit = time_call(lambda: DatasetCache(disk_cache=disk_cache).get_or_load(file_path, string_storage=string_storage))
+                _, column = time_call(lambda: profile_columns("num", ["amount"], disk_path=entry.disk_path, string_storage=string_storage))
+                size = os.path.getsize(entry.disk_path) / 1024 ** 2
+                print(f"{n_rows:>10} {string_storage:>8} {parse:>14.3f} {hit:>19.3f} {column:>23.3f} {size:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
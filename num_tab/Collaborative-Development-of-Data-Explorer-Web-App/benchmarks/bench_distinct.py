@@ -0,0 +1,135 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from common.sketches import HyperLogLog
+
+
+def measure(function):
+    """
+    --------------------
+    Description
+    --------------------
+    -> measure (function): Function that runs a function twice: once to measure its wall time, then under tracemalloc (which slows down the allocations of Python objects) to measure the peak memory it allocates
+
+    --------------------
+    Parameters
+    --------------------
+    -> function (callable): Function without parameters to be measured
+
+    --------------------
+    Returns
+    --------------------
+    -> (object): Result of the function
+    -> (float): Wall time in seconds
+    -> (float): Peak memory allocated in MB
+
+    """
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak / 1024 ** 2
+
+
+def count_by_chunks(serie, n_chunks, error):
+    """
+    --------------------
+    Description
+    --------------------
+    -> count_by_chunks (function): Function that builds one HyperLogLog sketch per chunk of the serie, as streaming mode or worker processes would, and merges them
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Serie to be counted
+    -> n_chunks (int): Number of chunks
+    -> error (float): Relative standard error of the sketches
+
+    --------------------
+    Returns
+    --------------------
+    -> (HyperLogLog): Merged sketch
+
+    """
+    merged = HyperLogLog(error=error)
+    bounds = np.linspace(0, len(serie), n_chunks + 1).astype('int64')
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        sketch = HyperLogLog(error=error)
+        sketch.update(serie.iloc[start:stop])
+        merged.merge(sketch)
+    return merged
+
+
+def make_serie(kind, n_rows, n_distinct, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_serie (function): Function that generates a numeric, text or datetime serie drawing its values among n_distinct values
+
+    --------------------
+    Parameters
+    --------------------
+    -> kind (str): Kind of the serie, one of 'num', 'text' or 'date'
+    -> n_rows (int): Number of rows
+    -> n_distinct (int): Number of possible values
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Generated serie
+
+    """
+    draws = rng.integers(0, n_distinct, n_rows)
+    if kind == 'num':
+        return pd.Series(draws * 0.5)
+    if kind == 'text':
+        labels = np.array([f"value {i}" for i in range(n_distinct)], dtype=object)
+        return pd.Series(labels[draws])
+    return pd.Series(pd.to_datetime(draws * 60 * 10 ** 9))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare exact distinct counts (nunique) against HyperLogLog estimates, on a single pass and merged across chunks")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--distinct", type=int, nargs="+", default=[1_000, 1_000_000])
+    parser.add_argument("--kinds", nargs="+", default=["num", "text", "date"])
+    parser.add_argument("--error", type=float, default=0.01)
+    parser.add_argument("--chunks", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'kind':>5} {'rows':>10} {'distinct':>9} {'exact':>9} {'exact (s)':>10} {'exact (MB)':>11} {'hll':>9} {'hll (s)':>8} {'hll (MB)':>9} {'error':>8} {'merged':>9} {'merged error':>13}")
+    for kind in args.kinds:
+        for n_rows in args.rows:
+            for n_distinct in args.distinct:
+                serie = make_serie(kind, n_rows, n_distinct, rng)
+                exact, exact_seconds, exact_mb = measure(serie.nunique)
+                sketch, hll_seconds, hll_mb = measure(lambda: count_by_chunks(serie, 1, args.error))
+                merged = count_by_chunks(serie, args.chunks, args.error)
+                print(f"{kind:>5} {n_rows:>10} {n_distinct:>9} {exact:>9} {exact_seconds:>10.3f} {exact_mb:>11.1f} {sketch.get_count():>9} {hll_seconds:>8.3f} {hll_mb:>9.1f} "
+                      f"{sketch.get_count() / exact - 1:>+8.2%} {merged.get_count():>9} {merged.get_count() / exact - 1:>+13.2%}")
+    print(f"Sketch size: {sketch.registers.nbytes / 1024:.0f} KB, standard error {sketch.get_error():.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from common.frequent import HeavyHitters, get_top_k
+
+
+def make_series(n_rows, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_series (function): Function that generates high-cardinality columns of each data type handled by the tabs: shuffled integer IDs, hourly timestamps, text IDs and skewed (Zipf) numeric values
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Series stored by name
+
+    """
+    ids = rng.permutation(n_rows)
+    return {
+        "int ids": pd.Series(ids),
+        "timestamps": pd.Series(pd.Timestamp("2000-01-01") + pd.to_timedelta(ids, unit="h")),
+        "text ids": pd.Series(ids).astype(str),
+        "zipf": pd.Series(rng.zipf(1.5, n_rows).astype("float64")),
+    }
+
+
+def time_call(func, repeat):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_call (function): Function that runs func several times and returns the best wall time in seconds
+
+    --------------------
+    Parameters
+    --------------------
+    -> func (callable): Function without parameters to be timed
+    -> repeat (int): Number of runs
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Best wall time in seconds
+
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_heavy_hitters(serie, chunksize):
+    """
+    --------------------
+    Description
+    --------------------
+    -> run_heavy_hitters (function): Function that feeds a serie chunk by chunk to a common.frequent.HeavyHitters summary, like the streaming mode does
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Serie to be analysed
+    -> chunksize (int): Number of rows per chunk
+
+    --------------------
+    Returns
+    --------------------
+    -> (HeavyHitters): Summary of the serie
+
+    """
+    heavy_hitters = HeavyHitters()
+    for start in range(0, len(serie), chunksize):
+        heavy_hitters.update(serie.iloc[start:start + chunksize])
+    return heavy_hitters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare value_counts().head(k) against the partial selection of common.frequent.get_top_k and the streaming heavy hitters summary")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--chunksize", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'column':>12} {'value_counts (s)':>17} {'top-k (s)':>10} {'speedup':>8} {'heavy hitters (s)':>18}")
+    for n_rows in args.rows:
+        for name, serie in make_series(n_rows, rng).items():
+            full_sort = time_call(lambda: serie.value_counts().head(args.top_k), args.repeat)
+            top_k = time_call(lambda: get_top_k(serie, args.top_k), args.repeat)
+            streaming = time_call(lambda: run_heavy_hitters(serie, args.chunksize), args.repeat)
+            print(f"{n_rows:>10} {name:>12} {full_sort:>17.4f} {top_k:>10.4f} {full_sort / top_k:>7.1f}x {streaming:>18.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom classes
+from tab_num.logics import NumericColumn
+
+
+def run_separate_methods(numeric_col):
+    """
+    --------------------
+    Description
+    --------------------
+    -> run_separate_methods (function): Function that computes the numeric summary by calling each set_* method of tab_num.logics.NumericColumn one after the other (one scan of the serie per statistic)
+
+    --------------------
+    Parameters
+    --------------------
+    -> numeric_col (NumericColumn): Instance with self.serie already set
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    numeric_col.set_unique()
+    numeric_col.set_missing()
+    numeric_col.set_zeros()
+    numeric_col.set_negatives()
+    numeric_col.set_mean()
+    numeric_col.set_std()
+    numeric_col.set_min()
+    numeric_col.set_max()
+    numeric_col.set_median()
+
+
+def time_call(func, repeat):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_call (function): Function that runs func several times and returns the best wall time in seconds
+
+    --------------------
+    Parameters
+    --------------------
+    -> func (callable): Function without parameters to be timed
+    -> repeat (int): Number of runs
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Best wall time in seconds
+
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the fused NumericColumn.set_stats kernel against the separate set_* methods")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--missing-ratio", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>12} {'separate (s)':>14} {'fused (s)':>12} {'speedup':>9}")
+    for n_rows in args.rows:
+        # Generate a serie with negatives, zeros and missing values
+        values = rng.normal(loc=10, scale=50, size=n_rows).round(2)
+        values[rng.random(n_rows) < args.missing_ratio] = np.nan
+        df = pd.DataFrame({"value": values})
+
+        numeric_col = NumericColumn(df=df)
+        numeric_col.serie = df["value"]
+        separate = time_call(lambda: run_separate_methods(numeric_col), args.repeat)
+        fused = time_call(numeric_col.set_stats, args.repeat)
+        print(f"{n_rows:>12} {separate:>14.4f} {fused:>12.4f} {separate / fused:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from common.progressive import PROGRESSIVE_SAMPLE_SIZE
+from tab_num.logics import NumericColumn
+from tab_date.logics import DateColumn
+
+
+def make_dataframe(n_rows, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_dataframe (function): Function that generates a dataframe with a skewed numeric column with missing values and a text column of dates
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Generated dataframe
+
+    """
+    amounts = rng.lognormal(3, 1, n_rows)
+    amounts[rng.random(n_rows) < 0.05] = np.nan
+    dates = pd.Series(pd.to_datetime(rng.integers(1_400_000_000, 1_900_000_000, n_rows) * 10 ** 9)).dt.strftime('%Y-%m-%d %H:%M:%S')
+    return pd.DataFrame({"amount": amounts, "date": dates})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the time to the first profile of a column in progressive mode (random sample) against the time to its exact profile")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--sample", type=int, default=PROGRESSIVE_SAMPLE_SIZE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'kind':>5} {'sample (s)':>11} {'exact (s)':>10} {'speedup':>9}")
+    for n_rows in args.rows:
+        df = make_dataframe(n_rows, rng)
+        for kind, column_class, col_name in [("num", NumericColumn, "amount"), ("date", DateColumn, "date")]:
+            start = time.perf_counter()
+            column_class(file_path=None, df=df).get_sample_profile(col_name, sample_size=args.sample)
+            sample = time.perf_counter() - start
+            start = time.perf_counter()
+            exact_profile = column_class(file_path=None, df=df).get_profile(col_name)
+            exact = time.perf_counter() - start
+            print(f"{n_rows:>10} {kind:>5} {sample:>11.3f} {exact:>10.3f} {exact / sample:>8.1f}x")
+
+    # Estimates of the sample profile next to the exact values of the last column
+    sample_profile = DateColumn(df=df).get_sample_profile("date", sample_size=args.sample)
+    print(pd.DataFrame({"Sample": sample_profile.summary.set_index("Description")["Value"], "Exact": exact_profile.summary.set_index("Description")["Value"]}).to_string())
+
+
+if __name__ == "__main__":
+    main()
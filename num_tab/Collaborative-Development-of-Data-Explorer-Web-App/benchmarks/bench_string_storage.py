@@ -0,0 +1,99 @@
+# Import packages
+import argparse
+import sys
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from tab_df.logics import Dataset, STRING_STORAGES
+from tab_text.logics import TextColumn
+from tab_date.logics import DateColumn
+
+
+def write_csv(file_path, n_rows, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> write_csv (function): Function that writes a CSV file with a free-text column, a low-cardinality category column, a text date column and a numeric column
+
+    --------------------
+    Parameters
+    --------------------
+    -> file_path (str): Path of the CSV file to be written
+    -> n_rows (int): Number of rows
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    words = np.array(["lorem", "ipsum", "DOLOR", "sit", "amet", "42", "consectetur", "adipiscing"], dtype=object)
+    pd.DataFrame({
+        "text": words[rng.integers(0, len(words), n_rows)] + " " + words[rng.integers(0, len(words), n_rows)],
+        "category": words[rng.integers(0, 4, n_rows)],
+        "date": (pd.Timestamp("2000-01-01") + pd.to_timedelta(rng.integers(0, 9000, n_rows), unit="D")).strftime("%Y-%m-%d"),
+        "amount": rng.normal(size=n_rows),
+    }).to_csv(file_path, index=False)
+
+
+def time_call(func):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_call (function): Function that runs func once and returns its wall time in seconds
+
+    --------------------
+    Parameters
+    --------------------
+    -> func (callable): Function without parameters to be timed
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Wall time in seconds
+
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the object and Arrow-backed storages of text columns: memory used, loading and profiling times")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'storage':>8} {'memory (MB)':>12} {'load (s)':>9} {'text (s)':>9} {'date (s)':>9}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in args.rows:
+            file_path = os.path.join(tmp_dir, f"strings_{n_rows}.csv")
+            write_csv(file_path, n_rows, rng)
+            for string_storage in STRING_STORAGES:
+                dataset = Dataset(file_path, string_storage=string_storage)
+                load = time_call(dataset.set_df)
+                memory = dataset.df.memory_usage(index=False, deep=True).sum() / 1024 ** 2
+                text_column = TextColumn(df=dataset.df)
+                text = time_call(lambda: [text_column.get_profile(col_name) for col_name in ["text", "category"]])
+                date_column = DateColumn(file_path, df=dataset.df)
+                date = time_call(lambda: date_column.get_profile("date"))
+                print(f"{n_rows:>10} {string_storage:>8} {memory:>12.1f} {load:>9.3f} {text:>9.3f} {date:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from common.frequent import get_top_k
+from common.text_kernels import count_text_properties
+from tab_text.logics import TextColumn
+
+
+def run_separate_hashes(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> run_separate_hashes (function): Function that computes the count-based statistics of the Text tab with one hash pass of the serie each (number of unique values, mode and most frequent values) and the text properties on every row
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Text serie
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    serie.nunique()
+    count_text_properties(serie)
+    get_top_k(serie, 1)
+    get_top_k(serie, 20)
+
+
+def run_factorized(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> run_factorized (function): Function that computes the same statistics with tab_text.logics.TextColumn, which factorizes the serie once and reads every statistic from the counts of the distinct values
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Text serie
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    text_col = TextColumn(df=pd.DataFrame({"text": serie}))
+    text_col.set_data("text")
+    text_col.set_frequent()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare one hash pass per statistic of a text column against factorizing it once and counting the codes")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--distinct", type=int, nargs="+", default=[100, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>12} {'distinct':>9} {'separate (s)':>13} {'factorized (s)':>15} {'speedup':>9}")
+    for n_rows in args.rows:
+        for n_distinct in args.distinct:
+            labels = np.array([f"label {i}" for i in range(n_distinct)], dtype=object)
+            serie = pd.Series(labels[rng.integers(0, n_distinct, n_rows)])
+            start = time.perf_counter()
+            run_separate_hashes(serie)
+            separate = time.perf_counter() - start
+            start = time.perf_counter()
+            run_factorized(serie)
+            factorized = time.perf_counter() - start
+            print(f"{n_rows:>12} {n_distinct:>9} {separate:>13.3f} {factorized:>15.3f} {separate / factorized:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+# Import packages
+import argparse
+import sys
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from tab_text.logics import TextColumn
+
+
+def make_text_serie(n_rows, rng):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_text_serie (function): Function that generates a free-text column mixing lowercase, uppercase, capitalised, digit, whitespace only, empty and missing values of random lengths
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows
+    -> rng (np.random.Generator): Random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Text serie
+
+    """
+    words = np.array(["lorem", "IPSUM", "Dolor", "sit amet", "12345", "  ", "", "consectetur adipiscing", "2024", "ÉLAN", "naïve"], dtype=object)
+    texts = words[rng.integers(0, len(words), n_rows)] + words[rng.integers(0, len(words), n_rows)]
+    serie = pd.Series(texts, dtype="object")
+    serie[rng.random(n_rows) < 0.02] = None
+    return serie
+
+
+def time_call(func, repeat):
+    """
+    --------------------
+    Description
+    --------------------
+    -> time_call (function): Function that runs func several times and returns the best wall time in seconds
+
+    --------------------
+    Parameters
+    --------------------
+    -> func (callable): Function without parameters to be timed
+    -> repeat (int): Number of runs
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Best wall time in seconds
+
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_separate(text_column):
+    """
+    --------------------
+    Description
+    --------------------
+    -> run_separate (function): Function that computes the text counts with the separate TextColumn methods, one .str loop per count
+
+    --------------------
+    Parameters
+    --------------------
+    -> text_column (TextColumn): Instance whose serie attribute is set
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): Computed counts
+
+    """
+    text_column.set_missing()
+    text_column.set_empty()
+    text_column.set_whitespace()
+    text_column.set_lowercase()
+    text_column.set_uppercase()
+    text_column.set_alphabet()
+    text_column.set_digit()
+    return get_counts(text_column)
+
+
+def run_fused(text_column):
+    """
+    --------------------
+    Description
+    --------------------
+    -> run_fused (function): Function that computes the text counts with the single TextColumn.set_text_stats() kernel
+
+    --------------------
+    Parameters
+    --------------------
+    -> text_column (TextColumn): Instance whose serie attribute is set
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): Computed counts
+
+    """
+    text_column.set_text_stats()
+    return get_counts(text_column)
+
+
+def get_counts(text_column):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_counts (function): Function that gathers the text counts of a TextColumn instance
+
+    --------------------
+    Parameters
+    --------------------
+    -> text_column (TextColumn): Instance whose counts have been computed
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): Missing, empty, whitespace, lowercase, uppercase, alphabetical and digit counts
+
+    """
+    return (text_column.n_missing, text_column.n_empty, text_column.n_space, text_column.n_lower,
+            text_column.n_upper, text_column.n_alpha, text_column.n_digit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the separate .str methods of TextColumn against the fused set_text_stats() kernel")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'rows':>10} {'separate (s)':>13} {'fused (s)':>10} {'speedup':>8} {'same counts':>12}")
+    for n_rows in args.rows:
+        text_column = TextColumn()
+        text_column.serie = make_text_serie(n_rows, rng)
+        separate = time_call(lambda: run_separate(text_column), args.repeat)
+        expected = get_counts(text_column)
+        fused = time_call(lambda: run_fused(text_column), args.repeat)
+        same = get_counts(text_column) == expected
+        print(f"{n_rows:>10} {separate:>13.4f} {fused:>10.4f} {separate / fused:>7.1f}x {str(same):>12}")
+
+
+if __name__ == "__main__":
+    main()
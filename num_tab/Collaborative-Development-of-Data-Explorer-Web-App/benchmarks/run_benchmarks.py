@@ -0,0 +1,353 @@
+# Import packages
+import argparse
+import json
+import platform
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Set Python path
+current_dir = os.path.dirname(__file__)
+parent_dir = str(Path(current_dir).resolve().parents[0])
+sys.path.append(parent_dir)
+
+# Import custom functions
+from tab_df.logics import Dataset
+from tab_num.logics import NumericColumn, BIN_METHODS
+from tab_text.logics import TextColumn
+from tab_date.logics import DateColumn
+
+# Kinds of the synthetic columns, used in turn
+COLUMN_KINDS = ['float', 'int', 'text', 'date']
+
+# Date formats mixed in the synthetic date columns by default
+DEFAULT_DATE_FORMATS = ['%Y-%m-%d %H:%M:%S', '%d/%m/%Y %H:%M', '%Y-%m-%d']
+
+# Default relative change of time or peak memory flagged by the comparison mode
+DEFAULT_THRESHOLD = 0.2
+
+# Changes smaller than this number of seconds are never flagged (timer noise on fast methods)
+MIN_SECONDS_DELTA = 0.002
+
+# Changes of peak memory smaller than this number of MB are never flagged
+MIN_MB_DELTA = 1.0
+
+
+def make_dataset(n_rows, n_cols, cardinality, null_ratio, date_formats, seed=0):
+    """
+    --------------------
+    Description
+    --------------------
+    -> make_dataset (function): Function that generates a synthetic dataset whose columns are, in turn, floats, integers, text values drawn from a vocabulary and dates written with a mix of formats. Every column has the same ratio of missing values.
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_rows (int): Number of rows
+    -> n_cols (int): Number of columns
+    -> cardinality (int): Number of distinct values of the integer and text columns
+    -> null_ratio (float): Share of missing values in each column
+    -> date_formats (list): Date formats used by the date columns, each value taking one of them at random
+    -> seed (int): Seed of the random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Synthetic dataset, with the dates stored as text like in a CSV file
+
+    """
+    rng = np.random.default_rng(seed)
+    # Vocabulary mixing lowercase, capitalized, uppercase and digit-only values
+    vocabulary = np.array([
+        [f"value {i}", f"Value{i}", f"VALUE_{i}", str(i)][i % 4] for i in range(cardinality)
+    ], dtype=object)
+    columns = {}
+    for i in range(n_cols):
+        kind = COLUMN_KINDS[i % len(COLUMN_KINDS)]
+        if kind == 'float':
+            serie = pd.Series(rng.normal(100, 20, n_rows).round(2))
+        elif kind == 'int':
+            serie = pd.Series(rng.integers(0, cardinality, n_rows))
+        elif kind == 'text':
+            serie = pd.Series(vocabulary[rng.integers(0, cardinality, n_rows)])
+        else:
+            dates = pd.Series(pd.Timestamp('2000-01-01') + pd.to_timedelta(rng.integers(0, 30 * 365 * 24 * 60, n_rows), unit='min'))
+            choices = rng.integers(0, len(date_formats), n_rows)
+            serie = pd.Series(np.empty(n_rows, dtype=object))
+            for j, date_format in enumerate(date_formats):
+                serie[choices == j] = dates[choices == j].dt.strftime(date_format)
+        if null_ratio > 0:
+            serie[rng.random(n_rows) < null_ratio] = None
+        columns[f"{kind}_{i}"] = serie
+    return pd.DataFrame(columns)
+
+
+def measure(setup, func, repeats):
+    """
+    --------------------
+    Description
+    --------------------
+    -> measure (function): Function that times func on a fresh state built by setup (not timed), repeats times, then runs it once more under tracemalloc to find its peak memory.
+    Memory allocated by pyarrow isn't tracked by tracemalloc.
+
+    --------------------
+    Parameters
+    --------------------
+    -> setup (callable): Function without parameters returning the state passed to func
+    -> func (callable): Function timed with the state as only parameter
+    -> repeats (int): Number of timed runs
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Median, minimum and maximum wall time in seconds (seconds, min_seconds, max_seconds), number of runs (repeats) and peak memory in MB (peak_mb)
+
+    """
+    timings = []
+    for _ in range(repeats):
+        state = setup()
+        start = time.perf_counter()
+        func(state)
+        timings.append(time.perf_counter() - start)
+    state = setup()
+    tracemalloc.start()
+    func(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'seconds': float(np.median(timings)),
+        'min_seconds': min(timings),
+        'max_seconds': max(timings),
+        'repeats': repeats,
+        'peak_mb': peak / 1024 ** 2,
+    }
+
+
+def get_cases(file_path, df):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_cases (function): Function that lists the benchmarked methods of the logic classes on the first column of each kind, as (name, setup, func) tuples. The setup builds the instance in the state the method is called in by the app.
+
+    --------------------
+    Parameters
+    --------------------
+    -> file_path (str): Path of the CSV file of the synthetic dataset
+    -> df (pd.DataFrame): Synthetic dataset as loaded from the CSV file
+
+    --------------------
+    Returns
+    --------------------
+    -> (list): Benchmark cases
+
+    """
+    num_col = next(col for col in df.columns if col.startswith('float'))
+    text_col = next(col for col in df.columns if col.startswith('text'))
+    date_col = next(col for col in df.columns if col.startswith('date'))
+
+    def loaded_dataset():
+        dataset = Dataset(file_path)
+        dataset.set_df()
+        return dataset
+
+    def numeric_column():
+        column = NumericColumn(file_path=file_path, df=df)
+        column.set_data(num_col)
+        return column
+
+    def text_column():
+        column = TextColumn(file_path=file_path, df=df)
+        column.set_data(text_col)
+        return column
+
+    def date_column():
+        column = DateColumn(file_path=file_path, df=df)
+        column.set_data(date_col)
+        return column
+
+    def converted_date_column():
+        column = date_column()
+        column.convert_serie_to_date()
+        return column
+
+    def summarized_dataset():
+        dataset = loaded_dataset()
+        dataset.set_data()
+        return dataset
+
+    cases = [
+        ('Dataset.set_df', lambda: Dataset(file_path), lambda dataset: dataset.set_df()),
+        ('Dataset.set_data', loaded_dataset, lambda dataset: dataset.set_data()),
+        ('Dataset.get_summary', summarized_dataset, lambda dataset: dataset.get_summary()),
+        ('NumericColumn.find_num_cols', lambda: NumericColumn(file_path=file_path, df=df), lambda column: column.find_num_cols()),
+        ('NumericColumn.set_data', lambda: NumericColumn(file_path=file_path, df=df), lambda column: column.set_data(num_col)),
+    ]
+    for method in BIN_METHODS:
+        cases.append((f'NumericColumn.set_histogram[{method}]', numeric_column, lambda column, method=method: column.set_histogram(method=method)))
+    cases += [
+        ('NumericColumn.set_frequent', numeric_column, lambda column: column.set_frequent()),
+        ('NumericColumn.get_summary', numeric_column, lambda column: column.get_summary()),
+        ('TextColumn.find_text_cols', lambda: TextColumn(file_path=file_path, df=df), lambda column: column.find_text_cols()),
+        ('TextColumn.set_data', lambda: TextColumn(file_path=file_path, df=df), lambda column: column.set_data(text_col)),
+        ('TextColumn.set_barchart', text_column, lambda column: column.set_barchart()),
+        ('TextColumn.set_frequent', text_column, lambda column: column.set_frequent()),
+        ('TextColumn.get_summary', text_column, lambda column: column.get_summary()),
+        ('DateColumn.find_date_cols', lambda: DateColumn(file_path=file_path, df=df), lambda column: column.find_date_cols()),
+        ('DateColumn.set_data', lambda: DateColumn(file_path=file_path, df=df), lambda column: column.set_data(date_col)),
+        ('DateColumn.convert_serie_to_date', date_column, lambda column: column.convert_serie_to_date()),
+        ('DateColumn.set_barchart', converted_date_column, lambda column: column.set_barchart()),
+        ('DateColumn.set_frequent', converted_date_column, lambda column: column.set_frequent()),
+        ('DateColumn.get_summary', converted_date_column, lambda column: column.get_summary()),
+    ]
+    return cases
+
+
+def run(args):
+    """
+    --------------------
+    Description
+    --------------------
+    -> run (function): Function that generates the synthetic dataset, writes it as a CSV file, runs every benchmark case and writes the results as JSON (to args.output, or to the standard output)
+
+    --------------------
+    Parameters
+    --------------------
+    -> args (argparse.Namespace): Command line arguments
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Results with the parameters and environment of the run
+
+    """
+    params = {
+        'rows': args.rows,
+        'cols': args.cols,
+        'cardinality': args.cardinality,
+        'null_ratio': args.null_ratio,
+        'date_formats': args.date_formats,
+        'seed': args.seed,
+        'repeats': args.repeats,
+    }
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "synthetic.csv")
+        make_dataset(args.rows, args.cols, args.cardinality, args.null_ratio, args.date_formats, seed=args.seed).to_csv(file_path, index=False)
+        df = pd.read_csv(file_path)
+        for name, setup, func in get_cases(file_path, df):
+            if args.only and not any(pattern in name for pattern in args.only):
+                continue
+            result = {'name': name, **measure(setup, func, args.repeats)}
+            results.append(result)
+            print(f"{name:<40} {result['seconds']:>10.4f} s {result['peak_mb']:>10.1f} MB", file=sys.stderr)
+
+    report = {
+        'params': params,
+        'environment': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return report
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    --------------------
+    Description
+    --------------------
+    -> compare (function): Function that compares the results of two runs method by method. A method is flagged as a regression when its median time (or peak memory) grew by more than threshold, and as an improvement when it dropped by more than threshold.
+    Time changes smaller than MIN_SECONDS_DELTA and memory changes smaller than MIN_MB_DELTA are ignored.
+
+    --------------------
+    Parameters
+    --------------------
+    -> baseline (dict): Results of the reference run
+    -> current (dict): Results of the new run
+    -> threshold (float): Relative change flagged
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): One row per method found in both runs with the times, peak memories, their ratios and the status (ok, regression, improvement)
+
+    """
+    baseline_results = {result['name']: result for result in baseline['results']}
+    rows = []
+    for result in current['results']:
+        reference = baseline_results.get(result['name'])
+        if reference is None:
+            continue
+        time_ratio = result['seconds'] / reference['seconds'] if reference['seconds'] > 0 else np.inf
+        memory_ratio = result['peak_mb'] / reference['peak_mb'] if reference['peak_mb'] > 0 else np.inf
+        time_changed = abs(result['seconds'] - reference['seconds']) >= MIN_SECONDS_DELTA
+        memory_changed = abs(result['peak_mb'] - reference['peak_mb']) >= MIN_MB_DELTA
+        status = 'ok'
+        if (time_changed and time_ratio > 1 + threshold) or (memory_changed and memory_ratio > 1 + threshold):
+            status = 'regression'
+        elif (time_changed and time_ratio < 1 - threshold) or (memory_changed and memory_ratio < 1 - threshold):
+            status = 'improvement'
+        rows.append({
+            'name': result['name'],
+            'baseline_s': reference['seconds'],
+            'current_s': result['seconds'],
+            'time_ratio': time_ratio,
+            'baseline_mb': reference['peak_mb'],
+            'current_mb': result['peak_mb'],
+            'memory_ratio': memory_ratio,
+            'status': status,
+        })
+    return pd.DataFrame(rows, columns=['name', 'baseline_s', 'current_s', 'time_ratio', 'baseline_mb', 'current_mb', 'memory_ratio', 'status'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time every public method of the logic classes on a synthetic dataset and write the results as JSON, or compare two result files and flag regressions")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument("--cardinality", type=int, default=1000, help="Number of distinct values of the integer and text columns")
+    parser.add_argument("--null-ratio", type=float, default=0.05, help="Share of missing values in each column")
+    parser.add_argument("--date-formats", nargs="+", default=DEFAULT_DATE_FORMATS, help="Date formats mixed in the date columns")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=3, help="Number of timed runs of each method (the median is reported)")
+    parser.add_argument("--only", nargs="+", help="Only run the methods whose name contains one of these patterns")
+    parser.add_argument("--output", help="JSON file to write the results to (standard output if not set)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), help="Compare two JSON result files instead of running the benchmarks")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Relative change flagged by --compare")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as baseline_file, open(args.compare[1]) as current_file:
+            baseline, current = json.load(baseline_file), json.load(current_file)
+        if baseline['params'] != current['params']:
+            print("Warning: the two runs were made with different parameters", file=sys.stderr)
+        comparison = compare(baseline, current, threshold=args.threshold)
+        with pd.option_context('display.max_rows', None, 'display.width', 200):
+            print(comparison.round(4).to_string(index=False))
+        n_regressions = int((comparison['status'] == 'regression').sum())
+        print(f"{n_regressions} regression(s) above {args.threshold:.0%}")
+        # Non-zero exit code so the comparison can fail a CI job
+        sys.exit(1 if n_regressions else 0)
+
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+from tab_df.logics import Dataset
+from common.lazy import LazyDataset
+from common.ingest import DEFAULT_CSV_ENGINE
+
+# Default memory budget of the dataset cache (in bytes)
+DEFAULT_MEMORY_BUDGET = 1024 ** 3
+
+# Size of the blocks read when hashing a file
+HASH_BLOCK_SIZE = 1024 ** 2
+
+
+def get_file_hash(file):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_file_hash (function): Function that computes the hash of the content of a CSV file. The file is read by blocks so it never needs to fit in memory twice.
+
+    --------------------
+    Parameters
+    --------------------
+    -> file (str or file-like): File path or uploaded file (Streamlit UploadedFile)
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Hexadecimal digest of the file content
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if hasattr(file, 'read'):
+        file.seek(0)
+        for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+        file.seek(0)
+    else:
+        with open(file, 'rb') as opened_file:
+            for block in iter(lambda: opened_file.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def get_upload_id(file):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_upload_id (function): Function that identifies an uploaded file without reading its content, so its hash (see get_file_hash) is only computed once per upload instead of on every Streamlit rerun. Uploaded files are identified by their upload id, name and size, file paths by their path, size and modification time
+
+    --------------------
+    Parameters
+    --------------------
+    -> file (str or file-like): File path or uploaded file (Streamlit UploadedFile)
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): Identity of the file
+
+    """
+    if hasattr(file, 'read'):
+        return (getattr(file, 'file_id', None) or getattr(file, 'id', None), getattr(file, 'name', None), getattr(file, 'size', None))
+    stat = os.stat(file)
+    return (str(file), stat.st_size, stat.st_mtime_ns)
+
+
+class CachedDataset:
+    """
+    --------------------
+    Description
+    --------------------
+    -> CachedDataset (class): Class that holds a parsed CSV file and every object derived from it so they can be reused across Streamlit reruns
+
+    --------------------
+    Attributes
+    --------------------
+    -> key (str): Hash of the content of the CSV file
+    -> name (str): Name of the CSV file
+    -> dataset (tab_df.logics.Dataset): Dataset instance
+    -> df (pd.DataFrame): Loaded dataframe (default set to None until self.load() is called)
+    -> columns (dict): Derived objects (NumericColumn, DateColumn, LazyDataset...) stored by name (default set to empty dict)
+    -> n_bytes (int): Memory used by the dataframe in bytes (default set to 0)
+    -> disk_path (str): Path of the Feather file holding the dataframe in the disk cache (default set to None)
+
+    """
+    def __init__(self, key, name, dataset):
+        self.key = key
+        self.name = name
+        self.dataset = dataset
+        self.df = None
+        self.columns = {}
+        self.n_bytes = 0
+        self.disk_path = None
+
+    def get_disk_key(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_disk_key (method): Class method that builds the key of the dataset in the disk cache from the hash of the CSV content and the loading settings, as they change the stored dataframe
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (str): Key in the disk cache
+
+        """
+        return f"{self.key}_{self.dataset.string_storage}_{'compact' if self.dataset.compact_dtypes else 'parsed'}"
+
+    def load(self, disk_cache=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> load (method): Class method that loads the CSV file through tab_df.logics.Dataset.set_df() if it hasn't been loaded before and computes the memory used by the dataframe.
+        With a disk cache, a dataset already parsed (in this session or another one) is memory-mapped from its Feather file instead, otherwise it is written to the disk cache once parsed.
+
+        --------------------
+        Parameters
+        --------------------
+        -> disk_cache (common.disk_cache.DiskCache): Disk cache of the parsed datasets (optional)
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.df is None:
+            df, loaded_dtypes = disk_cache.read(self.get_disk_key(), string_storage=self.dataset.string_storage) if disk_cache is not None else (None, None)
+            if df is not None:
+                self.dataset.df = df
+                self.dataset.loaded_dtypes = loaded_dtypes if self.dataset.compact_dtypes else None
+                self.disk_path = disk_cache.get_path(self.get_disk_key())
+            else:
+                self.dataset.set_df()
+                if disk_cache is not None:
+                    self.disk_path = disk_cache.write(self.get_disk_key(), self.dataset.df, loaded_dtypes=self.dataset.loaded_dtypes)
+            self.df = self.dataset.df
+            self.n_bytes = int(self.df.memory_usage(deep=True).sum())
+
+    def get_lazy_dataset(self, disk_cache=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_lazy_dataset (method): Class method that returns the common.lazy.LazyDataset of the CSV file, created with the loading settings of self.dataset and stored in self.columns the first time.
+        It reads the columns on demand from the Feather file of the dataset when it is in the disk cache, otherwise from the CSV file.
+
+        --------------------
+        Parameters
+        --------------------
+        -> disk_cache (common.disk_cache.DiskCache): Disk cache of the parsed datasets (optional)
+
+        --------------------
+        Returns
+        --------------------
+        -> (common.lazy.LazyDataset): Lazy dataset
+
+        """
+        if "lazy_dataset" not in self.columns:
+            if self.disk_path is None and disk_cache is not None and os.path.exists(disk_cache.get_path(self.get_disk_key())):
+                self.disk_path = disk_cache.get_path(self.get_disk_key())
+            self.columns["lazy_dataset"] = LazyDataset(self.dataset.file_path, string_storage=self.dataset.string_storage, compact_dtypes=self.dataset.compact_dtypes, disk_path=self.disk_path, csv_engine=self.dataset.csv_engine)
+        return self.columns["lazy_dataset"]
+
+
+class DatasetCache:
+    """
+    --------------------
+    Description
+    --------------------
+    -> DatasetCache (class): Class that parses each uploaded CSV file only once, keyed on the hash of its content, and keeps the results across Streamlit reruns.
+    When the total memory of the cached dataframes exceeds the memory budget, the least recently used datasets are evicted (the most recent one is always kept).
+
+    --------------------
+    Attributes
+    --------------------
+    -> memory_budget (int): Maximum memory in bytes used by the cached dataframes (default set to DEFAULT_MEMORY_BUDGET)
+    -> entries (OrderedDict): Cached datasets stored by file hash, from least to most recently used (default set to empty)
+    -> on_evict (callable): Function called with the hash of each evicted dataset, e.g. to invalidate the profiles computed from it (optional)
+    -> disk_cache (common.disk_cache.DiskCache): Disk cache of the parsed datasets, so that evicted or reopened files are memory-mapped instead of being parsed again (optional)
+    -> csv_engine (str): Engine parsing the CSV files, one of common.ingest.CSV_ENGINES (default set to DEFAULT_CSV_ENGINE)
+
+    """
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, on_evict=None, disk_cache=None, csv_engine=DEFAULT_CSV_ENGINE):
+        self.memory_budget = memory_budget
+        self.entries = OrderedDict()
+        self.on_evict = on_evict
+        self.disk_cache = disk_cache
+        self.csv_engine = csv_engine
+
+    def get_or_load(self, file, load=True, string_storage='python', compact_dtypes=False, key=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_or_load (method): Class method that returns the cached dataset matching the content of the provided file. If it hasn't been cached before, it is stored in the cache and, unless load is False (streaming mode), the CSV file is loaded through tab_df.logics.Dataset.set_df() (or read back from self.disk_cache).
+        A dataset cached with another storage of its text columns or other dtypes settings is loaded again (the objects derived from it are dropped).
+
+        --------------------
+        Parameters
+        --------------------
+        -> file (str or file-like): File path or uploaded file (Streamlit UploadedFile)
+        -> load (bool): Flag stating if the CSV file has to be loaded as a dataframe
+        -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES
+        -> compact_dtypes (bool): Flag stating if numeric columns are downcast and low-cardinality text columns encoded as category
+        -> key (str): Hash of the content of the file already computed with get_file_hash(). If None, the file is hashed (optional)
+
+        --------------------
+        Returns
+        --------------------
+        -> (CachedDataset): Cached dataset
+
+        """
+        if key is None:
+            key = get_file_hash(file)
+        if key in self.entries:
+            # Mark the dataset as the most recently used
+            self.entries.move_to_end(key)
+            entry = self.entries[key]
+            if (entry.dataset.string_storage, entry.dataset.compact_dtypes) != (string_storage, compact_dtypes):
+                entry.dataset = Dataset(file, memory_mode=entry.dataset.memory_mode, string_storage=string_storage, compact_dtypes=compact_dtypes, csv_engine=self.csv_engine)
+                entry.df = None
+                entry.columns = {}
+                entry.n_bytes = 0
+                entry.disk_path = None
+        else:
+            entry = CachedDataset(key, getattr(file, 'name', str(file)), Dataset(file, string_storage=string_storage, compact_dtypes=compact_dtypes, csv_engine=self.csv_engine))
+            self.entries[key] = entry
+
+        if load and entry.df is None:
+            entry.load(disk_cache=self.disk_cache)
+            self.evict()
+        return entry
+
+    def get_memory_usage(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_memory_usage (method): Class method that computes the memory used by all cached dataframes
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Memory used in bytes
+
+        """
+        return sum(entry.n_bytes for entry in self.entries.values())
+
+    def evict(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> evict (method): Class method that removes the least recently used datasets until the memory budget is respected. The most recently used dataset is never removed.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): Keys of the evicted datasets
+
+        """
+        evicted = []
+        while len(self.entries) > 1 and self.get_memory_usage() > self.memory_budget:
+            key, _ = self.entries.popitem(last=False)
+            evicted.append(key)
+            if self.on_evict is not None:
+                self.on_evict(key)
+        return evicted
+
+    def clear(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> clear (method): Class method that removes every cached dataset (self.on_evict is called for each of them)
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        for key in list(self.entries):
+            if self.on_evict is not None:
+                self.on_evict(key)
+        self.entries.clear()
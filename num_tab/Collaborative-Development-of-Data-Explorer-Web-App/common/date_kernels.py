@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+# Number of nanoseconds in an hour and in a day
+NS_PER_HOUR = 3_600 * 10 ** 9
+NS_PER_DAY = 24 * NS_PER_HOUR
+
+# Value of NaT in the int64 representation of datetime64[ns] values
+NAT_INT64 = np.iinfo('int64').min
+
+# Day of the week of 1970-01-01 (Thursday, Monday being 0)
+EPOCH_DAY_OF_WEEK = 3
+
+# Placeholder dates counted separately in the summary
+SENTINEL_DATES = {
+    'n_empty_1900': pd.Timestamp('1900-01-01').value,
+    'n_empty_1970': pd.Timestamp('1970-01-01').value,
+}
+
+
+def get_nanoseconds(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_nanoseconds (function): Function that gives the int64 view of the nanoseconds since 1970-01-01 of a datetime serie, missing values being NAT_INT64. datetime64[ns] series are not copied, timezone-aware dates are taken in their local wall time
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Datetime serie
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): int64 array
+
+    """
+    if getattr(serie.dtype, 'tz', None) is not None:
+        serie = serie.dt.tz_localize(None)
+    return serie.to_numpy(dtype='datetime64[ns]').view('int64')
+
+
+def count_date_properties(serie, now):
+    """
+    --------------------
+    Description
+    --------------------
+    -> count_date_properties (function): Function that computes together all the statistics displayed for a datetime column on its int64 nanosecond view (see get_nanoseconds), without copying the serie: missing values, weekend and weekday dates, dates in the future, placeholder dates (SENTINEL_DATES), minimum and maximum.
+    The day of the week is computed with integer arithmetic on the number of days since 1970-01-01, and the comparisons with the dates in the future and the placeholder dates don't need the missing values to be dropped first since NaT is the smallest int64.
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Datetime serie
+    -> now (pd.Timestamp): Date after which dates are in the future
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Statistics stored by name (n_rows, n_missing, n_weekend, n_weekday, n_future, n_empty_1900, n_empty_1970, col_min, col_max), col_min and col_max being pd.Timestamp or NaT
+
+    """
+    nanoseconds = get_nanoseconds(serie)
+    valid = nanoseconds != NAT_INT64
+    n_rows = len(nanoseconds)
+    n_valid = int(np.count_nonzero(valid))
+    counts = {'n_rows': n_rows, 'n_missing': n_rows - n_valid}
+
+    # Day of the week (Monday being 0) from the number of days, computed in place in a single buffer
+    day_of_week = nanoseconds // NS_PER_DAY
+    day_of_week += EPOCH_DAY_OF_WEEK
+    np.remainder(day_of_week, 7, out=day_of_week)
+    n_weekend = int(np.count_nonzero(day_of_week >= 5))
+    if counts['n_missing'] and (NAT_INT64 // NS_PER_DAY + EPOCH_DAY_OF_WEEK) % 7 >= 5:
+        # NaT falls on a weekend day too
+        n_weekend -= counts['n_missing']
+    counts['n_weekend'] = n_weekend
+    counts['n_weekday'] = n_valid - n_weekend
+
+    counts['n_future'] = int(np.count_nonzero(nanoseconds > pd.Timestamp(now).value))
+    for name, sentinel in SENTINEL_DATES.items():
+        counts[name] = int(np.count_nonzero(nanoseconds == sentinel))
+
+    if n_valid:
+        # NaT is never the maximum of a column with valid dates
+        counts['col_min'] = pd.Timestamp(nanoseconds.min(where=valid, initial=np.iinfo('int64').max))
+        counts['col_max'] = pd.Timestamp(nanoseconds.max())
+    else:
+        counts['col_min'] = counts['col_max'] = pd.NaT
+    return counts
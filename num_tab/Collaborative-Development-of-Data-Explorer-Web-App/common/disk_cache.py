@@ -0,0 +1,220 @@
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# pyarrow is installed with Streamlit but the disk cache is disabled if it isn't available
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+    feather = None
+
+# Default directory of the disk cache
+DEFAULT_DISK_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'csv_explorer_cache')
+
+# Default maximum size of the disk cache (in bytes)
+DEFAULT_DISK_BUDGET = 10 * 1024 ** 3
+
+# Default maximum age of the files of the disk cache (in seconds)
+DEFAULT_DISK_MAX_AGE = 7 * 24 * 3600
+
+# Extension of the files of the disk cache (uncompressed Feather V2 / Arrow IPC, so they can be memory-mapped)
+DISK_CACHE_SUFFIX = '.feather'
+
+# Key of the schema metadata holding the data types of the columns as parsed from the CSV file
+LOADED_DTYPES_METADATA = b'csv_explorer_loaded_dtypes'
+
+
+def read_feather_columns(path, columns=None, string_storage='python', nrows=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> read_feather_columns (function): Function that memory-maps a Feather file and converts the requested columns to a dataframe. Only the pages of these columns are read from disk, and Arrow-backed strings (string[pyarrow]) keep pointing to the mapped buffers instead of being copied.
+
+    --------------------
+    Parameters
+    --------------------
+    -> path (str): Path of the Feather file
+    -> columns (list): Names of the columns to be read. If None, all columns are read
+    -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES
+    -> nrows (int): Number of rows to be converted, from the first one. If None, all rows are converted
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Dataframe of the requested columns
+    -> (dict): Metadata of the file schema
+
+    """
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    if nrows is not None:
+        table = table.slice(0, nrows)
+    types_mapper = {pa.string(): pd.StringDtype('pyarrow')}.get if string_storage == 'pyarrow' else None
+    return table.to_pandas(split_blocks=True, types_mapper=types_mapper), table.schema.metadata or {}
+
+
+class DiskCache:
+    """
+    --------------------
+    Description
+    --------------------
+    -> DiskCache (class): Class that keeps the parsed datasets on disk as uncompressed Feather files named after the hash of the CSV content (and the loading settings), so the same file is parsed from CSV only once, across sessions and restarts.
+    Files are memory-mapped when read back. Files older than max_age are removed, then the least recently used ones until the total size is below max_bytes.
+
+    --------------------
+    Attributes
+    --------------------
+    -> directory (str): Directory of the Feather files (default set to DEFAULT_DISK_CACHE_DIR)
+    -> max_bytes (int): Maximum total size of the Feather files in bytes (default set to DEFAULT_DISK_BUDGET)
+    -> max_age (float): Maximum time in seconds since a file was last used (default set to DEFAULT_DISK_MAX_AGE)
+
+    """
+    def __init__(self, directory=DEFAULT_DISK_CACHE_DIR, max_bytes=DEFAULT_DISK_BUDGET, max_age=DEFAULT_DISK_MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def get_path(self, key):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_path (method): Class method that builds the path of the Feather file of a dataset
+
+        --------------------
+        Parameters
+        --------------------
+        -> key (str): Key of the dataset (hash of the CSV content and loading settings)
+
+        --------------------
+        Returns
+        --------------------
+        -> (str): Path of the Feather file
+
+        """
+        return os.path.join(self.directory, key + DISK_CACHE_SUFFIX)
+
+    def read(self, key, string_storage='python'):
+        """
+        --------------------
+        Description
+        --------------------
+        -> read (method): Class method that memory-maps the Feather file of a dataset if it is in the cache and marks it as the most recently used
+
+        --------------------
+        Parameters
+        --------------------
+        -> key (str): Key of the dataset
+        -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES
+
+        --------------------
+        Returns
+        --------------------
+        -> (pd.DataFrame): Cached dataframe, or None if the dataset isn't in the cache
+        -> (pd.Series): Data types of the columns as parsed from the CSV file, or None if they weren't stored
+
+        """
+        path = self.get_path(key)
+        if feather is None or not os.path.exists(path):
+            return None, None
+        try:
+            df, metadata = read_feather_columns(path, string_storage=string_storage)
+        except (OSError, pa.ArrowException):
+            # Unreadable file (e.g. written by another version): parse the CSV file again
+            return None, None
+        os.utime(path)
+        loaded_dtypes = None
+        if LOADED_DTYPES_METADATA in metadata:
+            loaded_dtypes = pd.Series([np.dtype(dtype) for dtype in json.loads(metadata[LOADED_DTYPES_METADATA])], index=df.columns)
+        return df, loaded_dtypes
+
+    def write(self, key, df, loaded_dtypes=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> write (method): Class method that writes a parsed dataset to the cache as an uncompressed Feather file, then evicts the files that are too old or exceed the size budget.
+        The file is written under a temporary name and renamed once complete, so readers never see a partial file. Dataframes that Arrow can't store (e.g. columns mixing text and numbers, duplicated column names) are not cached.
+
+        --------------------
+        Parameters
+        --------------------
+        -> key (str): Key of the dataset
+        -> df (pd.DataFrame): Parsed dataframe
+        -> loaded_dtypes (pd.Series): Data types of the columns as parsed from the CSV file, stored with the file (optional)
+
+        --------------------
+        Returns
+        --------------------
+        -> (str): Path of the Feather file, or None if the dataset couldn't be cached
+
+        """
+        if feather is None:
+            return None
+        path = self.get_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if loaded_dtypes is not None:
+                metadata = dict(table.schema.metadata or {})
+                metadata[LOADED_DTYPES_METADATA] = json.dumps([str(dtype) for dtype in loaded_dtypes])
+                table = table.replace_schema_metadata(metadata)
+            feather.write_feather(table, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, path)
+        except (OSError, ValueError, TypeError, pa.ArrowException):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> evict (method): Class method that removes the files not used for more than self.max_age seconds, then the least recently used files until their total size is below self.max_bytes
+
+        --------------------
+        Parameters
+        --------------------
+        -> keep (str): Path of a file that is never removed, e.g. the one just written (optional)
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): Paths of the removed files
+
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(DISK_CACHE_SUFFIX):
+                path = os.path.join(self.directory, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+        # From the least to the most recently used
+        entries.sort()
+
+        removed = []
+        now = time.time()
+        total_bytes = sum(size for _, size, _ in entries)
+        for last_used, size, path in entries:
+            if path == keep or (now - last_used <= self.max_age and total_bytes <= self.max_bytes):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                # Files still mapped by another process can't be removed on some systems
+                continue
+            total_bytes -= size
+            removed.append(path)
+        return removed
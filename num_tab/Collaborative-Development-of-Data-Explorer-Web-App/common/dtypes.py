@@ -0,0 +1,144 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common.text_kernels import get_string_memory
+
+# Maximum ratio of distinct values to non missing values for a text column to be encoded as category
+DEFAULT_CATEGORY_MAX_RATIO = 0.5
+
+# Number of evenly spaced values checked first to skip the high-cardinality text columns without factorizing them
+CATEGORY_SAMPLE_SIZE = 10000
+
+
+def downcast_numeric(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> downcast_numeric (function): Function that converts a numeric column to the smallest dtype holding all its values exactly: integers to the smallest signed (or unsigned if there are no negative values) width, floats to float32 only if no value changes.
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Numeric column
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Downcast column, or the same column if no smaller dtype is safe
+
+    """
+    if serie.dtype.kind in 'iu':
+        downcast = pd.to_numeric(serie, downcast='unsigned' if serie.dtype.kind == 'u' or serie.min() >= 0 else 'integer')
+        return downcast if downcast.dtype.itemsize < serie.dtype.itemsize else serie
+    if serie.dtype == 'float64':
+        values = serie.to_numpy()
+        downcast = values.astype('float32')
+        if np.array_equal(downcast.astype('float64'), values, equal_nan=True):
+            return pd.Series(downcast, index=serie.index, name=serie.name)
+    return serie
+
+
+def encode_categorical(serie, max_ratio=DEFAULT_CATEGORY_MAX_RATIO):
+    """
+    --------------------
+    Description
+    --------------------
+    -> encode_categorical (function): Function that encodes a text column as category when its number of distinct values is at most max_ratio times its number of non missing values.
+    The values are factorized once (pd.factorize) and the codes are reused to build the categorical column, so there is a single hash pass. Columns whose evenly spaced sample of CATEGORY_SAMPLE_SIZE values is already above max_ratio are skipped without being factorized. Columns mixing text with other types are kept as they are.
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Object column
+    -> max_ratio (float): Maximum ratio of distinct values to non missing values
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Categorical column, or the same column if it isn't a low-cardinality text column
+
+    """
+    if pd.api.types.infer_dtype(serie, skipna=True) != 'string':
+        return serie
+    if len(serie) > CATEGORY_SAMPLE_SIZE:
+        sample = serie.iloc[np.linspace(0, len(serie) - 1, num=CATEGORY_SAMPLE_SIZE).astype('int64')].dropna()
+        if sample.nunique() > max_ratio * len(sample):
+            return serie
+    codes, uniques = pd.factorize(serie, use_na_sentinel=True)
+    n_values = int(np.count_nonzero(codes >= 0))
+    if n_values == 0 or len(uniques) > max_ratio * n_values:
+        return serie
+    return pd.Series(pd.Categorical.from_codes(codes, categories=uniques), index=serie.index, name=serie.name)
+
+
+def optimize_dtypes(df, category_max_ratio=DEFAULT_CATEGORY_MAX_RATIO):
+    """
+    --------------------
+    Description
+    --------------------
+    -> optimize_dtypes (function): Function that reduces the memory used by a loaded dataframe: numeric columns are downcast to the smallest safe dtype (see downcast_numeric) and low-cardinality text columns are encoded as category (see encode_categorical). Other columns are kept as they are.
+    The dataframe is modified in place.
+
+    --------------------
+    Parameters
+    --------------------
+    -> df (pd.DataFrame): Loaded dataframe
+    -> category_max_ratio (float): Maximum ratio of distinct values to non missing values for a text column to be encoded as category
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Same dataframe with compact dtypes
+
+    """
+    for i, dtype in enumerate(df.dtypes):
+        serie = df.iloc[:, i]
+        if dtype.kind in 'iuf':
+            optimized = downcast_numeric(serie)
+        elif dtype == object:
+            optimized = encode_categorical(serie, max_ratio=category_max_ratio)
+        else:
+            continue
+        if optimized is not serie:
+            df.isetitem(i, optimized)
+    return df
+
+
+def get_loaded_memory(serie, loaded_dtype, deep=False):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_loaded_memory (function): Function that computes the memory a column used as parsed from the CSV file (with loaded_dtype) from its current compact version, without converting it back: downcast numbers take the width of loaded_dtype, categories count one pointer per value plus, in deep mode, the size of the str object of each value.
+    Columns stored as Arrow strings are measured as Python objects (see common.text_kernels.get_string_memory).
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Current column
+    -> loaded_dtype (np.dtype): Data type of the column as parsed from the CSV file
+    -> deep (bool): Flag stating if the size of the Python objects of object columns is counted
+
+    --------------------
+    Returns
+    --------------------
+    -> (int): Memory in bytes
+
+    """
+    if serie.dtype == loaded_dtype:
+        return int(serie.memory_usage(index=False, deep=deep))
+    if loaded_dtype != object:
+        return len(serie) * loaded_dtype.itemsize
+    if not deep:
+        return len(serie) * np.dtype(object).itemsize
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        # Each value points to the str object of its category (missing values to a float NaN)
+        codes = serie.cat.codes.to_numpy()
+        occurrences = np.bincount(codes[codes >= 0], minlength=len(serie.cat.categories))
+        sizes = np.fromiter((sys.getsizeof(category) for category in serie.cat.categories), dtype='int64', count=len(serie.cat.categories))
+        n_missing = int(np.count_nonzero(codes < 0))
+        return len(serie) * np.dtype(object).itemsize + int(np.dot(occurrences, sizes)) + n_missing * sys.getsizeof(np.nan)
+    return get_string_memory(serie)[0]
@@ -0,0 +1,257 @@
+import numpy as np
+import pandas as pd
+
+# Default number of most frequent values displayed
+DEFAULT_TOP_K = 20
+
+# Default number of counters kept by the heavy hitters summary (any value more frequent than n / (capacity + 1) is kept)
+DEFAULT_HEAVY_HITTERS_CAPACITY = 1000
+
+
+def select_top_k(counts, k=DEFAULT_TOP_K):
+    """
+    --------------------
+    Description
+    --------------------
+    -> select_top_k (function): Function that finds the positions of the k largest counts with a partial selection (np.argpartition) instead of sorting all of them, then sorts only these k positions by decreasing count. Ties keep their original order.
+
+    --------------------
+    Parameters
+    --------------------
+    -> counts (np.ndarray): Counts of each distinct value
+    -> k (int): Number of positions to be returned. If None, all positions are returned
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): Positions of the k largest counts, from the most to the least frequent
+
+    """
+    counts = np.asarray(counts)
+    if k is None or k >= counts.size:
+        positions = np.arange(counts.size)
+    elif k <= 0:
+        return np.empty(0, dtype='int64')
+    else:
+        positions = np.argpartition(-counts, k - 1)[:k]
+    return positions[np.lexsort((positions, -counts[positions]))]
+
+
+def factorize_values(values):
+    """
+    --------------------
+    Description
+    --------------------
+    -> factorize_values (function): Function that encodes each value as the integer position of its distinct value with a single hash pass (pd.factorize). Categorical values already hold their codes and are not hashed. Missing values get the code -1.
+
+    --------------------
+    Parameters
+    --------------------
+    -> values (pd.Series or array-like): Values to be encoded
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): Code of each value
+    -> (pd.Index): Distinct values, in order of first appearance (categories for categorical values)
+
+    """
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    return codes, pd.Index(uniques)
+
+
+def count_values(values):
+    """
+    --------------------
+    Description
+    --------------------
+    -> count_values (function): Function that counts the occurrences of each distinct value with a single hash pass and without sorting the counts. Text values are factorized (see factorize_values) and counted with np.bincount, which is faster than hashing them into a value_counts() table, categorical values count their codes directly, other data types use value_counts(sort=False). Missing values are not counted.
+
+    --------------------
+    Parameters
+    --------------------
+    -> values (pd.Series or array-like): Values to be counted
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Index): Distinct values
+    -> (np.ndarray): Number of occurrences of each distinct value
+
+    """
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    if isinstance(values.dtype, pd.CategoricalDtype) or values.dtype == object:
+        codes, uniques = factorize_values(values)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        # Drop the unused categories
+        used = counts > 0
+        return uniques[used], counts[used]
+    counts = values.value_counts(sort=False)
+    return counts.index, counts.to_numpy()
+
+
+def get_top_k(values, k=DEFAULT_TOP_K):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_top_k (function): Function that computes the exact k most frequent values of a serie without sorting all its distinct values
+
+    --------------------
+    Parameters
+    --------------------
+    -> values (pd.Series or array-like): Values to be analysed
+    -> k (int): Maximum number of values to be returned. If None, all distinct values are returned
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Dataframe with the columns value and occurrence, from the most to the least frequent value
+
+    """
+    uniques, counts = count_values(values)
+    return get_top_k_from_counts(uniques, counts, k)
+
+
+def get_top_k_from_counts(uniques, counts, k=DEFAULT_TOP_K):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_top_k_from_counts (function): Function that selects the k most frequent values from already counted distinct values (see select_top_k)
+
+    --------------------
+    Parameters
+    --------------------
+    -> uniques (pd.Index): Distinct values
+    -> counts (np.ndarray): Number of occurrences of each distinct value
+    -> k (int): Maximum number of values to be returned. If None, all distinct values are returned
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Dataframe with the columns value and occurrence, from the most to the least frequent value
+
+    """
+    positions = select_top_k(counts, k)
+    return pd.DataFrame({'value': uniques.take(positions), 'occurrence': counts[positions]})
+
+
+class HeavyHitters:
+    """
+    --------------------
+    Description
+    --------------------
+    -> HeavyHitters (class): Class that approximates the most frequent values of a stream with a mergeable Misra-Gries summary holding at most capacity counters.
+    Each chunk is counted exactly and added to the counters. When there are more counters than capacity, the (capacity + 1)-th largest count is subtracted from all of them and the counters that are not positive anymore are dropped.
+    Estimated counts are lower bounds: they are below the exact counts by at most max_error, which stays under n / (capacity + 1). Two summaries built on different chunks or workers can be merged.
+
+    --------------------
+    Attributes
+    --------------------
+    -> capacity (int): Maximum number of counters kept (default set to DEFAULT_HEAVY_HITTERS_CAPACITY)
+    -> counts (pd.Series): Estimated counts stored by value (default set to empty)
+    -> n (int): Number of rows seen by the summary, missing values included (default set to 0)
+    -> max_error (int): Maximum difference between the exact and the estimated count of any value (default set to 0)
+
+    """
+    def __init__(self, capacity=DEFAULT_HEAVY_HITTERS_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype='int64')
+        self.n = 0
+        self.max_error = 0
+
+    def update(self, serie):
+        """
+        --------------------
+        Description
+        --------------------
+        -> update (method): Class method that adds the values of a chunk to the summary
+
+        --------------------
+        Parameters
+        --------------------
+        -> serie (pd.Series): Chunk of a column
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        uniques, counts = count_values(serie)
+        self.n += len(serie)
+        self.merge_counts(pd.Series(counts, index=uniques, dtype='int64'))
+
+    def merge_counts(self, counts, max_error=0):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge_counts (method): Class method that adds counts to the counters and shrinks them back to self.capacity counters
+
+        --------------------
+        Parameters
+        --------------------
+        -> counts (pd.Series): Counts stored by value
+        -> max_error (int): Maximum error of the added counts (default set to 0)
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        combined = counts if self.counts.empty else self.counts.add(counts, fill_value=0).astype('int64')
+        self.max_error += max_error
+        if len(combined) > self.capacity:
+            values = combined.to_numpy()
+            threshold = int(np.partition(values, values.size - self.capacity - 1)[values.size - self.capacity - 1])
+            combined = combined[values > threshold] - threshold
+            self.max_error += threshold
+        self.counts = combined
+
+    def merge(self, other):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge (method): Class method that merges another summary into this one. The result summarises both streams.
+
+        --------------------
+        Parameters
+        --------------------
+        -> other (HeavyHitters): Summary to be merged
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.n += other.n
+        self.merge_counts(other.counts, other.max_error)
+
+    def get_top_k(self, k=DEFAULT_TOP_K):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_top_k (method): Class method that returns the k values with the largest estimated counts
+
+        --------------------
+        Parameters
+        --------------------
+        -> k (int): Maximum number of values to be returned. If None, all counters are returned
+
+        --------------------
+        Returns
+        --------------------
+        -> (pd.DataFrame): Dataframe with the columns value and occurrence (estimated), from the most to the least frequent value
+
+        """
+        positions = select_top_k(self.counts.to_numpy(), k)
+        return pd.DataFrame({'value': self.counts.index.take(positions), 'occurrence': self.counts.to_numpy()[positions]})
@@ -0,0 +1,172 @@
+import os
+import time
+
+import pandas as pd
+
+from common.streaming import SAMPLE_NROWS, rewind
+
+# pyarrow is installed with Streamlit but the pandas parser is used if it isn't available
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pcsv
+except ImportError:
+    pa = None
+    pc = None
+    pcsv = None
+
+# Engines parsing the CSV files: pyarrow splits the file in blocks parsed on all cores, pandas is the single-threaded C parser of pd.read_csv()
+CSV_ENGINES = ['pyarrow', 'pandas']
+
+# Default engine (the pandas parser is used whenever pyarrow can't read a file the same way)
+DEFAULT_CSV_ENGINE = 'pyarrow'
+
+# Size of the blocks parsed in parallel by pyarrow (in bytes), the data types are inferred from the first one
+CSV_BLOCK_SIZE = 4 * 1024 ** 2
+
+# Magnitude from which integers don't fit in int64: pyarrow reads them as float64, pandas as uint64 or text
+INT64_LIMIT = 2 ** 63
+
+# Values read as missing by pd.read_csv() by default
+PANDAS_NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+# Values read as booleans by pd.read_csv() by default
+PANDAS_TRUE_VALUES = ['True', 'TRUE', 'true']
+PANDAS_FALSE_VALUES = ['False', 'FALSE', 'false']
+
+
+def get_file_size(file):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_file_size (function): Function that finds the size of a CSV file without reading it
+
+    --------------------
+    Parameters
+    --------------------
+    -> file (str or file-like): File path or uploaded file
+
+    --------------------
+    Returns
+    --------------------
+    -> (int): Size of the file in bytes
+
+    """
+    if not hasattr(file, 'seek'):
+        return os.path.getsize(file)
+    file.seek(0, os.SEEK_END)
+    n_bytes = file.tell()
+    file.seek(0)
+    return n_bytes
+
+
+def read_csv_pyarrow(file, usecols=None, string_storage='python'):
+    """
+    --------------------
+    Description
+    --------------------
+    -> read_csv_pyarrow (function): Function that parses a CSV file with the multithreaded pyarrow CSV reader and converts it to a dataframe with the same columns and dtypes as pd.read_csv() would give.
+    The options follow the pandas defaults (missing and boolean values, missing text values, all-missing columns read as float64). Columns that pyarrow would read as dates or times are kept as text, as pandas does, by inferring the types from the first block before parsing the whole file.
+    Integers outside the int64 range are read as float64 by pyarrow (losing precision) while pandas reads them as uint64 or text: a ValueError is raised for floating point columns holding such magnitudes so the file is parsed by pandas instead.
+    Integers written with a sign (e.g. +1) are also read as float64 by pyarrow but as int64 by pandas: floating point columns holding only integers and no missing values are compared with the dtypes pandas gives to the first rows, and a ValueError is raised when pandas reads them as integers.
+    A file without rows gives object columns, like pandas.
+
+    --------------------
+    Parameters
+    --------------------
+    -> file (str or file-like): File path or uploaded file
+    -> usecols (list): Names of the columns to be read. If None, all columns are read
+    -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES. With 'pyarrow' the text columns keep the parsed Arrow buffers instead of being converted to Python objects
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Parsed dataframe
+
+    """
+    read_options = pcsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    convert_options = {
+        'null_values': PANDAS_NA_VALUES,
+        'strings_can_be_null': True,
+        'true_values': PANDAS_TRUE_VALUES,
+        'false_values': PANDAS_FALSE_VALUES,
+    }
+    rewind(file)
+    reader = pcsv.open_csv(file, read_options=read_options, convert_options=pcsv.ConvertOptions(**convert_options))
+    schema = reader.schema
+    reader.close()
+    if len(set(schema.names)) != len(schema.names) or '' in schema.names:
+        raise ValueError("duplicated or empty column names are renamed by pandas only")
+
+    rewind(file)
+    column_types = {field.name: pa.string() for field in schema if pa.types.is_temporal(field.type)}
+    table = pcsv.read_csv(file, read_options=read_options, convert_options=pcsv.ConvertOptions(column_types=column_types, include_columns=usecols, **convert_options))
+    rewind(file)
+    if table.num_rows == 0:
+        return pd.DataFrame({name: pd.Series(dtype='object') for name in table.column_names})
+
+    integral_cols = []
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            # Columns without any value are read as float64 by pandas
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+        elif pa.types.is_floating(field.type):
+            bounds = pc.min_max(table.column(i))
+            if any(bound.as_py() is not None and abs(bound.as_py()) >= INT64_LIMIT for bound in bounds.values()):
+                raise ValueError(f"column {field.name} holds integers outside the int64 range, read as uint64 or text by pandas only")
+            if table.column(i).null_count == 0 and pc.all(pc.equal(table.column(i), pc.floor(table.column(i)))).as_py():
+                integral_cols.append(field.name)
+    if integral_cols:
+        sample = pd.read_csv(file, usecols=integral_cols, nrows=SAMPLE_NROWS)
+        rewind(file)
+        for col_name in integral_cols:
+            if sample[col_name].dtype.kind in 'iu':
+                raise ValueError(f"column {col_name} holds integers read as float64 by pyarrow but as integers by pandas")
+    types_mapper = {pa.string(): pd.StringDtype('pyarrow')}.get if string_storage == 'pyarrow' else None
+    return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=types_mapper)
+
+
+def ingest_csv(file, engine=DEFAULT_CSV_ENGINE, usecols=None, string_storage='python'):
+    """
+    --------------------
+    Description
+    --------------------
+    -> ingest_csv (function): Function that parses a CSV file with the requested engine, one of CSV_ENGINES, and measures the parsing throughput.
+    The pyarrow engine falls back automatically to the pandas parser when pyarrow isn't installed or can't read the file the same way (e.g. a column whose type changes after the first block, quoted values containing newlines, duplicated column names, integers outside the int64 range).
+
+    --------------------
+    Parameters
+    --------------------
+    -> file (str or file-like): File path or uploaded file
+    -> engine (str): Engine to be used, one of CSV_ENGINES
+    -> usecols (list): Names of the columns to be read. If None, all columns are read
+    -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES. Only used by the pyarrow engine, the pandas parser always returns Python objects
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Parsed dataframe
+    -> (dict): Engine used (engine), number of threads (n_threads), size of the file in bytes (n_bytes), parsing time in seconds (seconds), throughput in MB/s (throughput) and reason of the fallback to the pandas parser if any (fallback)
+
+    """
+    details = {'engine': 'pandas', 'n_threads': 1, 'n_bytes': get_file_size(file), 'fallback': None}
+    start = time.perf_counter()
+    df = None
+    if engine == 'pyarrow':
+        if pcsv is None:
+            details['fallback'] = "pyarrow isn't installed"
+        else:
+            try:
+                df = read_csv_pyarrow(file, usecols=usecols, string_storage=string_storage)
+                details['engine'] = 'pyarrow'
+                details['n_threads'] = pa.cpu_count()
+            except (pa.ArrowException, ValueError) as error:
+                details['fallback'] = str(error).splitlines()[0]
+    if df is None:
+        rewind(file)
+        df = pd.read_csv(file, usecols=usecols)
+        rewind(file)
+    details['seconds'] = time.perf_counter() - start
+    details['throughput'] = details['n_bytes'] / 1024 ** 2 / details['seconds'] if details['seconds'] > 0 else None
+    return df, details
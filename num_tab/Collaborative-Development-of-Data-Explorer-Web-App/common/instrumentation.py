@@ -0,0 +1,203 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Prefixes of the methods timed by the instrument() class decorator
+INSTRUMENTED_PREFIXES = ('set_', 'get_', 'find_', 'convert_')
+
+# Maximum number of records kept by each instrumented instance (the oldest ones are dropped)
+MAX_RECORDS = 500
+
+# Logger receiving every record as a JSON message, for log collection or metrics (see the CSV_EXPLORER_METRICS_FILE setting of the app)
+logger = logging.getLogger('csv_explorer.performance')
+
+# Stages are recorded unless CSV_EXPLORER_INSTRUMENTATION is set to 0
+ENABLED = os.environ.get('CSV_EXPLORER_INSTRUMENTATION', '1') != '0'
+
+# Stages being recorded by the current thread, to attribute the memory allocated by nested stages to their callers
+_local = threading.local()
+
+
+def get_n_rows(owner):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_n_rows (function): Function that finds the number of rows processed by an instance of a logic class: the length of its serie if it has one, otherwise of its dataframe
+
+    --------------------
+    Parameters
+    --------------------
+    -> owner (object): Instance of a logic class (NumericColumn, TextColumn, DateColumn, Dataset)
+
+    --------------------
+    Returns
+    --------------------
+    -> (int): Number of rows, or None if nothing is loaded
+
+    """
+    serie = getattr(owner, 'serie', None)
+    if isinstance(serie, pd.Series) and len(serie):
+        return len(serie)
+    df = getattr(owner, 'df', None)
+    if isinstance(df, pd.DataFrame):
+        return len(df)
+    return None
+
+
+@contextmanager
+def record_stage(owner, stage):
+    """
+    --------------------
+    Description
+    --------------------
+    -> record_stage (function): Context manager that records the wall time of a stage, the number of rows processed (see get_n_rows) and, when tracemalloc is tracing, the peak memory allocated during the stage.
+    The record is appended to the performance attribute of owner (created the first time) and sent to the csv_explorer.performance logger as JSON. Stages run inside another one are recorded with a greater depth.
+    Memory is traced for the whole process, so allocations of other Streamlit sessions running at the same time are counted too.
+
+    --------------------
+    Parameters
+    --------------------
+    -> owner (object): Instance the stage is recorded for
+    -> stage (str): Name of the stage, e.g. NumericColumn.set_histogram or streamlit.render
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    if not ENABLED:
+        yield
+        return
+
+    stack = _local.__dict__.setdefault('stack', [])
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if stack and stack[-1]:
+            # Keep the peak reached so far by the caller before resetting it for this stage
+            stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+        tracemalloc.reset_peak()
+        frame = {'start': current, 'peak': current}
+    else:
+        frame = {}
+    stack.append(frame)
+    timestamp = time.time()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        stack.pop()
+        allocated_bytes = None
+        if tracing and tracemalloc.is_tracing():
+            frame_peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+            allocated_bytes = frame_peak - frame['start']
+            if stack and stack[-1]:
+                stack[-1]['peak'] = max(stack[-1]['peak'], frame_peak)
+        record = {
+            'stage': stage,
+            'seconds': seconds,
+            'rows': get_n_rows(owner),
+            'allocated_bytes': allocated_bytes,
+            'depth': len(stack),
+            'timestamp': timestamp,
+        }
+        records = owner.__dict__.get('performance')
+        if records is None:
+            records = owner.__dict__['performance'] = deque(maxlen=MAX_RECORDS)
+        records.append(record)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps(record))
+
+
+def instrument(cls):
+    """
+    --------------------
+    Description
+    --------------------
+    -> instrument (function): Class decorator that records every call of the methods whose name starts with one of INSTRUMENTED_PREFIXES with record_stage(), under the name ClassName.method_name.
+    The records of an instance are stored in its performance attribute (a deque of at most MAX_RECORDS dicts, created by the first call).
+
+    --------------------
+    Parameters
+    --------------------
+    -> cls (class): Logic class to be instrumented
+
+    --------------------
+    Returns
+    --------------------
+    -> (class): Same class with its methods wrapped
+
+    """
+    for name, method in list(vars(cls).items()):
+        if callable(method) and name.startswith(INSTRUMENTED_PREFIXES):
+            setattr(cls, name, instrument_method(method, f'{cls.__name__}.{name}'))
+    return cls
+
+
+def instrument_method(method, stage):
+    """
+    --------------------
+    Description
+    --------------------
+    -> instrument_method (function): Function that wraps a method so each of its calls is recorded with record_stage()
+
+    --------------------
+    Parameters
+    --------------------
+    -> method (callable): Method to be wrapped
+    -> stage (str): Name of the stage
+
+    --------------------
+    Returns
+    --------------------
+    -> (callable): Wrapped method
+
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with record_stage(self, stage):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def get_performance_table(owner, last=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_performance_table (function): Function that formats the records of an instrumented instance as a Pandas dataframe with 4 columns: Stage (indented by depth), Seconds, Rows and Allocated MB, in the order the stages started
+
+    --------------------
+    Parameters
+    --------------------
+    -> owner (object): Instrumented instance
+    -> last (int): Number of most recent records to be formatted. If None, all records are formatted
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Formatted dataframe to be displayed on the Streamlit app
+
+    """
+    records = list(owner.__dict__.get('performance', []))
+    if last is not None:
+        records = records[-last:]
+    # Records are appended when their stage ends: sort them by start so each stage comes before the stages it ran
+    records = sorted(records, key=lambda record: record['timestamp'])
+    return pd.DataFrame({
+        'Stage': ['· ' * record['depth'] + record['stage'] for record in records],
+        'Seconds': [round(record['seconds'], 4) for record in records],
+        'Rows': [str(record['rows']) if record['rows'] is not None else '' for record in records],
+        'Allocated MB': [f"{record['allocated_bytes'] / 1024 ** 2:.1f}" if record['allocated_bytes'] is not None else '' for record in records],
+    })
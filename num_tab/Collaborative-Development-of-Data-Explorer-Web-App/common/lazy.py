@@ -0,0 +1,171 @@
+import pandas as pd
+
+from common.disk_cache import read_feather_columns
+from common.dtypes import optimize_dtypes
+from common.ingest import ingest_csv, DEFAULT_CSV_ENGINE
+from common.streaming import SAMPLE_NROWS, read_csv_sample
+from common.text_kernels import convert_text_columns
+
+# Maximum number of values read to guess the data types of the columns (fewer rows are read for wide files)
+SAMPLE_MAX_CELLS = 1_000_000
+
+# Minimum number of rows read to guess the data types of the columns
+SAMPLE_MIN_NROWS = 100
+
+
+class LazyDataset:
+    """
+    --------------------
+    Description
+    --------------------
+    -> LazyDataset (class): Class that stands for a dataframe which is never loaded as a whole. The columns and their data types are guessed from the first rows of the CSV file (or read from the schema of its Feather file in the disk cache) to fill the select boxes of the tabs,
+    then only the columns actually requested with lazy_dataset[col_name] are read from the file (usecols) or from the memory-mapped Feather file. Only the last columns read are kept in memory.
+    It provides the parts of the pd.DataFrame interface used by the logic classes (columns, dtypes, select_dtypes() and []), so it can be passed as their df.
+
+    --------------------
+    Attributes
+    --------------------
+    -> file_path (str or file-like): File path or uploaded file (Streamlit UploadedFile)
+    -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES (default set to 'python')
+    -> compact_dtypes (bool): Flag stating if numeric columns are downcast and low-cardinality text columns encoded as category (default set to False)
+    -> disk_path (str): Path of the Feather file of the dataset in the disk cache, read instead of the CSV file (default set to None)
+    -> csv_engine (str): Engine parsing the columns read from the CSV file, one of common.ingest.CSV_ENGINES (default set to DEFAULT_CSV_ENGINE)
+    -> sample_nrows (int): Maximum number of rows read to guess the data types of the columns, lowered to fit SAMPLE_MAX_CELLS values for wide files (default set to SAMPLE_NROWS)
+    -> sample (pd.DataFrame): First rows of the dataset (default set to None until self.set_sample() is called)
+    -> columns (pd.Index): Names of the columns of the dataset (default set to empty until self.set_sample() is called)
+    -> dtypes (pd.Series): Data types of the columns guessed from self.sample (default set to empty until self.set_sample() is called)
+    -> loaded (pd.DataFrame): Last columns read from the file (default set to empty dataframe)
+    -> n_reads (int): Number of times columns were read from the file (default set to 0)
+    -> ingestion (dict): Engine used, parsing time and throughput of the last columns read from the CSV file, as returned by common.ingest.ingest_csv() (default set to None)
+
+    """
+    def __init__(self, file_path, string_storage='python', compact_dtypes=False, disk_path=None, sample_nrows=SAMPLE_NROWS, csv_engine=DEFAULT_CSV_ENGINE):
+        self.file_path = file_path
+        self.string_storage = string_storage
+        self.compact_dtypes = compact_dtypes
+        self.disk_path = disk_path
+        self.sample_nrows = sample_nrows
+        self.csv_engine = csv_engine
+        self.sample = None
+        self.columns = pd.Index([])
+        self.dtypes = pd.Series(dtype='object')
+        self.loaded = pd.DataFrame()
+        self.n_reads = 0
+        self.ingestion = None
+        self.set_sample()
+
+    def set_sample(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_sample (method): Class method that reads the first rows of the dataset and stores them with the columns and their data types in the relevant attributes (self.sample, self.columns, self.dtypes). With a Feather file, they come with the data types of the whole columns.
+        The header of the CSV file is read first so that no more than SAMPLE_MAX_CELLS values are parsed, whatever the number of columns.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.disk_path is not None:
+            self.sample, _ = read_feather_columns(self.disk_path, string_storage=self.string_storage, nrows=self.sample_nrows)
+        else:
+            n_cols = len(read_csv_sample(self.file_path, nrows=0).columns)
+            self.sample = read_csv_sample(self.file_path, nrows=min(self.sample_nrows, max(SAMPLE_MIN_NROWS, SAMPLE_MAX_CELLS // max(n_cols, 1))))
+        self.columns = self.sample.columns
+        self.dtypes = self.sample.dtypes
+
+    def select_dtypes(self, include=None, exclude=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> select_dtypes (method): Class method that selects the columns matching the provided data types, like pd.DataFrame.select_dtypes(), from the rows of self.sample
+
+        --------------------
+        Parameters
+        --------------------
+        -> include (list or str): Data types to be included (optional)
+        -> exclude (list or str): Data types to be excluded (optional)
+
+        --------------------
+        Returns
+        --------------------
+        -> (pd.DataFrame): Rows of self.sample for the selected columns
+
+        """
+        return self.sample.select_dtypes(include=include, exclude=exclude)
+
+    def read_columns(self, cols_list):
+        """
+        --------------------
+        Description
+        --------------------
+        -> read_columns (method): Class method that reads the provided columns from the Feather file of the disk cache if any, otherwise from the CSV file by self.csv_engine with only these columns converted (usecols).
+        The columns read from the CSV file are given the same dtypes as a dataset loaded as a whole with the same settings (compact dtypes, then Arrow-backed strings).
+        A column guessed as numeric from the first rows but holding text further down is read as text: its rows of self.sample and its dtype in self.dtypes are replaced so it is listed with the text columns from then on.
+
+        --------------------
+        Parameters
+        --------------------
+        -> cols_list (list): Names of the columns to be read
+
+        --------------------
+        Returns
+        --------------------
+        -> (pd.DataFrame): Dataframe of the provided columns
+
+        """
+        self.n_reads += 1
+        if self.disk_path is not None:
+            df, _ = read_feather_columns(self.disk_path, columns=cols_list, string_storage=self.string_storage)
+            return df
+
+        df, self.ingestion = ingest_csv(self.file_path, engine=self.csv_engine, usecols=cols_list, string_storage='python' if self.compact_dtypes else self.string_storage)
+        if self.compact_dtypes:
+            optimize_dtypes(df)
+        if self.string_storage == 'pyarrow':
+            convert_text_columns(df)
+        df = df[cols_list]
+        for col_name in cols_list:
+            if pd.api.types.is_numeric_dtype(self.dtypes[col_name]) and not pd.api.types.is_numeric_dtype(df[col_name].dtype):
+                self.sample[col_name] = df[col_name].iloc[:len(self.sample)].to_numpy()
+        self.dtypes = self.sample.dtypes
+        return df
+
+    def __contains__(self, col_name):
+        return col_name in self.columns
+
+    def __getitem__(self, key):
+        """
+        --------------------
+        Description
+        --------------------
+        -> __getitem__ (method): Class method that returns a column (or a dataframe for a list of columns) like pd.DataFrame[key]. Columns that haven't been read with the previous request are read with self.read_columns() and replace them in self.loaded.
+
+        --------------------
+        Parameters
+        --------------------
+        -> key (str or list): Name of the column, or names of the columns
+
+        --------------------
+        Returns
+        --------------------
+        -> (pd.Series or pd.DataFrame): Requested column(s)
+
+        """
+        cols_list = list(key) if isinstance(key, (list, pd.Index)) else [key]
+        for col_name in cols_list:
+            if col_name not in self.columns:
+                raise KeyError(col_name)
+        if any(col_name not in self.loaded.columns for col_name in cols_list):
+            # Drop the previous columns first so only the requested ones are in memory
+            self.loaded = pd.DataFrame()
+            self.loaded = self.read_columns(cols_list)
+        return self.loaded[key]
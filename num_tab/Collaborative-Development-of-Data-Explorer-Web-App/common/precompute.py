@@ -0,0 +1,250 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from tab_num.logics import NumericColumn
+from tab_text.logics import TextColumn
+from tab_date.logics import DateColumn
+from common.disk_cache import read_feather_columns
+from common.lazy import LazyDataset
+
+# Logic class used to profile each kind of column
+COLUMN_CLASSES = {'num': NumericColumn, 'text': TextColumn, 'date': DateColumn}
+
+# Default number of worker processes of the pool
+DEFAULT_MAX_WORKERS = os.cpu_count() or 1
+
+# Default number of columns profiled by a single task (smaller slices make results available sooner)
+DEFAULT_COLUMNS_PER_TASK = 4
+
+
+def profile_columns(kind, cols_list, df=None, file_path=None, chunksize=None, disk_path=None, string_storage='python', compact_dtypes=False, distinct_mode='exact'):
+    """
+    --------------------
+    Description
+    --------------------
+    -> profile_columns (function): Function run by the worker processes that computes the profiles of a slice of columns of the same kind with the relevant logic class (see COLUMN_CLASSES).
+    Columns that can't be profiled (e.g. a text column that can't be converted to datetime) are skipped.
+    With disk_path, only the pages of these columns are read from the memory-mapped Feather file of the disk cache. With only file_path (outside streaming mode), only these columns are parsed from the CSV file by a common.lazy.LazyDataset, which applies string_storage and compact_dtypes to them.
+
+    --------------------
+    Parameters
+    --------------------
+    -> kind (str): Kind of the columns, one of common.profile_store.COLUMN_KINDS
+    -> cols_list (list): Names of the columns to be profiled
+    -> df (pd.DataFrame): Dataframe containing at least the columns to be profiled (optional)
+    -> file_path (str): Path to the CSV file, used when df is not provided (optional)
+    -> chunksize (int): Number of rows per chunk in streaming mode (optional)
+    -> disk_path (str): Path of the Feather file of the dataset in the disk cache, used instead of df (optional)
+    -> string_storage (str): Storage of the text columns read from disk_path or file_path, one of tab_df.logics.STRING_STORAGES
+    -> compact_dtypes (bool): Flag stating if the columns read from file_path are compacted (see common.dtypes.optimize_dtypes) (default set to False)
+    -> distinct_mode (str): Way of counting the unique values, one of common.sketches.DISTINCT_MODES
+
+    --------------------
+    Returns
+    --------------------
+    -> (list): List of common.profile_store.ColumnProfile
+
+    """
+    if disk_path is not None:
+        df, _ = read_feather_columns(disk_path, columns=list(cols_list), string_storage=string_storage)
+    elif df is None and chunksize is None:
+        df = LazyDataset(file_path, string_storage=string_storage, compact_dtypes=compact_dtypes)[list(cols_list)]
+    column = COLUMN_CLASSES[kind](file_path=file_path, df=df, chunksize=chunksize, distinct_mode=distinct_mode)
+    column.cols_list = list(cols_list)
+    profiles = []
+    for col_name in cols_list:
+        try:
+            profiles.append(column.get_profile(col_name))
+        except ValueError:
+            continue
+    return profiles
+
+
+def find_columns_by_kind(file_path=None, df=None, chunksize=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> find_columns_by_kind (function): Function that finds the columns of each kind with the find_*_cols() method of the relevant logic class
+
+    --------------------
+    Parameters
+    --------------------
+    -> file_path (str): File path to uploaded CSV file (optional)
+    -> df (pd.DataFrame): Loaded dataframe (optional)
+    -> chunksize (int): Number of rows per chunk in streaming mode (optional)
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Lists of columns names stored by kind of column
+
+    """
+    num_column = NumericColumn(file_path=file_path, df=df, chunksize=chunksize)
+    num_column.find_num_cols()
+    text_column = TextColumn(file_path=file_path, df=df, chunksize=chunksize)
+    text_column.find_text_cols()
+    date_column = DateColumn(file_path=file_path, df=df, chunksize=chunksize)
+    date_column.find_date_cols()
+    return {'num': num_column.cols_list, 'text': text_column.cols_list, 'date': date_column.cols_list}
+
+
+class ProfilePrecomputer:
+    """
+    --------------------
+    Description
+    --------------------
+    -> ProfilePrecomputer (class): Class that profiles every column of a dataset in the background on a pool of worker processes, each task handling a slice of columns of the same kind.
+    Finished profiles are moved to a common.profile_store.ProfileStore by collect(), so the tabs display them without any computation. Starting a new dataset cancels the tasks of the previous one.
+    Worker processes only receive the columns they profile (or the path of the CSV file in streaming mode), so an uploaded file can only be precomputed once loaded in memory. When the dataset is in the disk cache, they receive the path of its Feather file and read their columns from it instead of having them pickled.
+
+    --------------------
+    Attributes
+    --------------------
+    -> max_workers (int): Number of worker processes (default set to DEFAULT_MAX_WORKERS)
+    -> columns_per_task (int): Maximum number of columns profiled by a single task (default set to DEFAULT_COLUMNS_PER_TASK)
+    -> executor (ProcessPoolExecutor): Pool of worker processes (default set to None)
+    -> futures (dict): Pending tasks stored with the kind and names of their columns (default set to empty dict)
+    -> dataset_key (str): Hash of the dataset being profiled (default set to None)
+    -> n_columns (int): Number of columns scheduled for the current dataset (default set to 0)
+    -> n_done (int): Number of columns of the current dataset whose task has finished (default set to 0)
+    -> errors (list): Messages of the tasks that failed for the current dataset (default set to empty list)
+
+    """
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, columns_per_task=DEFAULT_COLUMNS_PER_TASK):
+        self.max_workers = max_workers
+        self.columns_per_task = columns_per_task
+        self.executor = None
+        self.futures = {}
+        self.dataset_key = None
+        self.n_columns = 0
+        self.n_done = 0
+        self.errors = []
+
+    def start(self, dataset_key, cols_by_kind, df=None, file_path=None, chunksize=None, disk_path=None, string_storage='python', compact_dtypes=False, distinct_mode='exact'):
+        """
+        --------------------
+        Description
+        --------------------
+        -> start (method): Class method that cancels the tasks of the previous dataset and schedules the profiling of the provided columns on the pool of worker processes, by slices of self.columns_per_task columns.
+        Nothing is scheduled if the dataset is neither loaded (df) nor readable from a path (file_path as str).
+
+        --------------------
+        Parameters
+        --------------------
+        -> dataset_key (str): Hash of the dataset
+        -> cols_by_kind (dict): Lists of columns names stored by kind of column
+        -> df (pd.DataFrame): Loaded dataframe (optional)
+        -> file_path (str): Path to the CSV file (optional)
+        -> chunksize (int): Number of rows per chunk in streaming mode (optional)
+        -> disk_path (str): Path of the Feather file of the dataset in the disk cache (optional)
+        -> string_storage (str): Storage of the text columns, one of tab_df.logics.STRING_STORAGES
+        -> compact_dtypes (bool): Flag stating if the columns read from file_path are compacted like the dataset loaded by the session (default set to False)
+        -> distinct_mode (str): Way of counting the unique values, one of common.sketches.DISTINCT_MODES
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Number of tasks scheduled
+
+        """
+        self.cancel()
+        self.dataset_key = dataset_key
+        if df is None and not isinstance(file_path, str):
+            return 0
+
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        for kind, cols_list in cols_by_kind.items():
+            for start in range(0, len(cols_list), self.columns_per_task):
+                cols_slice = list(cols_list[start:start + self.columns_per_task])
+                if df is not None and disk_path is not None:
+                    future = self.executor.submit(profile_columns, kind, cols_slice, disk_path=disk_path, string_storage=string_storage, distinct_mode=distinct_mode)
+                elif df is not None:
+                    future = self.executor.submit(profile_columns, kind, cols_slice, df=df[cols_slice], chunksize=chunksize, distinct_mode=distinct_mode)
+                else:
+                    future = self.executor.submit(profile_columns, kind, cols_slice, file_path=file_path, chunksize=chunksize, string_storage=string_storage, compact_dtypes=compact_dtypes, distinct_mode=distinct_mode)
+                self.futures[future] = (kind, cols_slice)
+                self.n_columns += len(cols_slice)
+        return len(self.futures)
+
+    def collect(self, profile_store):
+        """
+        --------------------
+        Description
+        --------------------
+        -> collect (method): Class method that moves the profiles of the finished tasks to the profile store. Profiles already computed by a tab are kept.
+
+        --------------------
+        Parameters
+        --------------------
+        -> profile_store (ProfileStore): Store shared by the tabs
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Number of profiles added to the store
+
+        """
+        n_added = 0
+        for future in [future for future in self.futures if future.done()]:
+            kind, cols_slice = self.futures.pop(future)
+            self.n_done += len(cols_slice)
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                self.errors.append(f"Failed to profile {', '.join(map(str, cols_slice))}: {future.exception()}")
+                continue
+            for profile in future.result():
+                if profile_store.get(self.dataset_key, profile.col_name, profile.kind) is None:
+                    profile_store.put(self.dataset_key, profile)
+                    n_added += 1
+        return n_added
+
+    def is_running(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> is_running (method): Class method that checks if some tasks haven't been collected yet
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (bool): Flag stating if the precomputation is still running
+
+        """
+        return bool(self.futures)
+
+    def cancel(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> cancel (method): Class method that cancels the pending tasks and shuts the pool down without waiting. Tasks already running finish in their worker process but their results are discarded.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        for future in self.futures:
+            future.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = None
+        self.futures = {}
+        self.dataset_key = None
+        self.n_columns = 0
+        self.n_done = 0
+        self.errors = []
@@ -0,0 +1,183 @@
+from collections import OrderedDict
+
+# Column kinds handled by the tabs
+COLUMN_KINDS = ['num', 'text', 'date']
+
+# Default maximum number of column profiles kept in the store
+DEFAULT_MAX_PROFILES = 256
+
+
+class ColumnProfile:
+    """
+    --------------------
+    Description
+    --------------------
+    -> ColumnProfile (class): Class that holds everything displayed for a column in its tab, so it can be displayed again without any computation
+
+    --------------------
+    Attributes
+    --------------------
+    -> kind (str): Kind of column, one of COLUMN_KINDS
+    -> col_name (str): Name of the column
+    -> summary (list or pd.DataFrame): Results of the get_summary() method of the logic class
+    -> frequent (pd.DataFrame): Dataframe containing the most frequent values of the column
+    -> charts (dict): Altair charts built from aggregated data, stored by variant (e.g. binning method) (default set to empty dict)
+    -> details (dict): Other information displayed in the tab (default set to empty dict)
+
+    """
+    def __init__(self, kind, col_name, summary, frequent, charts=None, details=None):
+        self.kind = kind
+        self.col_name = col_name
+        self.summary = summary
+        self.frequent = frequent
+        self.charts = {} if charts is None else charts
+        self.details = {} if details is None else details
+
+
+class ProfileStore:
+    """
+    --------------------
+    Description
+    --------------------
+    -> ProfileStore (class): Class that stores the column profiles computed by all tabs, keyed by (dataset hash, column name, column kind), and the lists of columns of each kind found in each dataset.
+    When the number of profiles exceeds max_profiles, the least recently used ones are evicted. Profiles can also be invalidated explicitly (e.g. when their dataset is evicted from the dataset cache).
+
+    --------------------
+    Attributes
+    --------------------
+    -> max_profiles (int): Maximum number of column profiles kept (default set to DEFAULT_MAX_PROFILES)
+    -> profiles (OrderedDict): Column profiles stored by key, from least to most recently used (default set to empty)
+    -> columns (dict): Lists of columns names stored by (dataset hash, column kind) (default set to empty dict)
+
+    """
+    def __init__(self, max_profiles=DEFAULT_MAX_PROFILES):
+        self.max_profiles = max_profiles
+        self.profiles = OrderedDict()
+        self.columns = {}
+
+    def get(self, dataset_key, col_name, kind):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get (method): Class method that returns the stored profile of a column and marks it as the most recently used
+
+        --------------------
+        Parameters
+        --------------------
+        -> dataset_key (str): Hash of the dataset
+        -> col_name (str): Name of the column
+        -> kind (str): Kind of column, one of COLUMN_KINDS
+
+        --------------------
+        Returns
+        --------------------
+        -> (ColumnProfile): Stored profile or None if it hasn't been computed
+
+        """
+        key = (dataset_key, col_name, kind)
+        if key not in self.profiles:
+            return None
+        self.profiles.move_to_end(key)
+        return self.profiles[key]
+
+    def put(self, dataset_key, profile):
+        """
+        --------------------
+        Description
+        --------------------
+        -> put (method): Class method that stores the profile of a column and evicts the least recently used profiles above max_profiles
+
+        --------------------
+        Parameters
+        --------------------
+        -> dataset_key (str): Hash of the dataset
+        -> profile (ColumnProfile): Profile to be stored
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        key = (dataset_key, profile.col_name, profile.kind)
+        self.profiles[key] = profile
+        self.profiles.move_to_end(key)
+        while len(self.profiles) > self.max_profiles:
+            self.profiles.popitem(last=False)
+
+    def get_columns(self, dataset_key, kind):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_columns (method): Class method that returns the stored list of columns of a kind found in a dataset
+
+        --------------------
+        Parameters
+        --------------------
+        -> dataset_key (str): Hash of the dataset
+        -> kind (str): Kind of column, one of COLUMN_KINDS
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): List of columns names or None if it hasn't been stored
+
+        """
+        return self.columns.get((dataset_key, kind))
+
+    def put_columns(self, dataset_key, kind, cols_list):
+        """
+        --------------------
+        Description
+        --------------------
+        -> put_columns (method): Class method that stores the list of columns of a kind found in a dataset
+
+        --------------------
+        Parameters
+        --------------------
+        -> dataset_key (str): Hash of the dataset
+        -> kind (str): Kind of column, one of COLUMN_KINDS
+        -> cols_list (list): List of columns names
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.columns[(dataset_key, kind)] = list(cols_list)
+
+    def invalidate(self, dataset_key=None, col_name=None, kind=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> invalidate (method): Class method that removes the stored profiles (and lists of columns) matching all the provided filters. Without any filter the whole store is cleared.
+
+        --------------------
+        Parameters
+        --------------------
+        -> dataset_key (str): Hash of the dataset (optional)
+        -> col_name (str): Name of the column (optional)
+        -> kind (str): Kind of column (optional)
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Number of profiles removed
+
+        """
+        removed = [
+            key for key in self.profiles
+            if (dataset_key is None or key[0] == dataset_key)
+            and (col_name is None or key[1] == col_name)
+            and (kind is None or key[2] == kind)
+        ]
+        for key in removed:
+            del self.profiles[key]
+        if col_name is None:
+            for key in [key for key in self.columns if (dataset_key is None or key[0] == dataset_key) and (kind is None or key[1] == kind)]:
+                del self.columns[key]
+        return len(removed)
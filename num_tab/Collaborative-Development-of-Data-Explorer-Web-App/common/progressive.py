@@ -0,0 +1,365 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+# Columns with fewer rows than this are profiled exactly at once, even in progressive mode
+PROGRESSIVE_MIN_ROWS = 200_000
+
+# Number of rows of the uniform random sample profiled first in progressive mode
+PROGRESSIVE_SAMPLE_SIZE = 50_000
+
+# Seed of the random sample, so the same column always gives the same first profile
+PROGRESSIVE_SEED = 0
+
+# Quantile of the standard normal distribution used for the 95% confidence intervals
+CONFIDENCE_Z = 1.96
+
+# Number of threads refining the profiles on all rows
+DEFAULT_REFINE_WORKERS = 1
+
+
+def sample_serie(serie, sample_size=PROGRESSIVE_SAMPLE_SIZE, seed=PROGRESSIVE_SEED):
+    """
+    --------------------
+    Description
+    --------------------
+    -> sample_serie (function): Function that draws a uniform random sample of rows of a serie without replacement. The rows are kept in their original order so the sample is read with increasing positions
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Serie to be sampled
+    -> sample_size (int): Number of rows of the sample (the whole serie if it is shorter)
+    -> seed (int): Seed of the random generator
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Sampled serie, with the same name and dtype
+
+    """
+    if len(serie) <= sample_size:
+        return serie
+    positions = np.random.default_rng(seed).choice(len(serie), size=sample_size, replace=False)
+    positions.sort()
+    return serie.iloc[positions]
+
+
+def get_proportion_interval(count, n_sample, n_rows, z=CONFIDENCE_Z):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_proportion_interval (function): Function that estimates the number of rows of the whole column having a property from the number of sampled rows having it, with the Wilson score interval of the proportion (which stays inside [0, 1] for rare or frequent properties) scaled to the number of rows
+
+    --------------------
+    Parameters
+    --------------------
+    -> count (int): Number of sampled rows having the property
+    -> n_sample (int): Number of sampled rows
+    -> n_rows (int): Number of rows of the whole column
+    -> z (float): Quantile of the standard normal distribution of the confidence level
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Estimated number of rows
+    -> (float): Lower bound of the confidence interval
+    -> (float): Upper bound of the confidence interval
+
+    """
+    if n_sample == 0:
+        return np.nan, np.nan, np.nan
+    proportion = count / n_sample
+    denominator = 1 + z ** 2 / n_sample
+    center = (proportion + z ** 2 / (2 * n_sample)) / denominator
+    margin = z * np.sqrt(proportion * (1 - proportion) / n_sample + z ** 2 / (4 * n_sample ** 2)) / denominator
+    return proportion * n_rows, max(center - margin, 0) * n_rows, min(center + margin, 1) * n_rows
+
+
+def get_mean_interval(values, n_rows, z=CONFIDENCE_Z):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_mean_interval (function): Function that estimates the average value of the whole column from sampled values, with a normal confidence interval whose standard error is corrected for sampling without replacement from a finite column
+
+    --------------------
+    Parameters
+    --------------------
+    -> values (np.ndarray): Sampled values without missing values
+    -> n_rows (int): Number of non missing values of the whole column (estimated)
+    -> z (float): Quantile of the standard normal distribution of the confidence level
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Estimated average value
+    -> (float): Lower bound of the confidence interval
+    -> (float): Upper bound of the confidence interval
+
+    """
+    n_values = values.size
+    if n_values < 2:
+        mean = values.mean(dtype='float64') if n_values else np.nan
+        return mean, np.nan, np.nan
+    mean = values.mean(dtype='float64')
+    correction = max(1 - n_values / n_rows, 0) if n_rows else 0
+    margin = z * values.std(ddof=1, dtype='float64') / np.sqrt(n_values) * np.sqrt(correction)
+    return mean, mean - margin, mean + margin
+
+
+def get_quantile_interval(sorted_values, quantile, z=CONFIDENCE_Z):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_quantile_interval (function): Function that estimates a quantile of the whole column from sorted sampled values, with the distribution-free confidence interval given by the order statistics whose ranks are n * q -/+ z * sqrt(n * q * (1 - q))
+
+    --------------------
+    Parameters
+    --------------------
+    -> sorted_values (np.ndarray): Sorted sampled values without missing values
+    -> quantile (float): Quantile between 0 and 1
+    -> z (float): Quantile of the standard normal distribution of the confidence level
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Estimated quantile (linear interpolation like np.quantile)
+    -> (float): Lower bound of the confidence interval
+    -> (float): Upper bound of the confidence interval
+
+    """
+    n_values = sorted_values.size
+    if n_values == 0:
+        return np.nan, np.nan, np.nan
+    estimate = np.quantile(sorted_values, quantile)
+    margin = z * np.sqrt(n_values * quantile * (1 - quantile))
+    low = int(np.clip(np.floor(n_values * quantile - margin), 0, n_values - 1))
+    high = int(np.clip(np.ceil(n_values * quantile + margin), 0, n_values - 1))
+    return estimate, sorted_values[low], sorted_values[high]
+
+
+def format_interval(estimate, low, high, integer=False):
+    """
+    --------------------
+    Description
+    --------------------
+    -> format_interval (function): Function that formats an estimate computed on a sample with its 95% confidence interval for the summaries
+
+    --------------------
+    Parameters
+    --------------------
+    -> estimate (float): Estimated value
+    -> low (float): Lower bound of the confidence interval
+    -> high (float): Upper bound of the confidence interval
+    -> integer (bool): Flag stating if the values are numbers of rows, rounded to integers
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Formatted estimate
+
+    """
+    if estimate is None or (isinstance(estimate, float) and np.isnan(estimate)):
+        return str(None)
+    if integer:
+        estimate, low, high = (int(round(value)) for value in (estimate, low, high))
+    elif isinstance(estimate, float):
+        estimate, low, high = (float(f"{value:.6g}") for value in (estimate, low, high))
+    if isinstance(low, float) and np.isnan(low):
+        return f"~{estimate}"
+    return f"~{estimate} (95% CI {low} to {high})"
+
+
+class ProgressiveRefiner:
+    """
+    --------------------
+    Description
+    --------------------
+    -> ProgressiveRefiner (class): Class that computes the exact profiles of columns on background threads while the tabs display the profiles computed on a random sample of their rows.
+    Threads share the dataframe already loaded by the session, so the columns are neither copied nor pickled. Finished profiles are moved to a common.profile_store.ProfileStore by collect(), the tabs then display them in place of the sample profiles.
+
+    --------------------
+    Attributes
+    --------------------
+    -> max_workers (int): Number of threads (default set to DEFAULT_REFINE_WORKERS)
+    -> executor (ThreadPoolExecutor): Pool of threads (default set to None)
+    -> futures (dict): Pending tasks stored with the dataset hash of their column (default set to empty dict)
+    -> samples (dict): Sample profiles displayed until the exact ones are ready, stored by (dataset hash, column name, column kind) (default set to empty dict)
+    -> errors (list): Messages of the tasks that failed and haven't been displayed yet, see pop_errors() (default set to empty list)
+
+    """
+    def __init__(self, max_workers=DEFAULT_REFINE_WORKERS):
+        self.max_workers = max_workers
+        self.executor = None
+        self.futures = {}
+        self.samples = {}
+        self.errors = []
+
+    def get_sample(self, dataset_key, col_name, kind):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_sample (method): Class method that returns the sample profile of a column whose exact profile is still being computed
+
+        --------------------
+        Parameters
+        --------------------
+        -> dataset_key (str): Hash of the dataset
+        -> col_name (str): Name of the column
+        -> kind (str): Kind of column, one of common.profile_store.COLUMN_KINDS
+
+        --------------------
+        Returns
+        --------------------
+        -> (ColumnProfile): Sample profile or None if the column isn't being refined
+
+        """
+        return self.samples.get((dataset_key, col_name, kind))
+
+    def start(self, dataset_key, sample_profile, function, *args):
+        """
+        --------------------
+        Description
+        --------------------
+        -> start (method): Class method that keeps the sample profile of a column and schedules the computation of its exact profile on the pool of threads
+
+        --------------------
+        Parameters
+        --------------------
+        -> dataset_key (str): Hash of the dataset
+        -> sample_profile (ColumnProfile): Profile computed on a sample of the column
+        -> function (callable): Function computing the exact profile, called with args on a thread (e.g. the get_profile() method of a new instance of the logic class)
+        -> args: Parameters of the function
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='refine')
+        self.samples[(dataset_key, sample_profile.col_name, sample_profile.kind)] = sample_profile
+        self.futures[self.executor.submit(function, *args)] = (dataset_key, sample_profile.col_name, sample_profile.kind)
+
+    def collect(self, profile_store):
+        """
+        --------------------
+        Description
+        --------------------
+        -> collect (method): Class method that moves the exact profiles of the finished tasks to the profile store and forgets their sample profiles
+
+        --------------------
+        Parameters
+        --------------------
+        -> profile_store (ProfileStore): Store shared by the tabs
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Number of profiles added to the store
+
+        """
+        n_added = 0
+        for future in [future for future in self.futures if future.done()]:
+            key = self.futures.pop(future)
+            if key not in self.futures.values():
+                self.samples.pop(key, None)
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                self.errors.append(f"Failed to refine {key[1]}: {future.exception()}")
+                continue
+            profile_store.put(key[0], future.result())
+            n_added += 1
+        return n_added
+
+    def pop_errors(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> pop_errors (method): Class method that returns the messages of the tasks that failed and clears them, so each message is displayed once and not on every rerun
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): Messages of the tasks that failed since the last call
+
+        """
+        errors, self.errors = self.errors, []
+        return errors
+
+    def wait(self, timeout=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> wait (method): Class method that waits until at least one pending task finishes or the timeout expires
+
+        --------------------
+        Parameters
+        --------------------
+        -> timeout (float): Maximum number of seconds to wait. If None, waits for a task to finish
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.futures:
+            wait(list(self.futures), timeout=timeout, return_when=FIRST_COMPLETED)
+
+    def is_running(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> is_running (method): Class method that checks if some tasks haven't been collected yet
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (bool): Flag stating if some profiles are still being refined
+
+        """
+        return bool(self.futures)
+
+    def cancel(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> cancel (method): Class method that cancels the pending tasks and forgets the sample profiles. Tasks already running finish on their thread but their results are discarded.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        for future in self.futures:
+            future.cancel()
+        self.futures = {}
+        self.samples = {}
+        self.errors = []
@@ -0,0 +1,531 @@
+import numpy as np
+import pandas as pd
+
+# Default accuracy parameter of the quantile sketch (normalized rank error of about 1.3%, see KLLSketch.get_rank_error)
+DEFAULT_KLL_K = 200
+
+# Empirical normalized rank error of KLL sketches at 99% confidence: KLL_RANK_ERROR_FACTOR / k ** KLL_RANK_ERROR_EXPONENT
+KLL_RANK_ERROR_FACTOR = 2.296
+KLL_RANK_ERROR_EXPONENT = 0.9723
+
+# Number of values added to the lowest level between two compactions, as a multiple of k
+KLL_UPDATE_BLOCK_FACTOR = 64
+
+# Ways of counting the distinct values of a column: exactly with a hash table (or a sort) of all values, or estimated by a HyperLogLog sketch
+DISTINCT_MODES = ['exact', 'approximate']
+
+# Columns with at most this number of rows are counted exactly even in approximate mode
+HLL_MIN_ROWS = 100_000
+
+# Default relative standard error of the distinct count estimated by HyperLogLog (precision 14: 16384 registers of one byte, 0.8% error)
+DEFAULT_HLL_ERROR = 0.01
+
+# Range of the precision (log2 of the number of registers) of HyperLogLog sketches
+HLL_MIN_PRECISION = 4
+HLL_MAX_PRECISION = 18
+
+# Number of values hashed at once, so the memory used by the hashes stays bounded
+HLL_UPDATE_BLOCK_SIZE = 65_536
+
+
+class KLLSketch:
+    """
+    --------------------
+    Description
+    --------------------
+    -> KLLSketch (class): Class that approximates the quantiles of a stream of numeric values with a KLL sketch.
+    Values are stored in a hierarchy of compactors: a value in level h stands for 2**h values of the stream. When a level is full it is sorted and every other value is promoted to the next level, so the memory stays in O(k log(n / k)) whatever the number of values.
+    Two sketches built on different chunks or workers can be merged into one sketch of the whole stream.
+    The rank of a value returned by get_quantile() is within get_rank_error() of the requested rank with 99% confidence (around 1.3% for the default k).
+
+    --------------------
+    Attributes
+    --------------------
+    -> k (int): Accuracy parameter, capacity of the highest level (default set to DEFAULT_KLL_K)
+    -> n (int): Number of values seen by the sketch (default set to 0)
+    -> levels (list): List of NumPy arrays, one per compactor level (default set to one empty level)
+    -> rng (np.random.Generator): Random generator deciding which half of a level is promoted
+
+    """
+    def __init__(self, k=DEFAULT_KLL_K, seed=None):
+        self.k = k
+        self.n = 0
+        self.levels = [np.empty(0, dtype='float64')]
+        self.rng = np.random.default_rng(seed)
+
+    def get_capacity(self, level):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_capacity (method): Class method that computes the number of values a level can hold before being compacted. Lower levels get geometrically smaller capacities.
+
+        --------------------
+        Parameters
+        --------------------
+        -> level (int): Level index
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Capacity of the level
+
+        """
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        """
+        --------------------
+        Description
+        --------------------
+        -> update (method): Class method that adds values to the sketch. Missing values (NaN) are ignored.
+        Large inputs are added by blocks of KLL_UPDATE_BLOCK_FACTOR * k values so that each level keeps enough values between two compactions.
+
+        --------------------
+        Parameters
+        --------------------
+        -> values (array-like): Numeric values
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        values = np.asarray(values)
+        block_size = KLL_UPDATE_BLOCK_FACTOR * self.k
+        for start in range(0, values.size, block_size):
+            # Each block is cast to float64 on its own so the whole column is never copied at once
+            block = values[start:start + block_size].astype('float64')
+            block = block[~np.isnan(block)]
+            self.n += block.size
+            self.levels[0] = np.concatenate([self.levels[0], block])
+            self.compress()
+
+    def compress(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> compress (method): Class method that compacts every level exceeding its capacity by sorting it and promoting every other value (starting at a random offset) to the next level
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        level = 0
+        while level < len(self.levels):
+            if self.levels[level].size >= self.get_capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype='float64'))
+                values = np.sort(self.levels[level])
+                # Keep the last value of an odd-sized level so the total weight is preserved
+                if values.size % 2:
+                    values, leftover = values[:-1], values[-1:]
+                else:
+                    leftover = values[:0]
+                offset = int(self.rng.integers(2))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], values[offset::2]])
+                self.levels[level] = leftover
+            level += 1
+
+    def merge(self, other):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge (method): Class method that merges another sketch into this one. The result summarises both streams.
+
+        --------------------
+        Parameters
+        --------------------
+        -> other (KLLSketch): Sketch to be merged
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype='float64'))
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self.n += other.n
+        self.compress()
+
+    def get_quantiles(self, quantiles):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_quantiles (method): Class method that estimates the requested quantiles from the weighted values of the sketch
+
+        --------------------
+        Parameters
+        --------------------
+        -> quantiles (array-like): Quantiles between 0 and 1
+
+        --------------------
+        Returns
+        --------------------
+        -> (np.ndarray): Estimated values (NaN if the sketch is empty)
+
+        """
+        quantiles = np.asarray(quantiles, dtype='float64')
+        if self.n == 0:
+            return np.full(quantiles.shape, np.nan)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level_values.size, 2 ** level, dtype='float64') for level, level_values in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        cumulative_weights = np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative_weights, quantiles * cumulative_weights[-1], side='left')
+        return values[order][np.minimum(positions, values.size - 1)]
+
+    def get_quantile(self, quantile):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_quantile (method): Class method that estimates a single quantile from the sketch
+
+        --------------------
+        Parameters
+        --------------------
+        -> quantile (float): Quantile between 0 and 1
+
+        --------------------
+        Returns
+        --------------------
+        -> (float): Estimated value (NaN if the sketch is empty)
+
+        """
+        return float(self.get_quantiles([quantile])[0])
+
+    def get_rank_error(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_rank_error (method): Class method that returns the normalized rank error of the quantiles estimated by the sketch at 99% confidence (empirical bound of KLL sketches). The sketch is exact as long as no level has been compacted.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (float): Maximum expected difference between the requested and the actual rank of an estimated quantile, as a fraction of n
+
+        """
+        if len(self.levels) == 1:
+            return 0.0
+        return KLL_RANK_ERROR_FACTOR / self.k ** KLL_RANK_ERROR_EXPONENT
+
+
+class HyperLogLog:
+    """
+    --------------------
+    Description
+    --------------------
+    -> HyperLogLog (class): Class that estimates the number of distinct values of a stream with a HyperLogLog sketch, using 2**precision registers of one byte whatever the number of values.
+    Each value is hashed to 64 bits: the first precision bits select a register, which keeps the largest position of the lowest 1 bit seen in the remaining bits. The count is estimated from the histogram of the registers with the improved estimator of Ertl (2017), which stays unbiased from small to large cardinalities without the switch to linear counting of the original estimator.
+    Two sketches with the same precision built on different chunks or workers can be merged into the sketch of the whole stream (maximum of the registers). The relative standard error of the estimate is 1.04 / sqrt(2**precision).
+
+    --------------------
+    Attributes
+    --------------------
+    -> precision (int): Number of bits of the hash selecting a register, chosen from the requested error (see get_hll_precision)
+    -> registers (np.ndarray): uint8 array of 2**precision registers (default set to zeros)
+    -> n (int): Number of non missing values seen by the sketch (default set to 0)
+
+    """
+    def __init__(self, error=DEFAULT_HLL_ERROR):
+        self.precision = get_hll_precision(error)
+        self.registers = np.zeros(2 ** self.precision, dtype='uint8')
+        self.n = 0
+
+    def update(self, values):
+        """
+        --------------------
+        Description
+        --------------------
+        -> update (method): Class method that adds values to the sketch. Missing values are ignored and numbers are hashed as float64 so that equal values of integer and float chunks are counted once
+
+        --------------------
+        Parameters
+        --------------------
+        -> values (pd.Series or array-like): Values to be added
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        values = pd.Series(values) if not isinstance(values, pd.Series) else values
+        n_remaining_bits = 64 - self.precision
+        # Each block is cleaned and hashed separately so no copy of the whole column is made
+        for start in range(0, len(values), HLL_UPDATE_BLOCK_SIZE):
+            block = values.iloc[start:start + HLL_UPDATE_BLOCK_SIZE].dropna()
+            if block.dtype.kind in 'biuf':
+                # Adding 0.0 also turns -0.0 into 0.0
+                block = block.astype('float64') + 0.0
+            self.n += len(block)
+            if block.empty:
+                continue
+            # Values are hashed directly: factorizing them first (categorize) costs as much as an exact count
+            hashes = pd.util.hash_pandas_object(block, index=False, categorize=False).to_numpy()
+            indexes = (hashes >> np.uint64(n_remaining_bits)).astype('intp')
+            np.maximum.at(self.registers, indexes, get_ranks(hashes, n_remaining_bits))
+
+    def merge(self, other):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge (method): Class method that merges another sketch into this one. The result summarises both streams.
+
+        --------------------
+        Parameters
+        --------------------
+        -> other (HyperLogLog): Sketch to be merged, with the same precision
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if other.precision != self.precision:
+            raise ValueError(f"Can't merge HyperLogLog sketches of precision {other.precision} and {self.precision}.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        self.n += other.n
+
+    def get_count(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_count (method): Class method that estimates the number of distinct values added to the sketch
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (int): Estimated number of distinct values (never more than the number of values seen)
+
+        """
+        n_registers = self.registers.size
+        n_remaining_bits = 64 - self.precision
+        # Number of registers holding each rank, from 0 (empty) to n_remaining_bits + 1 (all bits zero)
+        counts = np.bincount(self.registers, minlength=n_remaining_bits + 2).astype('float64')
+        if counts[0] == n_registers:
+            return 0
+        # Registers saturated at the maximum rank and empty registers are corrected by tau and sigma, the others halved rank by rank
+        denominator = n_registers * get_hll_tau(1 - counts[n_remaining_bits + 1] / n_registers)
+        for rank in range(n_remaining_bits, 0, -1):
+            denominator = 0.5 * (denominator + counts[rank])
+        denominator += n_registers * get_hll_sigma(counts[0] / n_registers)
+        estimate = n_registers ** 2 / (2 * np.log(2) * denominator)
+        return min(int(round(estimate)), self.n)
+
+    def get_error(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_error (method): Class method that returns the relative standard error of the estimated count
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (float): Relative standard error
+
+        """
+        return 1.04 / np.sqrt(self.registers.size)
+
+
+def get_hll_precision(error):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_hll_precision (function): Function that finds the smallest precision of a HyperLogLog sketch whose relative standard error (1.04 / sqrt(2**precision)) is at most error, within HLL_MIN_PRECISION and HLL_MAX_PRECISION
+
+    --------------------
+    Parameters
+    --------------------
+    -> error (float): Requested relative standard error
+
+    --------------------
+    Returns
+    --------------------
+    -> (int): Precision
+
+    """
+    precision = int(np.ceil(np.log2((1.04 / error) ** 2)))
+    return min(max(precision, HLL_MIN_PRECISION), HLL_MAX_PRECISION)
+
+
+def get_hll_sigma(x):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_hll_sigma (function): Function that computes the sigma series of the improved HyperLogLog estimator, x + sum(x**(2**k) * 2**(k-1)) for k >= 1, correcting the contribution of the empty registers
+
+    --------------------
+    Parameters
+    --------------------
+    -> x (float): Share of empty registers, between 0 and 1
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Value of the series (infinite when every register is empty)
+
+    """
+    if x == 1:
+        return np.inf
+    power = 1.0
+    total = x
+    while True:
+        x = x * x
+        previous = total
+        total += x * power
+        power += power
+        if total == previous:
+            return total
+
+
+def get_hll_tau(x):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_hll_tau (function): Function that computes the tau series of the improved HyperLogLog estimator, (1 - x - sum((1 - x**(2**-k))**2 * 2**-k)) / 3 for k >= 1, correcting the contribution of the registers saturated at the maximum rank
+
+    --------------------
+    Parameters
+    --------------------
+    -> x (float): Share of registers below the maximum rank, between 0 and 1
+
+    --------------------
+    Returns
+    --------------------
+    -> (float): Value of the series
+
+    """
+    if x == 0 or x == 1:
+        return 0.0
+    power = 1.0
+    total = 1 - x
+    while True:
+        x = np.sqrt(x)
+        previous = total
+        power *= 0.5
+        total -= (1 - x) ** 2 * power
+        if total == previous:
+            return total / 3
+
+
+def get_ranks(hashes, n_bits):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_ranks (function): Function that computes the rank of each hash used by HyperLogLog: the position of the lowest 1 bit among its n_bits lowest bits (number of trailing zeros + 1), n_bits + 1 when they are all zeros.
+    The lowest 1 bit is isolated with hash & -hash, a power of two that is converted exactly to float64 so its position is read from the exponent.
+
+    --------------------
+    Parameters
+    --------------------
+    -> hashes (np.ndarray): uint64 array of hashes
+    -> n_bits (int): Number of bits of the hashes not used to select the register
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): uint8 array of ranks
+
+    """
+    remaining = hashes & np.uint64((1 << n_bits) - 1)
+    lowest_bit = remaining & (~remaining + np.uint64(1))
+    # frexp gives 2**k as 0.5 * 2**(k+1): the exponent is the rank, and 0 (no bit set) is given the maximum rank
+    ranks = np.frexp(lowest_bit.astype('float64'))[1]
+    ranks[remaining == 0] = n_bits + 1
+    return ranks.astype('uint8')
+
+
+def count_distinct(values, distinct_mode='exact', error=DEFAULT_HLL_ERROR, min_rows=HLL_MIN_ROWS):
+    """
+    --------------------
+    Description
+    --------------------
+    -> count_distinct (function): Function that counts the distinct non missing values of a column, exactly with a hash table (pd.Series.nunique) or, in approximate mode, with a HyperLogLog sketch when the column has more than min_rows rows
+
+    --------------------
+    Parameters
+    --------------------
+    -> values (pd.Series or array-like): Values to be counted
+    -> distinct_mode (str): Way of counting, one of DISTINCT_MODES
+    -> error (float): Relative standard error of the sketch in approximate mode
+    -> min_rows (int): Columns with at most this number of rows are counted exactly in approximate mode
+
+    --------------------
+    Returns
+    --------------------
+    -> (int): Number of distinct values
+    -> (float): Relative standard error of the count, None if it is exact
+
+    """
+    if distinct_mode == 'approximate' and len(values) > min_rows:
+        sketch = HyperLogLog(error=error)
+        sketch.update(values)
+        return sketch.get_count(), sketch.get_error()
+    values = pd.Series(values) if not isinstance(values, pd.Series) else values
+    return int(values.nunique()), None
+
+
+def format_distinct_count(n_unique, error=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> format_distinct_count (function): Function that formats a number of distinct values for the summaries, labelled as approximate with its standard error when it has been estimated by a HyperLogLog sketch
+
+    --------------------
+    Parameters
+    --------------------
+    -> n_unique (int): Number of distinct values
+    -> error (float): Relative standard error of the estimate, None if the count is exact
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Formatted count
+
+    """
+    if error is None or n_unique is None:
+        return str(n_unique)
+    return f"~{n_unique} (approximate, HyperLogLog standard error {error:.1%})"
@@ -0,0 +1,502 @@
+import numpy as np
+import pandas as pd
+
+from common.date_kernels import count_date_properties
+from common.sketches import DEFAULT_HLL_ERROR, HyperLogLog, KLLSketch
+from common.text_kernels import count_text_properties
+
+# Default number of rows read at once in streaming mode
+DEFAULT_CHUNKSIZE = 500_000
+
+# Number of rows read to guess the data types of the columns in streaming mode
+SAMPLE_NROWS = 10_000
+
+
+def rewind(file):
+    """
+    --------------------
+    Description
+    --------------------
+    -> rewind (function): Function that moves an uploaded file (file-like object) back to its beginning so it can be read again. File paths are left unchanged.
+
+    --------------------
+    Parameters
+    --------------------
+    -> file (str or file-like): File path or uploaded file
+
+    --------------------
+    Returns
+    --------------------
+    -> None
+
+    """
+    if hasattr(file, 'seek'):
+        file.seek(0)
+
+
+def read_csv_sample(file, nrows=SAMPLE_NROWS):
+    """
+    --------------------
+    Description
+    --------------------
+    -> read_csv_sample (function): Function that loads the first rows of a CSV file in order to find its columns and their data types without loading the whole file
+
+    --------------------
+    Parameters
+    --------------------
+    -> file (str or file-like): File path or uploaded file
+    -> nrows (int): Number of rows to be read
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): First rows of the CSV file
+
+    """
+    rewind(file)
+    sample = pd.read_csv(file, nrows=nrows)
+    rewind(file)
+    return sample
+
+
+def iter_csv_chunks(file, columns=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    --------------------
+    Description
+    --------------------
+    -> iter_csv_chunks (function): Function that reads a CSV file chunk by chunk, loading only the requested columns, so the memory used is bounded by the chunk size
+
+    --------------------
+    Parameters
+    --------------------
+    -> file (str or file-like): File path or uploaded file
+    -> columns (list): Names of the columns to be loaded (all columns if None)
+    -> chunksize (int): Number of rows per chunk
+
+    --------------------
+    Returns
+    --------------------
+    -> (generator): Generator of pd.DataFrame chunks
+
+    """
+    rewind(file)
+    with pd.read_csv(file, usecols=columns, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield chunk
+
+
+class NumericAccumulator:
+    """
+    --------------------
+    Description
+    --------------------
+    -> NumericAccumulator (class): Class that updates the statistics of a numeric column chunk by chunk. Accumulators built on different chunks can be merged.
+    The mean and variance are combined with Welford/Chan updates, the median comes from a KLL quantile sketch and the number of distinct values from a HyperLogLog sketch.
+
+    --------------------
+    Attributes
+    --------------------
+    -> n_rows (int): Number of rows seen (default set to 0)
+    -> n_values (int): Number of non missing values seen (default set to 0)
+    -> n_missing (int): Number of missing values (default set to 0)
+    -> n_zeros (int): Number of values equal to 0 (default set to 0)
+    -> n_negatives (int): Number of negative values (default set to 0)
+    -> col_min (float): Minimum value (default set to NaN)
+    -> col_max (float): Maximum value (default set to NaN)
+    -> col_mean (float): Running average value (default set to NaN)
+    -> m2 (float): Running sum of squared deviations from the mean (default set to 0)
+    -> sketch (KLLSketch): Quantile sketch of the values
+    -> distinct (HyperLogLog): Distinct-count sketch of the values, with a relative standard error of hll_error (default set to DEFAULT_HLL_ERROR)
+
+    """
+    def __init__(self, sketch_k=None, hll_error=DEFAULT_HLL_ERROR):
+        self.n_rows = 0
+        self.n_values = 0
+        self.n_missing = 0
+        self.n_zeros = 0
+        self.n_negatives = 0
+        self.col_min = np.nan
+        self.col_max = np.nan
+        self.col_mean = np.nan
+        self.m2 = 0.0
+        self.sketch = KLLSketch() if sketch_k is None else KLLSketch(k=sketch_k)
+        self.distinct = HyperLogLog(error=hll_error)
+
+    def update(self, serie):
+        """
+        --------------------
+        Description
+        --------------------
+        -> update (method): Class method that adds the values of a chunk to the accumulator
+
+        --------------------
+        Parameters
+        --------------------
+        -> serie (pd.Series): Chunk of the column
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        values = pd.to_numeric(serie, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        missing_mask = np.isnan(values)
+        values = values[~missing_mask]
+        self.n_rows += len(serie)
+        self.n_missing += int(np.count_nonzero(missing_mask))
+        if values.size == 0:
+            return
+
+        # Combine the moments of the chunk in place and feed its values to the existing sketches
+        chunk_mean = values.mean()
+        deviations = values - chunk_mean
+        self.add_moments(
+            n_values=values.size,
+            n_zeros=int(np.count_nonzero(values == 0)),
+            n_negatives=int(np.count_nonzero(values < 0)),
+            col_min=values.min(),
+            col_max=values.max(),
+            col_mean=chunk_mean,
+            m2=float(np.dot(deviations, deviations))
+        )
+        self.sketch.update(values)
+        self.distinct.update(values)
+
+    def merge_moments(self, other):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge_moments (method): Class method that combines the counts, extremes, mean and sum of squared deviations of another accumulator into this one (see self.add_moments())
+
+        --------------------
+        Parameters
+        --------------------
+        -> other (NumericAccumulator): Accumulator to be combined
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.add_moments(other.n_values, other.n_zeros, other.n_negatives, other.col_min, other.col_max, other.col_mean, other.m2)
+
+    def add_moments(self, n_values, n_zeros, n_negatives, col_min, col_max, col_mean, m2):
+        """
+        --------------------
+        Description
+        --------------------
+        -> add_moments (method): Class method that combines the counts, extremes, mean and sum of squared deviations of a group of values into the accumulator in place (Chan et al. parallel update)
+
+        --------------------
+        Parameters
+        --------------------
+        -> n_values (int): Number of non missing values of the group
+        -> n_zeros (int): Number of values equal to 0 in the group
+        -> n_negatives (int): Number of negative values in the group
+        -> col_min (float): Minimum value of the group
+        -> col_max (float): Maximum value of the group
+        -> col_mean (float): Average value of the group
+        -> m2 (float): Sum of squared deviations from the mean of the group
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if n_values == 0:
+            return
+        if self.n_values == 0:
+            self.col_mean = col_mean
+            self.m2 = m2
+            self.col_min = col_min
+            self.col_max = col_max
+        else:
+            n_total = self.n_values + n_values
+            delta = col_mean - self.col_mean
+            self.col_mean += delta * n_values / n_total
+            self.m2 += m2 + delta ** 2 * self.n_values * n_values / n_total
+            self.col_min = min(self.col_min, col_min)
+            self.col_max = max(self.col_max, col_max)
+        self.n_values += n_values
+        self.n_zeros += n_zeros
+        self.n_negatives += n_negatives
+
+    def merge(self, other):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge (method): Class method that merges another accumulator (built on other chunks) into this one
+
+        --------------------
+        Parameters
+        --------------------
+        -> other (NumericAccumulator): Accumulator to be merged
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.n_rows += other.n_rows
+        self.n_missing += other.n_missing
+        self.merge_moments(other)
+        self.sketch.merge(other.sketch)
+        self.distinct.merge(other.distinct)
+
+    def get_std(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_std (method): Class method that computes the sample standard deviation (ddof=1) of the values seen
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (float): Standard deviation (NaN if less than 2 values)
+
+        """
+        if self.n_values < 2:
+            return np.nan
+        return np.sqrt(self.m2 / (self.n_values - 1))
+
+    def get_median(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_median (method): Class method that estimates the median of the values seen from the quantile sketch
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (float): Approximate median
+
+        """
+        return self.sketch.get_quantile(0.5)
+
+
+class DateAccumulator:
+    """
+    --------------------
+    Description
+    --------------------
+    -> DateAccumulator (class): Class that updates the statistics of a datetime column chunk by chunk. Accumulators built on different chunks can be merged.
+
+    --------------------
+    Attributes
+    --------------------
+    -> now (pd.Timestamp): Date used to find the dates falling in the future (default set to today)
+    -> n_rows (int): Number of rows seen (default set to 0)
+    -> n_missing (int): Number of missing values (default set to 0)
+    -> col_min (pd.Timestamp): Minimum date (default set to None)
+    -> col_max (pd.Timestamp): Maximum date (default set to None)
+    -> n_weekend (int): Number of dates falling during weekend (default set to 0)
+    -> n_weekday (int): Number of dates not falling during weekend (default set to 0)
+    -> n_future (int): Number of dates falling in the future (default set to 0)
+    -> n_empty_1900 (int): Number of dates equal to '1900-01-01' (default set to 0)
+    -> n_empty_1970 (int): Number of dates equal to '1970-01-01' (default set to 0)
+    -> distinct (HyperLogLog): Distinct-count sketch of the dates, with a relative standard error of hll_error (default set to DEFAULT_HLL_ERROR)
+
+    """
+    def __init__(self, now=None, hll_error=DEFAULT_HLL_ERROR):
+        self.now = pd.to_datetime('now').normalize() if now is None else now
+        self.n_rows = 0
+        self.n_missing = 0
+        self.col_min = None
+        self.col_max = None
+        self.n_weekend = 0
+        self.n_weekday = 0
+        self.n_future = 0
+        self.n_empty_1900 = 0
+        self.n_empty_1970 = 0
+        self.distinct = HyperLogLog(error=hll_error)
+
+    def update(self, serie):
+        """
+        --------------------
+        Description
+        --------------------
+        -> update (method): Class method that adds the dates of a chunk (already converted to datetime) to the accumulator, with all statistics computed together on its int64 view (see common.date_kernels.count_date_properties)
+
+        --------------------
+        Parameters
+        --------------------
+        -> serie (pd.Series): Chunk of the column converted to datetime
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        counts = count_date_properties(serie, self.now)
+        self.n_rows += counts['n_rows']
+        self.n_missing += counts['n_missing']
+        if counts['n_rows'] == counts['n_missing']:
+            return
+        self.n_weekend += counts['n_weekend']
+        self.n_weekday += counts['n_weekday']
+        self.n_future += counts['n_future']
+        self.n_empty_1900 += counts['n_empty_1900']
+        self.n_empty_1970 += counts['n_empty_1970']
+        self.update_extremes(counts['col_min'], counts['col_max'])
+        self.distinct.update(serie)
+
+    def update_extremes(self, col_min, col_max):
+        """
+        --------------------
+        Description
+        --------------------
+        -> update_extremes (method): Class method that updates the minimum and maximum dates seen
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_min (pd.Timestamp): Minimum date of the new values
+        -> col_max (pd.Timestamp): Maximum date of the new values
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if col_min is not None:
+            self.col_min = col_min if self.col_min is None else min(self.col_min, col_min)
+        if col_max is not None:
+            self.col_max = col_max if self.col_max is None else max(self.col_max, col_max)
+
+    def merge(self, other):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge (method): Class method that merges another accumulator (built on other chunks) into this one
+
+        --------------------
+        Parameters
+        --------------------
+        -> other (DateAccumulator): Accumulator to be merged
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.n_rows += other.n_rows
+        self.n_missing += other.n_missing
+        self.n_weekend += other.n_weekend
+        self.n_weekday += other.n_weekday
+        self.n_future += other.n_future
+        self.n_empty_1900 += other.n_empty_1900
+        self.n_empty_1970 += other.n_empty_1970
+        self.update_extremes(other.col_min, other.col_max)
+        self.distinct.merge(other.distinct)
+
+
+class TextAccumulator:
+    """
+    --------------------
+    Description
+    --------------------
+    -> TextAccumulator (class): Class that updates the counts of a text column chunk by chunk. Accumulators built on different chunks can be merged.
+
+    --------------------
+    Attributes
+    --------------------
+    -> n_rows (int): Number of rows seen (default set to 0)
+    -> n_missing (int): Number of missing values (default set to 0)
+    -> n_empty (int): Number of empty values (default set to 0)
+    -> n_space (int): Number of values with only space characters (default set to 0)
+    -> n_lower (int): Number of values with only lowercase characters (default set to 0)
+    -> n_upper (int): Number of values with only uppercase characters (default set to 0)
+    -> n_alpha (int): Number of values with only alphabetical characters (default set to 0)
+    -> n_digit (int): Number of values with only digit characters (default set to 0)
+    -> distinct (HyperLogLog): Distinct-count sketch of the values, with a relative standard error of hll_error (default set to DEFAULT_HLL_ERROR)
+
+    """
+    def __init__(self, hll_error=DEFAULT_HLL_ERROR):
+        self.n_rows = 0
+        self.n_missing = 0
+        self.n_empty = 0
+        self.n_space = 0
+        self.n_lower = 0
+        self.n_upper = 0
+        self.n_alpha = 0
+        self.n_digit = 0
+        self.distinct = HyperLogLog(error=hll_error)
+
+    def update(self, serie):
+        """
+        --------------------
+        Description
+        --------------------
+        -> update (method): Class method that adds the values of a chunk to the accumulator
+
+        --------------------
+        Parameters
+        --------------------
+        -> serie (pd.Series): Chunk of the column
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.n_rows += len(serie)
+        counts = count_text_properties(serie)
+        self.n_missing += counts['n_missing']
+        self.n_empty += counts['n_empty']
+        self.n_space += counts['n_space']
+        self.n_lower += counts['n_lower']
+        self.n_upper += counts['n_upper']
+        self.n_alpha += counts['n_alpha']
+        self.n_digit += counts['n_digit']
+        self.distinct.update(serie)
+
+    def merge(self, other):
+        """
+        --------------------
+        Description
+        --------------------
+        -> merge (method): Class method that merges another accumulator (built on other chunks) into this one
+
+        --------------------
+        Parameters
+        --------------------
+        -> other (TextAccumulator): Accumulator to be merged
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.n_rows += other.n_rows
+        self.n_missing += other.n_missing
+        self.n_empty += other.n_empty
+        self.n_space += other.n_space
+        self.n_lower += other.n_lower
+        self.n_upper += other.n_upper
+        self.n_alpha += other.n_alpha
+        self.n_digit += other.n_digit
+        self.distinct.merge(other.distinct)
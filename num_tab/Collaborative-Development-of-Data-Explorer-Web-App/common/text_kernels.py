@@ -0,0 +1,186 @@
+import numpy as np
+import pandas as pd
+
+# pyarrow is installed with Streamlit but the pandas .str methods are used if it isn't available
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+
+# Properties counted by count_text_properties(), stored by count name with the name of the str.is* method and of the pyarrow utf8_is_* kernel.
+# Digits are decimal characters: pyarrow's utf8_is_digit also counts numeric characters such as '½', which str.isdigit() doesn't
+TEXT_PROPERTIES = {'space': 'space', 'lower': 'lower', 'upper': 'upper', 'alpha': 'alpha', 'digit': 'decimal'}
+
+
+def to_arrow_strings(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> to_arrow_strings (function): Function that converts a serie to an Arrow string array in one pass over its values. Missing values become nulls and other non-text values are converted with str(). Series already backed by Arrow strings are not copied.
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Text column
+
+    --------------------
+    Returns
+    --------------------
+    -> (pa.Array or pa.ChunkedArray): Arrow string array
+
+    """
+    try:
+        return pa.array(serie, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed columns (e.g. numbers and text): convert the non missing values to text first
+        return pa.array(serie.where(serie.isna(), serie.astype(str)), type=pa.string(), from_pandas=True)
+
+
+def count_text_properties(serie, weights=None):
+    """
+    --------------------
+    Description
+    --------------------
+    -> count_text_properties (function): Function that computes together all the counts displayed for a text column: missing values, empty values and values made only of whitespace, lowercase (str.islower), uppercase (str.isupper), alphabetical or decimal digit (str.isdecimal) characters.
+    The values are converted once to a contiguous Arrow string array and each property is computed by a vectorized pyarrow UTF-8 kernel, instead of one Python-level .str loop over every value per property.
+    The kernels follow the same rules as the Python str.is* methods, but pyarrow and Python may ship different Unicode versions: both agree on ASCII text, while letters and digits added to Unicode recently or case rules of some non-ASCII characters (e.g. 'ª') can be classified differently.
+    Without pyarrow the pandas .str methods are used. Categorical columns are classified on their categories only, each one weighted by its number of occurrences.
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Text column
+    -> weights (np.ndarray): Number of occurrences of each value of serie, used for the categories of a categorical column (optional)
+
+    --------------------
+    Returns
+    --------------------
+    -> (dict): Counts stored by name (n_missing, n_empty, n_space, n_lower, n_upper, n_alpha, n_digit)
+
+    """
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        codes = serie.cat.codes.to_numpy()
+        weights = np.bincount(codes[codes >= 0], minlength=len(serie.cat.categories))
+        category_counts = count_text_properties(pd.Series(serie.cat.categories), weights=weights)
+        category_counts['n_missing'] = int(np.count_nonzero(codes < 0))
+        return category_counts
+
+    if pa is None:
+        missing = serie.isna().to_numpy()
+        texts = serie[~missing].astype(str)
+        flags = {'n_empty': (texts == '').to_numpy()}
+        for text_property, method in TEXT_PROPERTIES.items():
+            flags[f'n_{text_property}'] = getattr(texts.str, f'is{method}')().to_numpy()
+        if weights is None:
+            counts = {name: int(np.count_nonzero(flag)) for name, flag in flags.items()}
+        else:
+            counts = {name: int(np.dot(flag, weights[~missing])) for name, flag in flags.items()}
+        counts['n_missing'] = int(np.count_nonzero(missing))
+        return counts
+
+    texts = to_arrow_strings(serie)
+    flags = {'n_empty': pc.equal(pc.binary_length(texts), 0)}
+    for text_property, method in TEXT_PROPERTIES.items():
+        flags[f'n_{text_property}'] = getattr(pc, f'utf8_is_{method}')(texts)
+    if weights is None:
+        counts = {name: pc.sum(flag).as_py() or 0 for name, flag in flags.items()}
+    else:
+        counts = {name: int(np.dot(pc.fill_null(flag, False).to_numpy(zero_copy_only=False), weights)) for name, flag in flags.items()}
+    counts['n_missing'] = texts.null_count
+    return counts
+
+
+def convert_text_columns(df):
+    """
+    --------------------
+    Description
+    --------------------
+    -> convert_text_columns (function): Function that converts the object columns of a dataframe holding only text (and missing) values to the Arrow-backed string dtype (string[pyarrow]), which stores all the values of a column in contiguous Arrow buffers instead of one Python str object per value.
+    Columns mixing text with other types are kept as object. The dataframe is modified in place.
+
+    --------------------
+    Parameters
+    --------------------
+    -> df (pd.DataFrame): Loaded dataframe
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.DataFrame): Same dataframe with converted text columns
+
+    """
+    if pa is None:
+        return df
+    for col_name in df.select_dtypes(include=['object']).columns:
+        if pd.api.types.infer_dtype(df[col_name], skipna=True) == 'string':
+            df[col_name] = df[col_name].astype('string[pyarrow]')
+    return df
+
+
+def get_string_memory(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_string_memory (function): Function that measures the memory used by a text column stored as Python objects (object dtype, pointers and str objects) and as Arrow strings (offsets, data and validity buffers), whatever its current storage.
+    The representation the column isn't stored in is built temporarily to be measured.
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Text column
+
+    --------------------
+    Returns
+    --------------------
+    -> (int): Memory used as Python objects in bytes
+    -> (int): Memory used as Arrow strings in bytes, or None without pyarrow
+
+    """
+    objects = serie if pd.api.types.is_object_dtype(serie) else serie.astype(object).where(serie.notna(), np.nan)
+    object_bytes = int(objects.memory_usage(index=False, deep=True))
+    arrow_bytes = int(to_arrow_strings(serie).nbytes) if pa is not None else None
+    return object_bytes, arrow_bytes
+
+
+def to_fixed_width_bytes(texts, width):
+    """
+    --------------------
+    Description
+    --------------------
+    -> to_fixed_width_bytes (function): Function that copies the UTF-8 bytes of Arrow strings into a fixed-width byte matrix, read directly from the offsets and data buffers of the array (no Python str is created).
+    Values shorter than width are padded with zero bytes and longer values are truncated, like numpy.astype('S{width}').
+
+    --------------------
+    Parameters
+    --------------------
+    -> texts (pa.Array or pa.ChunkedArray): Arrow string array without missing values
+    -> width (int): Number of bytes kept per value
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): uint8 array of shape (number of values, width)
+
+    """
+    if isinstance(texts, pa.ChunkedArray):
+        texts = texts.combine_chunks() if texts.num_chunks else pa.array([], type=pa.string())
+    texts = texts.cast(pa.string())
+    _, offsets_buffer, data_buffer = texts.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype='int32')[texts.offset:texts.offset + len(texts) + 1]
+    data = np.frombuffer(data_buffer, dtype='uint8') if data_buffer is not None else np.zeros(0, dtype='uint8')
+    lengths = np.diff(offsets)
+    matrix = np.zeros((len(texts), width), dtype='uint8')
+    if len(texts) and (lengths == lengths[0]).all():
+        # Values of the same length (e.g. zero-padded dates) are contiguous in the data buffer: reshape it without gathering
+        length = int(lengths[0])
+        if length:
+            matrix[:, :min(length, width)] = data[offsets[0]:offsets[-1]].reshape(-1, length)[:, :width]
+        return matrix
+    positions = offsets[:-1, None] + np.arange(width, dtype='int32')
+    inside = np.arange(width) < lengths[:, None]
+    matrix[inside] = data[positions[inside]]
+    return matrix
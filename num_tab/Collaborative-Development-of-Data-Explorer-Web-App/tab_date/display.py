@@ -1,8 +1,10 @@
 import streamlit as st
 
 from tab_date.logics import DateColumn
+from common.instrumentation import record_stage, get_performance_table
+from common.progressive import PROGRESSIVE_MIN_ROWS
 
-def display_tab_date_content(file_path=None, df=None):
+def display_tab_date_content(file_path=None, df=None, chunksize=None):
     """
     --------------------
     Description
@@ -10,16 +12,19 @@ def display_tab_date_content(file_path=None, df=None):
     -> display_tab_date_content (function): Function that will instantiate tab_date.logics.DateColumn class, save it into Streamlit session state and call its tab_date.logics.DateColumn.find_date_cols() method in order to find all datetime columns.
     Then it will display a Streamlit select box with the list of datetime columns found.
     Once the user select a datetime column from the select box, it will call the tab_date.logics.DateColumn.set_data() method in order to compute all the information to be displayed.
+    In progressive mode (progressive in Streamlit session state), columns of at least common.progressive.PROGRESSIVE_MIN_ROWS rows are first profiled from a random sample (see tab_date.logics.DateColumn.get_sample_profile) while their exact profile is computed by the common.progressive.ProgressiveRefiner in Streamlit session state, which replaces the sample profile once ready.
     Then it will display a Streamlit Expander container with the following contents:
     - the results of tab_date.logics.DateColumn.get_summary() as a Streamlit Table
     - the graph from tab_date.logics.DateColumn.histogram using Streamlit.altair_chart()
     - the results of tab_date.logics.DateColumn.frequent using Streamlit.write
+    Finally, when the performance details are enabled (show_performance in Streamlit session state), it will display a Performance expander with the stages recorded by the instance (see common.instrumentation.get_performance_table), including the time spent rendering the expander.
  
     --------------------
     Parameters
     --------------------
     -> file_path (str): File path to uploaded CSV file (optional)
     -> df (pd.DataFrame): Loaded dataframe (optional)
+    -> chunksize (int): Number of rows per chunk in streaming mode (optional)
 
     --------------------
     Returns
@@ -27,15 +32,34 @@ def display_tab_date_content(file_path=None, df=None):
     -> None
 
     """
-    if file_path is not None:
+    # Reuse the DateColumn instance cached with the uploaded dataset so its results survive reruns
+    cached_dataset = st.session_state.get("cached_dataset")
+    profile_store = st.session_state.get("profile_store")
+    dataset_key = cached_dataset.key if cached_dataset is not None and profile_store is not None else None
+    date_column = cached_dataset.columns.get("date_column") if cached_dataset is not None else None
+    if date_column is not None and date_column.chunksize == chunksize:
+        st.session_state.date_column = date_column
+    elif file_path is not None:
         # Instantiate DateColumn class
-        date_column = DateColumn(file_path, df)
+        date_column = DateColumn(file_path, df, chunksize)
 
         # Save the instance to Streamlit session state
         st.session_state.date_column = date_column
 
-        # Find datetime columns
-        st.session_state.date_column.find_date_cols()
+        if dataset_key is not None:
+            # Profiles computed in the other mode (streaming or not) are not valid anymore
+            profile_store.invalidate(dataset_key, kind='date')
+        if cached_dataset is not None:
+            cached_dataset.columns["date_column"] = date_column
+
+        # Find datetime columns (or reuse the list stored for this dataset)
+        cols_list = profile_store.get_columns(dataset_key, 'date') if dataset_key is not None else None
+        if cols_list is None:
+            st.session_state.date_column.find_date_cols()
+            if dataset_key is not None:
+                profile_store.put_columns(dataset_key, 'date', st.session_state.date_column.cols_list)
+        else:
+            st.session_state.date_column.cols_list = cols_list
     #else:
         #st.error("Please upload a CSV file.")
     
@@ -43,26 +67,56 @@ def display_tab_date_content(file_path=None, df=None):
     selected_column = st.selectbox("Which datetime column do you want to explore?", st.session_state.date_column.cols_list)
     
     if selected_column:
-        # Set data for the selected column
-        st.session_state.date_column.set_data(selected_column)
+        st.session_state.selected_date_col = selected_column
 
-        # Convert series to Date
-        st.session_state.date_column.convert_serie_to_date()
+        # Compute the profile of the column only if it hasn't been stored before with the same distinct-count mode
+        date_column = st.session_state.date_column
+        date_column.distinct_mode = st.session_state.get("distinct_mode") or 'exact'
+        profile = profile_store.get(dataset_key, selected_column, 'date') if dataset_key is not None else None
+        if profile is None or profile.details.get('distinct_mode') != date_column.distinct_mode:
+            # In progressive mode the profile of a random sample is displayed until the exact one has been computed in the background
+            refiner = st.session_state.get("refiner")
+            progressive = st.session_state.get("progressive") and refiner is not None and dataset_key is not None and chunksize is None
+            profile = refiner.get_sample(dataset_key, selected_column, 'date') if progressive else None
+            if profile is None or profile.details.get('distinct_mode') != date_column.distinct_mode:
+                # Set data for the selected column and convert it to datetime
+                try:
+                    if progressive and len(date_column.df[selected_column]) >= PROGRESSIVE_MIN_ROWS:
+                        profile = date_column.get_sample_profile(selected_column)
+                        # The background thread gets its own instance and only the selected column
+                        exact_column = DateColumn(file_path, date_column.df[selected_column].to_frame(), distinct_mode=date_column.distinct_mode)
+                        refiner.start(dataset_key, profile, exact_column.get_profile, selected_column)
+                    else:
+                        profile = date_column.get_profile(selected_column)
+                        if dataset_key is not None:
+                            profile_store.put(dataset_key, profile)
+                except ValueError as e:
+                    st.error(str(e))
+                    return
         
         # Create an expander container to show information
-        with st.expander(""):
+        with record_stage(st.session_state.date_column, "streamlit.render"), st.expander(""):
             # Display a summary table
             st.write("Date Column")
-            summary = st.session_state.date_column.get_summary()
-            st.write(summary, use_container_width=True)
+            if 'sample_size' in profile.details:
+                st.caption(f"Estimated from a random sample of {profile.details['sample_size']} rows out of {profile.details['n_rows']}, the exact values are being computed in the background.")
+            st.table(profile.summary)
+
+            # Display the number of values parsed with each date format
+            if profile.details.get('format_counts'):
+                st.write("Parsed Date Formats")
+                st.table([{"Format": date_format, "Number of Rows": count} for date_format, count in profile.details['format_counts'].items()])
 
             # Display a Bar Chart using Altair chart
             st.write("Bar Chart")
-            chart = st.session_state.date_column.set_barchart()
+            chart = profile.charts.get('bar')
             if chart is not None:
                 st.altair_chart(chart, use_container_width=True)
 
             # Display the most frequent values
             st.write(" Most Frequent Values")
-            frequent_values = st.session_state.date_column.set_frequent()
-            st.write(frequent_values)
\ No newline at end of file
+            st.write(profile.frequent)
+
+        if st.session_state.get("show_performance"):
+            with st.expander("Performance"):
+                st.table(get_performance_table(st.session_state.date_column))
@@ -1,6 +1,363 @@
+import numpy as np
 import pandas as pd
 import altair as alt
+
+from common.lazy import LazyDataset
+from common.instrumentation import instrument
+from common.date_kernels import NAT_INT64, NS_PER_DAY, NS_PER_HOUR, count_date_properties, get_nanoseconds
+from common.streaming import DateAccumulator, iter_csv_chunks, read_csv_sample
+from common.profile_store import ColumnProfile
+from common.frequent import HeavyHitters, get_top_k
+from common.sketches import DEFAULT_HLL_ERROR, HLL_MIN_ROWS, HyperLogLog, count_distinct, format_distinct_count
+from common.text_kernels import pa, to_arrow_strings, to_fixed_width_bytes
+from common.progressive import PROGRESSIVE_SAMPLE_SIZE, sample_serie, get_proportion_interval, format_interval
+
 pd.set_option('display.max_colwidth', None)
+
+# Candidate strptime formats tried when inferring the format of a text column (day first formats come before month first ones)
+DATE_FORMATS = [
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d %H:%M:%S.%f',
+    '%Y/%m/%d',
+    '%Y%m%d',
+    '%d/%m/%Y',
+    '%d/%m/%Y %H:%M',
+    '%d/%m/%Y %H:%M:%S',
+    '%m/%d/%Y',
+    '%m/%d/%Y %H:%M',
+    '%m/%d/%Y %H:%M:%S',
+    '%d-%m-%Y',
+    '%d.%m.%Y',
+    '%d %b %Y',
+    '%d %B %Y',
+    '%b %d, %Y',
+    '%B %d, %Y',
+]
+
+# Number of values sampled to infer the date formats of a column
+FORMAT_SAMPLE_SIZE = 1000
+
+# Minimum share of the sample a format has to parse to be selected
+FORMAT_MIN_SHARE = 0.01
+
+# Number of values sampled to estimate the ratio of distinct values to rows of a text column
+FACTORIZE_SAMPLE_SIZE = 10_000
+
+# Maximum ratio of distinct values to rows for a text column to be converted by parsing each distinct value once (above it, hashing the values costs more than parsing them all)
+FACTORIZE_MAX_RATIO = 0.3
+
+# Granularities of the date barchart from the finest to the coarsest: name, average width in nanoseconds (Gregorian calendar), label format of the bars
+DATE_BUCKETS = [
+    ('hour', NS_PER_HOUR, '%Y-%m-%d %H:00'),
+    ('day', NS_PER_DAY, '%Y-%m-%d'),
+    ('week', 7 * NS_PER_DAY, '%Y-%m-%d'),
+    ('month', int(30.436875 * NS_PER_DAY), '%Y-%m'),
+    ('quarter', int(91.310625 * NS_PER_DAY), '%Y-Q'),
+    ('year', int(365.2425 * NS_PER_DAY), '%Y'),
+]
+
+# Number of bars the granularity of the date barchart is chosen for
+DATE_TARGET_BARS = 100
+
+# Directives of fixed-width formats that can be parsed with vectorized byte arithmetic: name, width
+FIXED_WIDTH_DIRECTIVES = {
+    '%Y': ('year', 4),
+    '%m': ('month', 2),
+    '%d': ('day', 2),
+    '%H': ('hour', 2),
+    '%M': ('minute', 2),
+    '%S': ('second', 2),
+}
+
+
+def compile_fixed_width_format(date_format):
+    """
+    --------------------
+    Description
+    --------------------
+    -> compile_fixed_width_format (function): Function that translates a strptime format made only of zero-padded numeric directives (FIXED_WIDTH_DIRECTIVES) and literal characters into the byte positions of each field
+
+    --------------------
+    Parameters
+    --------------------
+    -> date_format (str): strptime format
+
+    --------------------
+    Returns
+    --------------------
+    -> (tuple): List of fields (name, start, width), list of literals (position, byte value) and total width, or None if the format isn't fixed-width
+
+    """
+    fields, literals = [], []
+    position, i = 0, 0
+    while i < len(date_format):
+        if date_format[i] == '%':
+            directive = date_format[i:i + 2]
+            if directive not in FIXED_WIDTH_DIRECTIVES:
+                return None
+            name, width = FIXED_WIDTH_DIRECTIVES[directive]
+            fields.append((name, position, width))
+            position += width
+            i += 2
+        else:
+            if ord(date_format[i]) > 127:
+                return None
+            literals.append((position, ord(date_format[i])))
+            position += 1
+            i += 1
+    return fields, literals, position
+
+
+def parse_fixed_width(values, date_format):
+    """
+    --------------------
+    Description
+    --------------------
+    -> parse_fixed_width (function): Function that parses text dates with a fixed-width numeric format using vectorized arithmetic on their bytes (no per-value Python call).
+    Arrow strings are read directly from their buffers (see common.text_kernels.to_fixed_width_bytes).
+    Values that don't match the format exactly (other length, non digit characters, other separators, invalid dates or dates out of the nanosecond range) are returned as NaT.
+
+    --------------------
+    Parameters
+    --------------------
+    -> values (np.ndarray or pa.Array): Array of str values or Arrow string array without missing values
+    -> date_format (str): strptime format
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): datetime64[ns] array, or None if the format isn't fixed-width or the values aren't ASCII
+
+    """
+    compiled = compile_fixed_width_format(date_format)
+    if compiled is None:
+        return None
+    fields, literals, width = compiled
+    if pa is not None and isinstance(values, (pa.Array, pa.ChunkedArray)):
+        # One extra byte so that longer values can be detected (non ASCII bytes fail the digit and literal checks)
+        buffer = to_fixed_width_bytes(values, width + 1)
+    else:
+        try:
+            # One extra byte so that longer values can be detected
+            raw = values.astype(f'S{width + 1}')
+        except UnicodeEncodeError:
+            return None
+        buffer = raw.view(np.uint8).reshape(-1, width + 1)
+
+    valid = buffer[:, width] == 0
+    for position, byte in literals:
+        valid &= buffer[:, position] == byte
+    parts = {'month': 1, 'day': 1, 'hour': 0, 'minute': 0, 'second': 0}
+    for name, start, field_width in fields:
+        value = np.zeros(len(buffer), dtype='int64')
+        for position in range(start, start + field_width):
+            # Bytes below '0' wrap around so a single comparison checks the digit range
+            digit = buffer[:, position] - np.uint8(ord('0'))
+            valid &= digit <= 9
+            value = value * 10 + digit
+        parts[name] = value
+
+    # Check the ranges (the nanosecond range spans years 1677 to 2262)
+    year, month, day = parts['year'], parts['month'], parts['day']
+    valid &= (year > 1677) & (year < 2262) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31)
+    valid &= (parts['hour'] <= 23) & (parts['minute'] <= 59) & (parts['second'] <= 59)
+
+    # Build the dates with datetime64 arithmetic and reject days overflowing their month (e.g. 31/02)
+    months = np.where(valid, (year - 1970) * 12 + month - 1, 0).astype('datetime64[M]')
+    days = months.astype('datetime64[D]') + np.where(valid, day - 1, 0)
+    valid &= days.astype('datetime64[M]') == months
+    seconds = parts['hour'] * 3600 + parts['minute'] * 60 + parts['second']
+    result = days.astype('datetime64[ns]') + np.asarray(seconds * 1_000_000_000, dtype='timedelta64[ns]')
+    result[~valid] = np.datetime64('NaT')
+    return result
+
+
+def get_year_month(days):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_year_month (function): Function that converts days since 1970-01-01 to years and months of the Gregorian calendar with vectorized integer arithmetic (days are counted from 0000-03-01 so that leap days fall at the end of the 400-year eras and of the years)
+
+    --------------------
+    Parameters
+    --------------------
+    -> days (np.ndarray): int64 array of days since 1970-01-01
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): int64 array of years
+    -> (np.ndarray): int64 array of months (1 to 12)
+
+    """
+    days = days + 719_468
+    era = days // 146_097
+    day_of_era = days - era * 146_097
+    year_of_era = (day_of_era - day_of_era // 1_460 + day_of_era // 36_524 - day_of_era // 146_096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    # Months are counted from March so the month lengths follow a 153-day pattern
+    shifted_month = (5 * day_of_year + 2) // 153
+    month = np.where(shifted_month < 10, shifted_month + 3, shifted_month - 9)
+    year = year_of_era + era * 400 + (month <= 2)
+    return year, month
+
+
+def choose_date_bucket(span, target_bars=DATE_TARGET_BARS):
+    """
+    --------------------
+    Description
+    --------------------
+    -> choose_date_bucket (function): Function that picks the granularity of DATE_BUCKETS whose number of bars over the span of the dates is the closest to target_bars (ratio in log scale)
+
+    --------------------
+    Parameters
+    --------------------
+    -> span (int): Number of nanoseconds between the minimum and the maximum date
+    -> target_bars (int): Number of bars wanted
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Name of the granularity
+    
+    """
+    best_bucket, best_distance = None, None
+    for bucket, width, _ in DATE_BUCKETS:
+        n_bars = span / width + 1
+        distance = abs(np.log(n_bars / target_bars))
+        if best_distance is None or distance < best_distance:
+            best_bucket, best_distance = bucket, distance
+    return best_bucket
+
+
+def get_date_bucket_keys(nanoseconds, bucket):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_date_bucket_keys (function): Function that computes the number of the bucket of each date with integer arithmetic on the nanoseconds since 1970-01-01: hours, days, weeks (starting on Monday), months, quarters or years since 1970
+
+    --------------------
+    Parameters
+    --------------------
+    -> nanoseconds (np.ndarray): int64 array of nanoseconds since 1970-01-01 without missing values
+    -> bucket (str): Name of the granularity, one of DATE_BUCKETS
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): int64 array of bucket numbers
+
+    """
+    if bucket == 'hour':
+        return nanoseconds // NS_PER_HOUR
+    days = nanoseconds // NS_PER_DAY
+    if bucket == 'day':
+        return days
+    if bucket == 'week':
+        # 1970-01-01 is a Thursday: weeks are counted from Monday 1969-12-29
+        return (days + 3) // 7
+    year, month = get_year_month(days)
+    if bucket == 'month':
+        return (year - 1970) * 12 + month - 1
+    if bucket == 'quarter':
+        return (year - 1970) * 4 + (month - 1) // 3
+    if bucket == 'year':
+        return year - 1970
+    raise ValueError(f"Unknown date bucket '{bucket}'.")
+
+
+def get_date_bucket_starts(keys, bucket):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_date_bucket_starts (function): Function that converts bucket numbers computed by get_date_bucket_keys() back to the first date of each bucket
+
+    --------------------
+    Parameters
+    --------------------
+    -> keys (np.ndarray): int64 array of bucket numbers
+    -> bucket (str): Name of the granularity, one of DATE_BUCKETS
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): datetime64[ns] array
+
+    """
+    if bucket == 'hour':
+        starts = keys.astype('datetime64[h]')
+    elif bucket == 'day':
+        starts = keys.astype('datetime64[D]')
+    elif bucket == 'week':
+        starts = (keys * 7 - 3).astype('datetime64[D]')
+    elif bucket == 'month':
+        starts = keys.astype('datetime64[M]')
+    elif bucket == 'quarter':
+        starts = (keys * 3).astype('datetime64[M]')
+    else:
+        starts = keys.astype('datetime64[Y]')
+    return starts.astype('datetime64[ns]')
+
+
+def count_date_buckets(values, bucket=None, target_bars=DATE_TARGET_BARS):
+    """
+    --------------------
+    Description
+    --------------------
+    -> count_date_buckets (function): Function that counts the dates falling in each bucket of a granularity chosen from their span (see choose_date_bucket) so only the counts are sent to the chart.
+    The dates are counted per hour or per day with integer divisions of their int64 nanosecond representation and np.bincount. The daily counts are then summed per week, month, quarter or year (see get_date_bucket_keys), so the calendar arithmetic runs once per day of the span rather than once per date. Empty buckets between the first and the last one are included.
+
+    --------------------
+    Parameters
+    --------------------
+    -> values (pd.Series): Datetime serie (missing values are ignored)
+    -> bucket (str): Name of the granularity, one of DATE_BUCKETS. If None, it is chosen from the span of the dates
+    -> target_bars (int): Number of bars wanted when the granularity is chosen from the span
+
+    --------------------
+    Returns
+    --------------------
+    -> (str): Name of the granularity
+    -> (pd.DataFrame): Dataframe with 3 columns: start (first date of the bucket), label and count
+
+    """
+    nanoseconds = get_nanoseconds(values)
+    valid = nanoseconds != NAT_INT64
+    if not valid.all():
+        nanoseconds = nanoseconds[valid]
+    if len(nanoseconds) == 0:
+        return bucket or DATE_BUCKETS[-1][0], pd.DataFrame({'start': pd.Series(dtype='datetime64[ns]'), 'label': pd.Series(dtype=object), 'count': pd.Series(dtype='int64')})
+
+    if bucket is None:
+        bucket = choose_date_bucket(int(nanoseconds.max()) - int(nanoseconds.min()), target_bars)
+    if bucket == 'hour':
+        keys = nanoseconds // NS_PER_HOUR
+        first_key = keys.min()
+        counts = np.bincount(keys - first_key)
+    else:
+        days = nanoseconds // NS_PER_DAY
+        first_day = days.min()
+        day_counts = np.bincount(days - first_day)
+        # Bucket of each day of the span, then sum of the daily counts per bucket
+        day_keys = get_date_bucket_keys(np.arange(first_day, first_day + len(day_counts)) * NS_PER_DAY, bucket)
+        first_key = day_keys[0]
+        counts = np.bincount(day_keys - first_key, weights=day_counts).astype('int64')
+    starts = pd.DatetimeIndex(get_date_bucket_starts(np.arange(first_key, first_key + len(counts)), bucket))
+
+    label_format = {name: label_format for name, _, label_format in DATE_BUCKETS}[bucket]
+    labels = starts.strftime(label_format)
+    if bucket == 'quarter':
+        labels = labels + ((starts.month - 1) // 3 + 1).astype(str)
+    return bucket, pd.DataFrame({'start': starts, 'label': np.asarray(labels, dtype=object), 'count': counts})
+
+
+@instrument
 class DateColumn:
     """
     --------------------
@@ -13,6 +370,7 @@ class DateColumn:
     --------------------
     -> file_path (str): Path to the uploaded CSV file (optional)
     -> df (pd.Dataframe): Pandas dataframe (optional)
+    -> chunksize (int): Number of rows read at once in streaming mode. If set, the CSV file is read chunk by chunk instead of being loaded as a whole (optional)
     -> cols_list (list): List of columns names of dataset that are text type (default set to empty list)
     -> serie (pd.Series): Pandas serie where the content of a column has been loaded (default set to None)
     -> n_unique (int): Number of unique value of a serie (optional)
@@ -24,13 +382,23 @@ class DateColumn:
     -> n_future (int): Number of times a serie has dates falling in the future (optional)
     -> n_empty_1900 (int): Number of times a serie has dates equal to '1900-01-01' (optional)
     -> n_empty_1970 (int): Number of times a serie has dates equal to '1970-01-01' (optional)
-    -> barchart (int): Altair barchart displaying the count for each value of a serie (optional)
+    -> barchart (int): Altair barchart displaying the count of dates per bucket of a serie (optional)
+    -> bucket (str): Granularity of the buckets of the barchart, one of DATE_BUCKETS (default set to None)
     -> frequent (int): Dataframe containing the most frequest value of a serie (optional)
+    -> format_counts (dict): Number of values parsed with each date format during the last conversion, 'mixed' counting the values parsed one by one (default set to empty dict)
+    -> heavy_hitters (HeavyHitters): Approximate counts of the most frequent dates computed in streaming mode (default set to None)
+    -> codes (np.ndarray): Code of the date of each row (-1 for missing values) when the serie has been converted by parsing each distinct value once (default set to None)
+    -> uniques (pd.Index): Distinct dates the codes refer to (default set to None)
+    -> distinct_mode (str): Way of counting the unique values, one of common.sketches.DISTINCT_MODES. Streaming mode always uses the HyperLogLog sketch (default set to 'exact')
+    -> hll_error (float): Relative standard error of the HyperLogLog sketch (default set to DEFAULT_HLL_ERROR)
+    -> unique_error (float): Relative standard error of self.n_unique, None when it is exact (default set to None)
+    -> n_rows_total (int): Number of rows of the whole column when self.serie is a random sample of it, None otherwise (default set to None)
 
     """
-    def __init__(self, file_path=None, df=None):
+    def __init__(self, file_path=None, df=None, chunksize=None, distinct_mode='exact', hll_error=DEFAULT_HLL_ERROR):
         self.file_path = file_path
         self.df = df
+        self.chunksize = chunksize
         self.cols_list = []
         self.serie = None
         self.n_unique = None
@@ -43,14 +411,23 @@ class DateColumn:
         self.n_empty_1900 = None
         self.n_empty_1970 = None
         self.barchart = alt.Chart()
+        self.bucket = None
         self.frequent = pd.DataFrame(columns=['value', 'occurrence', 'percentage'])
+        self.format_counts = {}
+        self.heavy_hitters = None
+        self.codes = None
+        self.uniques = None
+        self.distinct_mode = distinct_mode
+        self.hll_error = hll_error
+        self.unique_error = None
+        self.n_rows_total = None
     
     def find_date_cols(self):
         """
         --------------------
         Description
         --------------------
-        -> find_date_cols (method): Class method that will load the uploaded CSV file as Pandas DataFrame and store it as attribute (self.df) if it hasn't been provided before.
+        -> find_date_cols (method): Class method that will create a common.lazy.LazyDataset from the uploaded CSV file and store it as attribute (self.df) if no dataframe has been provided before, so only the analysed column is read from the file.
         Then it will find all columns of datetime data type. If it can't find any datetime then it will look for all columns of text time. Then it will store the results in the relevant attribute (self.cols_list).
 
         --------------------
@@ -64,18 +441,21 @@ class DateColumn:
         -> None
         """ 
         if self.file_path is not None:
-            if self.df is None:
-                # Load the CSV file as a DataFrame if it hasn't been provided
-                self.df = pd.read_csv(self.file_path)
+            if self.df is None and self.chunksize is None:
+                # Only the header and the first rows are read, the analysed columns are read on demand
+                self.df = LazyDataset(self.file_path)
+
+            # In streaming mode only a sample of the CSV file is read to find the columns
+            df = read_csv_sample(self.file_path) if self.df is None else self.df
 
             # Find columns with datetime data type
-            date_cols = self.df.select_dtypes(include=['datetime64']).columns
+            date_cols = df.select_dtypes(include=['datetime64']).columns
 
             if not date_cols.empty:
                 self.cols_list = date_cols.tolist()
             else:
                 # If no datetime columns found, look for text columns that may contain date/time information
-                text_date_cols = self.df.select_dtypes(include=['object']).columns
+                text_date_cols = df.select_dtypes(include=['object', 'string', 'category']).columns
                 self.cols_list = text_date_cols.tolist()
         else:
             # Handle the case where file_path is None
@@ -91,6 +471,7 @@ class DateColumn:
         Description
         --------------------
         -> set_data (method): Class method that sets the self.serie attribute with the relevant column from the dataframe and then computes all requested information from self.serie to be displayed in the Date section of Streamlit app 
+        In streaming mode (self.chunksize set) the statistics are computed by self.set_data_chunked() instead.
 
         --------------------
         Parameters
@@ -103,26 +484,281 @@ class DateColumn:
         -> None
         
         """
+        if self.chunksize is not None:
+            # Check if the column name exists in the CSV file
+            if col_name not in self.cols_list:
+                raise ValueError(f"Column '{col_name}' not found in the CSV file.")
+            self.set_data_chunked(col_name)
+            return
+
         # Check if the column name exists in the DataFrame
         if col_name not in self.df.columns:
             raise ValueError(f"Column '{col_name}' not found in the DataFrame.")
         
         # Set self.serie to the specified column
         self.serie = self.df[col_name]
+        if isinstance(self.serie.dtype, pd.CategoricalDtype):
+            # Text encoded as category is decoded so the date formats are inferred and parsed like any text column
+            self.serie = self.serie.astype(self.serie.cat.categories.dtype)
+        self.heavy_hitters = None
+        self.codes = None
+        self.uniques = None
+        self.n_rows_total = None
         
 
-    def convert_serie_to_date(self):
+    def set_data_chunked(self, col_name):
         """
         --------------------
         Description
         --------------------
-        -> convert_serie_to_date (method): Class method that convert a Pandas Series to datetime data type and store the results in the relevant attribute (self.serie).
+        -> set_data_chunked (method): Class method that reads the relevant column of the CSV file chunk by chunk, converts each chunk to datetime and updates a common.streaming.DateAccumulator with it, so the memory used is bounded by self.chunksize.
+        Then it stores the results in the relevant attributes (self.n_missing, self.col_min, self.col_max, self.n_weekend, self.n_weekday, self.n_future, self.n_empty_1900, self.n_empty_1970). The number of unique values is estimated with the HyperLogLog sketch of the accumulator (self.unique_error) and the most frequent dates are approximated with a common.frequent.HeavyHitters summary stored in self.heavy_hitters.
+        self.serie is set to an empty serie named after the column.
 
         --------------------
         Parameters
         --------------------
+        -> col_name (str): Name of the column to be analysed
+
+        --------------------
+        Returns
+        --------------------
         -> None
 
+        """
+        accumulator = DateAccumulator(hll_error=self.hll_error)
+        self.heavy_hitters = HeavyHitters()
+        formats = None
+        format_counts = {}
+        for chunk in iter_csv_chunks(self.file_path, columns=[col_name], chunksize=self.chunksize):
+            self.serie = chunk[col_name]
+            # Infer the date formats on the first chunk only and reuse them for the next ones
+            if formats is None:
+                formats = self.infer_date_formats()
+            self.convert_serie_to_date(formats=formats)
+            for date_format, count in self.format_counts.items():
+                format_counts[date_format] = format_counts.get(date_format, 0) + count
+            accumulator.update(self.serie)
+            self.heavy_hitters.update(self.serie)
+        self.format_counts = format_counts
+
+        self.serie = pd.Series(dtype='datetime64[ns]', name=col_name)
+        self.codes = None
+        self.uniques = None
+        # Counts equal to 0 are reported as None like in the set_* methods
+        self.n_unique = accumulator.distinct.get_count()
+        self.unique_error = accumulator.distinct.get_error()
+        self.n_missing = accumulator.n_missing or None
+        self.col_min = accumulator.col_min
+        self.col_max = accumulator.col_max
+        self.n_weekend = accumulator.n_weekend or None
+        self.n_weekday = accumulator.n_weekday or None
+        self.n_future = accumulator.n_future or None
+        self.n_empty_1900 = accumulator.n_empty_1900 or None
+        self.n_empty_1970 = accumulator.n_empty_1970 or None
+        
+
+    def set_data_sample(self, col_name, sample_size=PROGRESSIVE_SAMPLE_SIZE):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_data_sample (method): Class method that sets the self.serie attribute with a uniform random sample of the relevant column from the dataframe (see common.progressive.sample_serie), to be converted to datetime like a whole column. The number of rows of the whole column is stored in self.n_rows_total.
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the column to be analysed
+        -> sample_size (int): Number of rows of the sample
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        self.set_data(col_name)
+        self.n_rows_total = len(self.serie)
+        self.serie = sample_serie(self.serie, sample_size)
+
+    def infer_date_formats(self, sample_size=FORMAT_SAMPLE_SIZE):
+        """
+        --------------------
+        Description
+        --------------------
+        -> infer_date_formats (method): Class method that samples evenly spaced values of self.serie and finds the dominant date format(s) among DATE_FORMATS.
+        The format parsing the most sampled values is selected first, then the values it parsed are removed from the sample and the search starts again until no format parses at least FORMAT_MIN_SHARE of the sample.
+
+        --------------------
+        Parameters
+        --------------------
+        -> sample_size (int): Maximum number of values sampled
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): Selected formats, from the most to the least frequent
+
+        """
+        values = self.serie.dropna()
+        if values.empty:
+            return []
+        # Evenly spaced positions give a deterministic sample covering the whole column
+        positions = np.unique(np.linspace(0, len(values) - 1, num=min(sample_size, len(values))).astype('int64'))
+        sample = values.iloc[positions].astype(str)
+
+        formats = []
+        min_hits = max(1, int(len(sample) * FORMAT_MIN_SHARE))
+        while not sample.empty:
+            best_format, best_parsed = None, None
+            for date_format in DATE_FORMATS:
+                if date_format in formats:
+                    continue
+                parsed = parse_fixed_width(sample.to_numpy(), date_format)
+                if parsed is None:
+                    parsed = pd.to_datetime(sample, format=date_format, errors='coerce').to_numpy()
+                parsed = ~np.isnat(parsed)
+                if best_parsed is None or parsed.sum() > best_parsed.sum():
+                    best_format, best_parsed = date_format, parsed
+            if best_parsed is None or best_parsed.sum() < min_hits:
+                break
+            formats.append(best_format)
+            sample = sample[~best_parsed]
+        return formats
+
+    def get_text_values(self, values):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_text_values (method): Class method that gives the values of a text serie to the vectorized date parser: Arrow-backed strings (string[pyarrow] dtype) are passed as their Arrow array without being converted to Python str objects, other series as a numpy array of str.
+
+        --------------------
+        Parameters
+        --------------------
+        -> values (pd.Series): Values without missing values
+
+        --------------------
+        Returns
+        --------------------
+        -> (np.ndarray or pa.Array): Values to be parsed
+
+        """
+        if pa is not None and isinstance(values.dtype, pd.StringDtype) and values.dtype.storage == 'pyarrow':
+            return to_arrow_strings(values)
+        return values.astype(str).to_numpy()
+
+    def is_repetitive(self, max_ratio=FACTORIZE_MAX_RATIO, sample_size=FACTORIZE_SAMPLE_SIZE):
+        """
+        --------------------
+        Description
+        --------------------
+        -> is_repetitive (method): Class method that estimates from evenly spaced values whether the ratio of distinct values to rows of self.serie is at most max_ratio, without hashing the whole serie.
+        A sample of m values drawn from D equally frequent values holds D * (1 - exp(-m / D)) distinct values on average: the serie is repetitive if the sample holds at most as many distinct values as a serie whose ratio is exactly max_ratio would give. Skewed columns give even fewer distinct values in the sample.
+
+        --------------------
+        Parameters
+        --------------------
+        -> max_ratio (float): Maximum ratio of distinct values to rows
+        -> sample_size (int): Maximum number of values sampled
+
+        --------------------
+        Returns
+        --------------------
+        -> (bool): True if the serie is estimated to be repetitive
+        
+        """
+        n_rows = len(self.serie)
+        if n_rows <= sample_size:
+            # The whole serie is hashed, the ratio is exact
+            values = self.serie.dropna()
+            return len(pd.unique(values)) <= max_ratio * len(values)
+        # Missing values are not counted, in the sample as in the rows
+        sample = self.serie.iloc[np.linspace(0, n_rows - 1, num=sample_size).astype('int64')].dropna()
+        if sample.empty:
+            return False
+        n_distinct_max = max_ratio * n_rows * len(sample) / sample_size
+        expected_distinct = n_distinct_max * -np.expm1(-len(sample) / n_distinct_max)
+        return len(pd.unique(sample)) <= expected_distinct
+
+    def parse_text_dates(self, serie, formats, weights=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> parse_text_dates (method): Class method that parses text values with the given formats using vectorized parsing, one format after the other. Only the values that none of these formats can parse go through the slow element-by-element 'mixed' parser.
+
+        --------------------
+        Parameters
+        --------------------
+        -> serie (pd.Series): Values to be parsed
+        -> formats (list): Date formats to be used
+        -> weights (np.ndarray): Number of rows holding each value of serie, used to count the rows parsed with each format (optional, one row per value by default)
+
+        --------------------
+        Returns
+        --------------------
+        -> (pd.Series): Parsed dates, with the index and name of serie
+        -> (dict): Number of rows parsed with each format, 'mixed' counting the values parsed one by one
+
+        """
+        def count_rows(selection):
+            # Number of rows of the selected values (positions or boolean mask)
+            if weights is None:
+                return int(np.count_nonzero(selection)) if selection.dtype == bool else len(selection)
+            return int(weights[selection].sum())
+
+        format_counts = {}
+        converted = np.full(len(serie), np.datetime64('NaT'), dtype='datetime64[ns]')
+        remaining = serie.notna().to_numpy()
+        for date_format in formats:
+            format_counts[date_format] = 0
+        for use_strptime in (False, True):
+            for date_format in formats:
+                if not remaining.any():
+                    break
+                values = serie[remaining]
+                parsed = None if use_strptime else parse_fixed_width(self.get_text_values(values), date_format)
+                if parsed is None:
+                    if not use_strptime and compile_fixed_width_format(date_format) is not None:
+                        continue
+                    # Formats that aren't fixed-width and the values the vectorized parser rejected (e.g. not zero-padded) go through pandas parsing with the fixed format
+                    parsed = pd.to_datetime(values, format=date_format, errors='coerce').to_numpy()
+                hits = ~np.isnat(parsed)
+                positions = np.flatnonzero(remaining)[hits]
+                converted[positions] = parsed[hits]
+                remaining[positions] = False
+                format_counts[date_format] += count_rows(positions)
+
+        if not sum(format_counts.values()):
+            # No format matched: keep the generic conversion of the whole serie
+            return pd.to_datetime(serie, format='mixed', dayfirst=True), {'mixed': count_rows(remaining)}
+        if remaining.any():
+            # Fall back to the slow element-by-element parsing for the values left, with the same day/month order as the dominant format
+            dayfirst = not formats[0].startswith('%m')
+            parsed = pd.to_datetime(serie[remaining], format='mixed', dayfirst=dayfirst)
+            if parsed.dtype != converted.dtype:
+                # Time zones or other units can't be merged with the naive dates: convert the whole serie
+                return pd.to_datetime(serie, format='mixed', dayfirst=True), {'mixed': count_rows(np.ones(len(serie), dtype=bool))}
+            converted[remaining] = parsed.to_numpy()
+            format_counts['mixed'] = count_rows(remaining)
+        return pd.Series(converted, index=serie.index, name=serie.name), format_counts
+
+    def convert_serie_to_date(self, formats=None, factorize=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> convert_serie_to_date (method): Class method that convert a Pandas Series to datetime data type and store the results in the relevant attribute (self.serie).
+        Text values are parsed with the format(s) found by self.infer_date_formats() (see self.parse_text_dates()). The number of values parsed with each format is stored in the relevant attribute (self.format_counts).
+        Repetitive text columns (estimated ratio of distinct values to rows up to FACTORIZE_MAX_RATIO, see self.is_repetitive()) are factorized first: only their distinct values are parsed and the dates are broadcast back to the rows through the integer codes. The codes of the dates are kept in the relevant attributes (self.codes, self.uniques) so self.set_unique(), self.set_date_stats() and self.set_frequent() don't hash the dates again.
+
+        --------------------
+        Parameters
+        --------------------
+        -> formats (list): Date formats to be used (optional, inferred from self.serie if not provided)
+        -> factorize (bool): Whether text values are parsed once per distinct value (optional, chosen from the estimated ratio of distinct values if not provided)
+
         --------------------
         Returns
         --------------------
@@ -130,9 +766,34 @@ class DateColumn:
 
         """
         if self.serie is not None and not self.serie.empty:
+            self.format_counts = {}
+            self.codes = None
+            self.uniques = None
+            if pd.api.types.is_datetime64_any_dtype(self.serie):
+                # Nothing to parse
+                return
+            is_text = pd.api.types.is_object_dtype(self.serie) or pd.api.types.is_string_dtype(self.serie)
+            if not is_text:
+                # Non text columns keep the generic conversion
+                formats = []
+            elif formats is None:
+                formats = self.infer_date_formats()
+
             try:
-                # Attempt to convert the Series to datetime
-                self.serie = pd.to_datetime(self.serie, format='mixed', dayfirst=True)
+                if factorize is None:
+                    factorize = is_text and self.is_repetitive()
+                if factorize and is_text:
+                    # Parse each distinct value once, then broadcast the dates through the codes (-1 for missing values)
+                    codes, uniques = pd.factorize(self.serie)
+                    weights = np.bincount(codes[codes >= 0], minlength=len(uniques))
+                    parsed, self.format_counts = self.parse_text_dates(pd.Series(uniques), formats, weights=weights)
+                    dates = pd.api.extensions.take(parsed.array, codes, allow_fill=True)
+                    self.serie = pd.Series(dates, index=self.serie.index, name=self.serie.name)
+                    # Different texts can give the same date (e.g. in two formats): the codes of the dates are derived from the codes of the texts
+                    date_codes, self.uniques = pd.factorize(parsed)
+                    self.codes = pd.api.extensions.take(date_codes, codes, allow_fill=True, fill_value=-1)
+                else:
+                    self.serie, self.format_counts = self.parse_text_dates(self.serie, formats)
             except (ValueError, pd.errors.OutOfBoundsDatetime) as e:
                 # Raise a custom exception with a descriptive error message
                 raise ValueError(f"Failed to convert the series to datetime: {e}")
@@ -160,12 +821,59 @@ class DateColumn:
         return self.serie is None or self.serie.empty
         
 
+    def set_date_stats(self, now=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_date_stats (method): Class method that computes together all the statistics displayed in the summary and store the results in the relevant attributes (self.n_unique, self.n_missing, self.n_weekend, self.n_weekday, self.n_future, self.n_empty_1900, self.n_empty_1970, self.col_min, self.col_max).
+        They are computed on the int64 view of the serie (see common.date_kernels.count_date_properties) without copying it, instead of one scan per statistic as in self.set_unique(), self.set_missing(), self.set_weekend(), self.set_weekday(), self.set_future(), self.set_empty_1900(), self.set_empty_1970(), self.set_min() and self.set_max(). Counts equal to 0 are reported as None like in these methods.
+        The number of unique values is exact when the distinct dates are known from the conversion, otherwise columns of more than common.sketches.HLL_MIN_ROWS rows are counted with a HyperLogLog sketch in approximate mode (self.distinct_mode) instead of being sorted.
+
+        --------------------
+        Parameters
+        --------------------
+        -> now (pd.Timestamp): Date after which dates are in the future (default set to today)
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if not self.is_serie_none():
+            now = pd.to_datetime('now').normalize() if now is None else now
+            counts = count_date_properties(self.serie, now)
+            self.unique_error = None
+            if self.codes is not None:
+                # The distinct dates are known from the conversion
+                self.n_unique = len(self.uniques)
+            elif self.distinct_mode == 'approximate' and len(self.serie) > HLL_MIN_ROWS:
+                sketch = HyperLogLog(error=self.hll_error)
+                sketch.update(self.serie)
+                self.n_unique = sketch.get_count()
+                self.unique_error = sketch.get_error()
+            else:
+                # Unique values are counted on the sorted int64 values (faster than a hash table for high cardinality dates), NaT coming first if there are missing values
+                sorted_values = np.sort(get_nanoseconds(self.serie))
+                self.n_unique = int(np.count_nonzero(sorted_values[1:] != sorted_values[:-1])) + 1 - (1 if counts['n_missing'] else 0)
+            self.n_missing = counts['n_missing'] or None
+            self.n_weekend = counts['n_weekend'] or None
+            self.n_weekday = counts['n_weekday'] or None
+            self.n_future = counts['n_future'] or None
+            self.n_empty_1900 = counts['n_empty_1900'] or None
+            self.n_empty_1970 = counts['n_empty_1970'] or None
+            self.col_min = counts['col_min']
+            self.col_max = counts['col_max']
+
+
     def set_unique(self):
         """
         --------------------
         Description
         --------------------
         -> set_unique (method): Class method that computes the number of unique value of a serie and store the results in the relevant attribute(self.n_unique).
+        If the serie has been converted by parsing each distinct value once, the distinct dates are already known (self.uniques). Otherwise columns of more than common.sketches.HLL_MIN_ROWS rows are counted with a HyperLogLog sketch in approximate mode (see common.sketches.count_distinct).
 
         --------------------
         Parameters
@@ -181,8 +889,10 @@ class DateColumn:
         # Check if the series is not empty
         if not self.is_serie_none():
             # Calculate the number of unique values in the series
-            number_unique = self.serie.nunique()
-            self.n_unique = number_unique
+            if self.codes is not None:
+                self.n_unique, self.unique_error = len(self.uniques), None
+            else:
+                self.n_unique, self.unique_error = count_distinct(self.serie, self.distinct_mode, self.hll_error)
             return self.n_unique
         
 
@@ -370,13 +1080,14 @@ class DateColumn:
         -> None
 
         """
-        # Count the number of times dates are equal to '1900-01-01'
-        number_empty_1900 = (self.serie == pd.to_datetime('1900-01-01')).sum()
-        if number_empty_1900 == 0:
-            self.n_weekend = None
-        else:
-            self.n_empty_1900 = number_empty_1900
-        return self.n_empty_1900
+        if not self.is_serie_none():
+            # Count the number of times dates are equal to '1900-01-01'
+            number_empty_1900 = (self.serie == pd.to_datetime('1900-01-01')).sum()
+            if number_empty_1900 == 0:
+                self.n_empty_1900 = None
+            else:
+                self.n_empty_1900 = number_empty_1900
+            return self.n_empty_1900
         
 
     def set_empty_1970(self):
@@ -408,17 +1119,19 @@ class DateColumn:
         
         
 
-    def set_barchart(self):  
+    def set_barchart(self, bucket=None, target_bars=DATE_TARGET_BARS):  
         """
         --------------------
         Description
         --------------------
-        -> set_barchart (method): Class method that computes the Altair barchart displaying the count for each value of a serie and store the results in the relevant attribute(self.barchart).
+        -> set_barchart (method): Class method that computes the Altair barchart displaying the count of dates per hour, day, week, month, quarter or year and store the results in the relevant attributes (self.barchart, self.bucket).
+        The granularity is chosen from the span of the dates so the chart has about target_bars bars, and the dates are counted per bucket beforehand (see count_date_buckets) so only the counts are sent to Altair.
 
         --------------------
         Parameters
         --------------------
-        -> None
+        -> bucket (str): Name of the granularity, one of DATE_BUCKETS. If None, it is chosen from the span of the dates
+        -> target_bars (int): Number of bars wanted when the granularity is chosen from the span
 
         --------------------
         Returns
@@ -427,18 +1140,16 @@ class DateColumn:
 
         """
         if not self.is_serie_none():
-            # Extract the year from the datetime values
-            years = self.serie.dt.year
-            # Compute value counts for the series
-            year_counts = years.value_counts().reset_index()
-            year_counts.columns = ['year', 'count']
+            # Count the dates per bucket on their int64 representation
+            self.bucket, bucket_counts = count_date_buckets(self.serie, bucket=bucket, target_bars=target_bars)
             
-            # Create a barchart using Altair
-            barchart = alt.Chart(year_counts)
+            # Create a barchart using Altair, the bars keep the order of the buckets
+            barchart = alt.Chart(bucket_counts[['label', 'count']])
             barchart = barchart.mark_bar()
             barchart = barchart.encode(
-                x=alt.X('year:O', title='Date', axis=alt.Axis(labelAngle=0)),
-                y=alt.Y('count:Q', title='Count of Records')
+                x=alt.X('label:O', title=f'Date (per {self.bucket})', sort=None),
+                y=alt.Y('count:Q', title='Count of Records'),
+                tooltip=[alt.Tooltip('label:O', title=self.bucket.capitalize()), alt.Tooltip('count:Q', title='Count of Records')]
             )
             # Store the Altair chart in the self.barchart attribute
             self.barchart = barchart
@@ -451,6 +1162,8 @@ class DateColumn:
         Description
         --------------------
         -> set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie and store the results in the relevant attribute(self.frequent).
+        Only the end largest counts are selected (see common.frequent.get_top_k) instead of sorting the counts of all distinct values. In streaming mode they are estimated from self.heavy_hitters.
+        If the serie has been converted by parsing each distinct value once, its codes are counted directly (as a categorical) instead of hashing the dates again.
 
         --------------------
         Parameters
@@ -465,20 +1178,18 @@ class DateColumn:
 
         """
         if self.serie is not None:
-            # Calculate the value counts of the series
-            serie_counts = self.serie.value_counts()
-            # Create a DataFrame to store the results
-            self.frequent = pd.DataFrame({'value': serie_counts.index, 'occurrence': serie_counts.values})
-        
+            if self.serie.empty and self.heavy_hitters is not None:
+                # In streaming mode the occurrences are estimated from the heavy hitters summary
+                self.frequent = self.heavy_hitters.get_top_k(end)
+                total_occurrences = self.heavy_hitters.n - (self.n_missing or 0)
+            else:
+                # Select the 'end' most frequent values without sorting the counts of all distinct values
+                values = self.serie if self.codes is None else pd.Categorical.from_codes(self.codes, self.uniques)
+                self.frequent = get_top_k(values, end)
+                total_occurrences = self.serie.count()
+
             # Calculate the percentage frequency
-            total_occurrences = self.frequent['occurrence'].sum()
-            self.frequent['percentage'] = (self.frequent['occurrence'] / total_occurrences).round(4)
-        
-            # Sort the DataFrame by occurrence in descending order
-            self.frequent = self.frequent.sort_values(by='occurrence', ascending=False)
-        
-            # Display the top 'end' most frequent values
-            self.frequent = self.frequent.head(end)
+            self.frequent['percentage'] = (self.frequent['occurrence'] / max(total_occurrences, 1)).round(4)
             return self.frequent
         
 
@@ -501,20 +1212,120 @@ class DateColumn:
 
         """
         if self.serie is not None:
+            if not self.is_serie_none():
+                # Compute the statistics from the loaded serie (in streaming mode they have already been computed chunk by chunk)
+                self.set_date_stats()
+
             # Create a summary Dictionary
             summary_data = {
-                "Number of Unique Values": [self.set_unique()],
-                "Number of Rows with Missing Values": [self.set_missing()],
-                "Number of Weekend Dates": [self.set_weekend()],
-                "Number of Weekday Dates": [self.set_weekday()],
-                "Number of Dates in Future": [self.set_future()],
-                "Number of Rows with 1900-01-01": [self.set_empty_1900()],
-                "Number of Rows with 1970-01-01": [self.set_empty_1970()],
-                "Minimum Value": [str(self.set_min())],
-                "Maximum Value": [str(self.set_max())],
+                "Number of Unique Values": [format_distinct_count(self.n_unique, self.unique_error)],
+                "Number of Rows with Missing Values": [self.n_missing],
+                "Number of Weekend Dates": [self.n_weekend],
+                "Number of Weekday Dates": [self.n_weekday],
+                "Number of Dates in Future": [self.n_future],
+                "Number of Rows with 1900-01-01": [self.n_empty_1900],
+                "Number of Rows with 1970-01-01": [self.n_empty_1970],
+                "Minimum Value": [str(self.col_min)],
+                "Maximum Value": [str(self.col_max)],
             }
 
             summary_table = pd.DataFrame(summary_data).T.reset_index()
             summary_table.columns = ["Description", "Value"]
             summary_table["Value"] = summary_table["Value"].astype(str)
-            return summary_table
\ No newline at end of file
+            return summary_table
+
+    def get_sample_summary(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_sample_summary (method): Class method that computes the statistics of a random sample converted to datetime (see self.set_data_sample()) and formats them as estimates for the whole column, in the same layout as self.get_summary().
+        Numbers of rows are scaled to the whole column with a Wilson interval (95% confidence). The sample only bounds the number of unique values, the minimum and the maximum.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (pd.DataFrame): Formatted dataframe to be displayed on the Streamlit app
+
+        """
+        self.set_date_stats()
+        n_sample = len(self.serie)
+        n_rows = self.n_rows_total
+
+        def estimate(count):
+            # Counts equal to 0 are stored as None
+            return format_interval(*get_proportion_interval(count or 0, n_sample, n_rows), integer=True)
+
+        summary_data = {
+            "Number of Unique Values": f"at least {self.n_unique} (sample)",
+            "Number of Rows with Missing Values": estimate(self.n_missing),
+            "Number of Weekend Dates": estimate(self.n_weekend),
+            "Number of Weekday Dates": estimate(self.n_weekday),
+            "Number of Dates in Future": estimate(self.n_future),
+            "Number of Rows with 1900-01-01": estimate(self.n_empty_1900),
+            "Number of Rows with 1970-01-01": estimate(self.n_empty_1970),
+            "Minimum Value": f"at most {self.col_min} (sample)",
+            "Maximum Value": f"at least {self.col_max} (sample)",
+            "Sample": f"Random sample of {n_sample} rows out of {n_rows} (95% confidence intervals)",
+        }
+        return pd.DataFrame({"Description": list(summary_data), "Value": list(summary_data.values())})
+
+    def get_sample_profile(self, col_name, sample_size=PROGRESSIVE_SAMPLE_SIZE):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_sample_profile (method): Class method that converts a uniform random sample of the rows of a column to datetime and computes a first profile from it (summary with confidence intervals, most frequent values, barchart per time bucket and number of sampled rows parsed with each format), displayed while the exact profile is computed by self.get_profile()
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the datetime column to be analysed
+        -> sample_size (int): Number of rows of the sample
+
+        --------------------
+        Returns
+        --------------------
+        -> (ColumnProfile): Profile of the sample, with its size (sample_size) and the number of rows of the column (n_rows) in its details
+
+        """
+        self.set_data_sample(col_name, sample_size)
+        # Raises a ValueError if the column can't be converted to datetime
+        self.convert_serie_to_date()
+        details = {'format_counts': dict(self.format_counts), 'distinct_mode': self.distinct_mode, 'sample_size': len(self.serie), 'n_rows': self.n_rows_total}
+        return ColumnProfile('date', col_name, self.get_sample_summary(), self.set_frequent(), charts={'bar': self.set_barchart()}, details=details)
+
+    def get_profile(self, col_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_profile (method): Class method that converts a column to datetime and computes everything displayed for it in the Datetime tab (summary, most frequent values, barchart per time bucket and number of rows parsed with each format) and gathers it into a common.profile_store.ColumnProfile
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the datetime column to be analysed
+
+        --------------------
+        Returns
+        --------------------
+        -> (ColumnProfile): Profile of the column
+
+        """
+        self.set_data(col_name)
+        # Raises a ValueError if the column can't be converted to datetime
+        self.convert_serie_to_date()
+        return ColumnProfile(
+            'date',
+            col_name,
+            self.get_summary(),
+            self.set_frequent(),
+            charts={'bar': self.set_barchart()},
+            details={'format_counts': dict(self.format_counts), 'distinct_mode': self.distinct_mode},
+        )
@@ -1,8 +1,9 @@
 import streamlit as st
 
-from tab_df.logics import Dataset
+from tab_df.logics import Dataset, MEMORY_MODES
+from common.instrumentation import record_stage, get_performance_table
 
-def display_tab_df_content(file_path):
+def display_tab_df_content(file_path, chunksize=None, lazy=False):
     """
     --------------------
     Description
@@ -10,14 +11,18 @@ def display_tab_df_content(file_path):
     -> display_overall_df (function): Function that will instantiate tab_df.logics.Dataset class, save it into Streamlit session state and call its tab_df.logics.Dataset.set_data() method in order to compute all information to be displayed.
     Then it will display a Streamlit Expander container with the following contents:
     1. the results of tab_df.logics.Dataset.get_summary() as a Streamlit Table
-    2. the results of tab_df.logics.Dataset.table using Streamlit.write()
+    2. the results of tab_df.logics.Dataset.table using Streamlit.write(), with the memory used by the text columns as Python objects and as Arrow strings in deep mode and the memory used before compacting the dtypes
     Finally it will display a second Streamlit Expander container with a slider to select the number of rows to be displayed and a radio button to select the method (head, tail, sample).
     According to the values selected on the slider and radio button, display the subset of the dataframe accordingly using Streamlit.dataframe
+    Finally, when the performance details are enabled (show_performance in Streamlit session state), it will display a Performance expander with the stages recorded by the instance (see common.instrumentation.get_performance_table), including the time spent rendering the expander.
+    The overview is computed once per uploaded dataset (the Dataset instance is cached with it) and the time spent in each part is displayed below the summary, with the engine that parsed the CSV file and its throughput.
     
     --------------------
     Parameters
     --------------------
     -> file_path (str): File path to uploaded CSV file
+    -> chunksize (int): Number of rows per chunk in streaming mode, where the dataframe isn't loaded (optional)
+    -> lazy (bool): Flag stating if the columns are loaded on demand, where the dataframe isn't loaded either (optional)
 
     --------------------
     Returns
@@ -25,3 +30,58 @@ def display_tab_df_content(file_path):
     -> None
     
     """
+    if chunksize is not None:
+        st.info("The DataFrame tab needs the CSV file to be loaded in memory (streaming mode off).")
+        return
+    if lazy:
+        st.info("The DataFrame tab needs the CSV file to be loaded in memory (columns on demand off).")
+        return
+
+    # Reuse the Dataset instance cached with the uploaded dataset so the overview is only computed once
+    cached_dataset = st.session_state.get("cached_dataset")
+    dataset = cached_dataset.dataset if cached_dataset is not None else st.session_state.get("dataset")
+    if dataset is None:
+        dataset = Dataset(file_path)
+    st.session_state.dataset = dataset
+    if not dataset.timings:
+        dataset.set_data()
+
+    with record_stage(dataset, "streamlit.render"), st.expander("DataFrame", expanded=True):
+        st.table(dataset.get_summary())
+
+        # Only the memory usage has to be computed again when the accounting of object columns changes
+        memory_mode = st.radio("Memory usage of text columns", MEMORY_MODES, horizontal=True)
+        if memory_mode != dataset.memory_mode:
+            dataset.memory_mode = memory_mode
+            dataset.run_timed('table', dataset.set_table)
+        st.write("Columns")
+        st.write(dataset.table)
+        st.caption(f"Total memory usage ({dataset.memory_mode}): {dataset.table['memory_bytes'].sum() / 1024 ** 2:.1f} MB")
+        if 'loaded_bytes' in dataset.table:
+            # Memory saved by the compact dtypes (see the loaded_data_type and loaded_bytes columns)
+            st.caption(f"Compact dtypes ({dataset.memory_mode}): {dataset.table['loaded_bytes'].sum() / 1024 ** 2:.1f} MB as parsed, {dataset.table['memory_bytes'].sum() / 1024 ** 2:.1f} MB once compacted")
+        if dataset.table['object_bytes'].notna().any():
+            # Footprint of the text columns with both storages (see the object_bytes and arrow_bytes columns)
+            st.caption(f"Text columns: {dataset.table['object_bytes'].sum() / 1024 ** 2:.1f} MB as Python objects, {dataset.table['arrow_bytes'].sum() / 1024 ** 2:.1f} MB as Arrow strings (storage: {dataset.string_storage})")
+
+        st.write("Computation Time")
+        st.table(dataset.get_timings())
+        if dataset.ingestion is not None:
+            # Engine that parsed the CSV file (not set when the dataset was read back from the disk cache)
+            ingestion = dataset.ingestion
+            fallback = f" (fallback from {dataset.csv_engine}: {ingestion['fallback']})" if ingestion['fallback'] else ""
+            st.caption(f"CSV parsed by {ingestion['engine']} on {ingestion['n_threads']} thread(s){fallback}: {ingestion['n_bytes'] / 1024 ** 2:.1f} MB in {ingestion['seconds']:.2f} s ({ingestion['throughput'] or 0:.1f} MB/s)")
+
+    with st.expander("Explore DataFrame", expanded=True):
+        n_rows = st.slider("Number of rows to be displayed", min_value=1, max_value=max(1, min(50, dataset.n_rows)), value=min(5, max(1, dataset.n_rows)))
+        method = st.radio("Method", ["head", "tail", "sample"], horizontal=True)
+        if method == "head":
+            st.dataframe(dataset.get_head(n_rows))
+        elif method == "tail":
+            st.dataframe(dataset.get_tail(n_rows))
+        else:
+            st.dataframe(dataset.get_sample(n_rows))
+
+    if st.session_state.get("show_performance"):
+        with st.expander("Performance"):
+            st.table(get_performance_table(dataset))
@@ -1,6 +1,21 @@
+import time
+
+import numpy as np
 import pandas as pd
 
+from common.text_kernels import convert_text_columns, get_string_memory
+from common.dtypes import optimize_dtypes, get_loaded_memory
+from common.ingest import ingest_csv, DEFAULT_CSV_ENGINE
+from common.instrumentation import instrument
+
+# Ways of accounting the memory used by object columns: shallow only counts the pointers, deep also measures the Python objects they point to
+MEMORY_MODES = ['shallow', 'deep']
+
+# Storages of the text columns of the loaded dataframe: python keeps one Python str object per value (object dtype), pyarrow keeps all the values of a column in Arrow buffers (string[pyarrow] dtype)
+STRING_STORAGES = ['python', 'pyarrow']
 
+
+@instrument
 class Dataset:
     """
     --------------------
@@ -21,9 +36,25 @@ class Dataset:
     -> n_num_cols (int): Number of columns that are numeric type (default set to 0)
     -> n_text_cols (int): Number of columns that are text type (default set to 0)
     -> table (pd.Series): Pandas DataFrame containing the list of columns, their data types and memory usage from dataframe (default set to None)
+    -> memory_mode (str): Memory accounting of object columns in self.table, one of MEMORY_MODES (default set to 'shallow')
+    -> string_storage (str): Storage of the text columns when the CSV file is loaded, one of STRING_STORAGES (default set to 'python')
+    -> compact_dtypes (bool): Flag stating if numeric columns are downcast and low-cardinality text columns encoded as category when the CSV file is loaded (default set to False)
+    -> loaded_dtypes (pd.Series): Data types of the columns as parsed from the CSV file, before being made compact (default set to None)
+    -> csv_engine (str): Engine parsing the CSV file, one of common.ingest.CSV_ENGINES (default set to DEFAULT_CSV_ENGINE)
+    -> ingestion (dict): Engine actually used, parsing time and throughput of the CSV file as returned by common.ingest.ingest_csv() (default set to None until the CSV file is parsed)
+    -> missing_counts (pd.Series): Number of missing values of each column (default set to None)
+    -> timings (dict): Wall time in seconds of each part of the overview, stored by part name (default set to empty dict)
     """
-    def __init__(self, file_path):
+    def __init__(self, file_path, memory_mode='shallow', string_storage='python', compact_dtypes=False, csv_engine=DEFAULT_CSV_ENGINE):
         self.file_path = file_path
+        self.memory_mode = memory_mode
+        self.string_storage = string_storage
+        self.compact_dtypes = compact_dtypes
+        self.csv_engine = csv_engine
+        self.loaded_dtypes = None
+        self.ingestion = None
+        self.missing_counts = None
+        self.timings = {}
         self.df = None
         self.cols_list = []
         self.n_rows = 0
@@ -40,6 +71,7 @@ class Dataset:
         Description
         --------------------
         -> set_data (method): Class method that computes all requested information from self.df to be displayed in the Dataframe tab of Streamlit app 
+        Each part is timed by self.run_timed() so the time spent in each of them is available in self.timings.
 
         --------------------
         Parameters
@@ -51,6 +83,58 @@ class Dataset:
         --------------------
         -> None
         """
+        self.timings = {}
+        self.run_timed('load', self.set_df)
+        self.run_timed('columns', self.set_columns)
+        self.run_timed('dimensions', self.set_dimensions)
+        self.run_timed('duplicates', self.set_duplicates)
+        self.run_timed('missing', self.set_missing)
+        self.run_timed('numeric', self.set_numeric)
+        self.run_timed('text', self.set_text)
+        self.run_timed('table', self.set_table)
+
+    def run_timed(self, name, method):
+        """
+        --------------------
+        Description
+        --------------------
+        -> run_timed (method): Class method that calls a method without parameters and stores its wall time in seconds in the relevant attribute (self.timings)
+
+        --------------------
+        Parameters
+        --------------------
+        -> name (str): Name of the part of the overview
+        -> method (callable): Method to be called
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        start = time.perf_counter()
+        method()
+        self.timings[name] = time.perf_counter() - start
+
+    def get_timings(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_timings (method): Class method that formats the wall time of each part of the overview as a Pandas dataframe with 2 columns: Part and Seconds
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (pd.DataFrame): Formatted dataframe to be displayed on the Streamlit app
+
+        """
+        return pd.DataFrame({'Part': list(self.timings), 'Seconds': [round(seconds, 4) for seconds in self.timings.values()]})
         
         
     def set_df(self):
@@ -59,6 +143,9 @@ class Dataset:
         Description
         --------------------
         -> set_df (method): Class method that will load the uploaded CSV file as Pandas DataFrame and store it as attribute (self.df) if it hasn't been provided before.
+        The CSV file is parsed by self.csv_engine (see common.ingest.ingest_csv), which falls back to the pandas parser when needed; the engine used and the throughput are stored in self.ingestion.
+        With compact dtypes, numeric columns are downcast and low-cardinality text columns encoded as category (see common.dtypes.optimize_dtypes); the data types of the columns as parsed are kept in self.loaded_dtypes.
+        With the pyarrow string storage, the remaining text columns are converted to the Arrow-backed string dtype (see common.text_kernels.convert_text_columns), unless the pyarrow engine already returned them as Arrow strings.
 
         --------------------
         Parameters
@@ -71,6 +158,14 @@ class Dataset:
         -> None
 
         """
+        if self.df is None:
+            # Text columns to be made compact are encoded from Python objects, the others can be kept as parsed by pyarrow
+            self.df, self.ingestion = ingest_csv(self.file_path, engine=self.csv_engine, string_storage='python' if self.compact_dtypes else self.string_storage)
+            if self.compact_dtypes:
+                self.loaded_dtypes = self.df.dtypes.copy()
+                optimize_dtypes(self.df)
+            if self.string_storage == 'pyarrow':
+                convert_text_columns(self.df)
         
 
     def is_df_none(self):
@@ -91,6 +186,7 @@ class Dataset:
         -> (bool): Flag stating if self.df is empty or not
 
         """
+        return self.df is None or self.df.empty
         
 
     def set_columns(self):
@@ -111,6 +207,8 @@ class Dataset:
         -> None
 
         """
+        if not self.is_df_none():
+            self.cols_list = self.df.columns.tolist()
         
 
     def set_dimensions(self):
@@ -131,6 +229,8 @@ class Dataset:
         -> None
 
         """
+        if not self.is_df_none():
+            self.n_rows, self.n_cols = self.df.shape
         
 
     def set_duplicates(self):
@@ -139,6 +239,9 @@ class Dataset:
         Description
         --------------------
         -> set_duplicates (method): Class method that computes the number of duplicated of self.df and store the results in the relevant attribute (self.n_duplicates) if self.df is not empty nor None 
+        Each row is reduced to a single 64-bit hash of all its values, built column by column (pd.util.hash_pandas_object), and the duplicated hashes are found with one hash table lookup per row instead of comparing the rows.
+        Rows whose partial hash is already unique can't be duplicates, so they are dropped from the next columns: on high-cardinality data only the first columns are hashed for most rows. The check is repeated after the next column while it removes most rows, otherwise after twice as many columns.
+        Two different rows would only be counted as duplicates if their hashes collided (probability of about n_rows ** 2 / 2 ** 65).
 
         --------------------
         Parameters
@@ -151,6 +254,26 @@ class Dataset:
         -> None
 
         """
+        if not self.is_df_none():
+            positions = None
+            row_hashes = np.zeros(len(self.df), dtype='uint64')
+            next_check = 1
+            for i in range(self.df.shape[1]):
+                serie = self.df.iloc[:, i] if positions is None else self.df.iloc[positions, i]
+                # Combine the hash of the column with the hash of the previous ones (different multiplier for each column)
+                row_hashes = (row_hashes ^ pd.util.hash_pandas_object(serie, index=False).to_numpy()) * np.uint64(1000003 + 2 * i)
+                if i + 1 < next_check:
+                    continue
+                candidates = pd.Series(row_hashes).duplicated(keep=False).to_numpy()
+                n_candidates = int(np.count_nonzero(candidates))
+                if n_candidates == 0:
+                    self.n_duplicates = 0
+                    return
+                if n_candidates < candidates.size:
+                    positions = np.flatnonzero(candidates) if positions is None else positions[candidates]
+                    row_hashes = row_hashes[candidates]
+                next_check = i + 2 if n_candidates <= candidates.size // 2 else 2 * (i + 1)
+            self.n_duplicates = int(pd.Series(row_hashes).duplicated().sum())
         
 
     def set_missing(self):
@@ -159,6 +282,7 @@ class Dataset:
         Description
         --------------------
         -> set_missing (method): Class method that computes the number of missing values of self.df and store the results in the relevant attribute (self.n_missing) if self.df is not empty nor None 
+        The missing values are counted per column with a single isna() reduction, kept in self.missing_counts for self.set_table().
 
         --------------------
         Parameters
@@ -171,6 +295,9 @@ class Dataset:
         -> None
 
         """
+        if not self.is_df_none():
+            self.missing_counts = self.df.isna().sum()
+            self.n_missing = int(self.missing_counts.sum())
         
 
     def set_numeric(self):
@@ -191,6 +318,8 @@ class Dataset:
         -> None
 
         """
+        if not self.is_df_none():
+            self.n_num_cols = int(sum(pd.api.types.is_numeric_dtype(dtype) for dtype in self.df.dtypes))
         
 
     def set_text(self):
@@ -211,6 +340,8 @@ class Dataset:
         -> None
 
         """
+        if not self.is_df_none():
+            self.n_text_cols = int(sum(pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype) for dtype in self.df.dtypes))
         
 
     def get_head(self, n=5):
@@ -231,6 +362,8 @@ class Dataset:
         -> (Pandas.DataFrame): First rows of dataframe
 
         """
+        if not self.is_df_none():
+            return self.df.head(n)
         
 
     def get_tail(self, n=5):
@@ -251,6 +384,8 @@ class Dataset:
         -> (Pandas.DataFrame): Last rows of dataframe
 
         """
+        if not self.is_df_none():
+            return self.df.tail(n)
         
 
     def get_sample(self, n=5):
@@ -271,6 +406,8 @@ class Dataset:
         -> (Pandas.DataFrame): Sampled dataframe
 
         """
+        if not self.is_df_none():
+            return self.df.sample(min(n, len(self.df)))
         
 
 
@@ -280,6 +417,9 @@ class Dataset:
         Description
         --------------------
         -> set_table (method): Class method that computes the Dataframe containing the list of columns with their data types and memory usage and store the results in the relevant attribute (self.table) if self.df is not empty nor None
+        The memory usage of object columns is shallow (pointers only, no scan) or deep (size of every Python object) according to self.memory_mode. The number of missing values of each column comes from self.missing_counts.
+        In deep mode the memory used by each text column is also reported both as Python objects and as Arrow strings (see common.text_kernels.get_string_memory), whatever its current storage.
+        With compact dtypes, the data type and memory of each column as parsed from the CSV file are reported next to the current ones (see common.dtypes.get_loaded_memory).
 
         --------------------
         Parameters
@@ -292,6 +432,24 @@ class Dataset:
         -> None
 
         """
+        if not self.is_df_none():
+            memory_usage = self.df.memory_usage(index=False, deep=self.memory_mode == 'deep')
+            self.table = pd.DataFrame({
+                'column': self.df.columns.astype(str),
+                'data_type': self.df.dtypes.astype(str).to_numpy(),
+                'missing_values': self.missing_counts.to_numpy() if self.missing_counts is not None else np.nan,
+                'memory_bytes': memory_usage.to_numpy(),
+                'object_bytes': np.nan,
+                'arrow_bytes': np.nan,
+            })
+            if self.loaded_dtypes is not None:
+                self.table['loaded_data_type'] = self.loaded_dtypes.astype(str).to_numpy()
+                self.table['loaded_bytes'] = [get_loaded_memory(self.df.iloc[:, i], loaded_dtype, deep=self.memory_mode == 'deep') for i, loaded_dtype in enumerate(self.loaded_dtypes)]
+            if self.memory_mode == 'deep':
+                for i, dtype in enumerate(self.df.dtypes):
+                    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+                        object_bytes, arrow_bytes = get_string_memory(self.df.iloc[:, i])
+                        self.table.loc[i, ['object_bytes', 'arrow_bytes']] = [object_bytes, arrow_bytes]
 
 
     def get_summary(self):
@@ -307,3 +465,12 @@ class Dataset:
         -> (pd.DataFrame): Formatted dataframe to be displayed on the Streamlit app
 
         """
+        summary_data = {
+            "Number of Rows": self.n_rows,
+            "Number of Columns": self.n_cols,
+            "Number of Duplicated Rows": self.n_duplicates,
+            "Number of Missing Values": self.n_missing,
+            "Number of Numeric Columns": self.n_num_cols,
+            "Number of Text Columns": self.n_text_cols,
+        }
+        return pd.DataFrame({"Description": list(summary_data), "Value": [str(value) for value in summary_data.values()]})
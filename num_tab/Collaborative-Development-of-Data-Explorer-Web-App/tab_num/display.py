@@ -1,22 +1,92 @@
 import streamlit as st
+import pandas as pd
 
-from tab_num.logics import NumericColumn
+from tab_num.logics import NumericColumn, BIN_METHODS, QUANTILE_MODES
+from common.instrumentation import record_stage, get_performance_table
+from common.progressive import PROGRESSIVE_MIN_ROWS
 
-def display_tab_num_content(file_path=None, df=None):
-    numeric_col = NumericColumn(df=df)
-    numeric_col.find_num_cols()
+def display_tab_num_content(file_path=None, df=None, chunksize=None):
+    # Reuse the NumericColumn instance cached with the uploaded dataset so its results survive reruns
+    cached_dataset = st.session_state.get("cached_dataset")
+    profile_store = st.session_state.get("profile_store")
+    dataset_key = cached_dataset.key if cached_dataset is not None and profile_store is not None else None
+    numeric_col = cached_dataset.columns.get("num_column") if cached_dataset is not None else None
+    if numeric_col is None or numeric_col.chunksize != chunksize:
+        numeric_col = NumericColumn(file_path=file_path, df=df, chunksize=chunksize)
+        if dataset_key is not None:
+            # Profiles computed in the other mode (streaming or not) are not valid anymore
+            profile_store.invalidate(dataset_key, kind='num')
+        if cached_dataset is not None:
+            cached_dataset.columns["num_column"] = numeric_col
+
+        # Find numeric columns (or reuse the list stored for this dataset)
+        cols_list = profile_store.get_columns(dataset_key, 'num') if dataset_key is not None else None
+        if cols_list is None:
+            numeric_col.find_num_cols()
+            if dataset_key is not None:
+                profile_store.put_columns(dataset_key, 'num', numeric_col.cols_list)
+        else:
+            numeric_col.cols_list = cols_list
+    st.session_state.num_column = numeric_col
     selected_numcol = st.selectbox('Which numeric column do you want to explore', numeric_col.cols_list)
-    numeric_col.set_data(selected_numcol)
-    with st.expander("Numeric Column"):
-        num_summary = numeric_col.get_summary()
-        st.table(num_summary)
-        numeric_col.set_histogram()
-        num_histogram = numeric_col.histogram
-        st.altair_chart(num_histogram, use_container_width=True)
-        numeric_col.set_frequent()
-        num_frequent = numeric_col.frequent
+    st.session_state.selected_num_col = selected_numcol
+    # Quantiles are either exact or estimated from a mergeable sketch (always the case in streaming mode)
+    numeric_col.quantile_mode = st.radio('Quantiles', QUANTILE_MODES, horizontal=True)
+    numeric_col.distinct_mode = st.session_state.get("distinct_mode") or 'exact'
+
+    def is_current(profile):
+        return profile is not None and profile.details.get('quantile_mode') == numeric_col.quantile_mode and profile.details.get('distinct_mode') == numeric_col.distinct_mode
+
+    # Compute the profile of the column only if it hasn't been stored before with the same quantile and distinct-count modes
+    profile = profile_store.get(dataset_key, selected_numcol, 'num') if dataset_key is not None else None
+    if not is_current(profile):
+        # In progressive mode the profile of a random sample is displayed until the exact one has been computed in the background
+        refiner = st.session_state.get("refiner")
+        progressive = st.session_state.get("progressive") and refiner is not None and dataset_key is not None and chunksize is None and selected_numcol is not None
+        profile = refiner.get_sample(dataset_key, selected_numcol, 'num') if progressive else None
+        if not is_current(profile):
+            try:
+                if progressive and len(numeric_col.df[selected_numcol]) >= PROGRESSIVE_MIN_ROWS:
+                    profile = numeric_col.get_sample_profile(selected_numcol)
+                    # The background thread gets its own instance and only the selected column
+                    exact_col = NumericColumn(df=numeric_col.df[selected_numcol].to_frame(), quantile_mode=numeric_col.quantile_mode, distinct_mode=numeric_col.distinct_mode)
+                    refiner.start(dataset_key, profile, exact_col.get_profile, selected_numcol)
+                else:
+                    profile = numeric_col.get_profile(selected_numcol)
+                    if dataset_key is not None:
+                        profile_store.put(dataset_key, profile)
+            except ValueError as e:
+                st.error(str(e))
+                return
+            # Columns on demand are classified from the first rows of the file: a column holding text further down is moved to the text columns
+            if selected_numcol is not None and chunksize is None and not pd.api.types.is_numeric_dtype(numeric_col.df.dtypes[selected_numcol]):
+                st.warning(f"{selected_numcol} holds values that aren't numbers after the first rows: they are counted as missing values here and the column is now listed in the Text tab.")
+                numeric_col.cols_list = [col_name for col_name in numeric_col.cols_list if col_name != selected_numcol]
+                if dataset_key is not None:
+                    profile_store.put_columns(dataset_key, 'num', numeric_col.cols_list)
+                    text_cols_list = profile_store.get_columns(dataset_key, 'text')
+                    if text_cols_list is not None and selected_numcol not in text_cols_list:
+                        profile_store.put_columns(dataset_key, 'text', text_cols_list + [selected_numcol])
+                text_column = cached_dataset.columns.get("text_column") if cached_dataset is not None else None
+                if text_column is not None and selected_numcol not in text_column.cols_list:
+                    text_column.cols_list = text_column.cols_list + [selected_numcol]
+    with record_stage(numeric_col, "streamlit.render"), st.expander("Numeric Column"):
+        if 'sample_size' in profile.details:
+            st.caption(f"Estimated from a random sample of {profile.details['sample_size']} rows out of {profile.details['n_rows']}, the exact values are being computed in the background.")
+        st.table(profile.summary)
+        bin_method = st.radio('Histogram binning method', BIN_METHODS, horizontal=True)
+        if bin_method not in profile.charts:
+            # The serie is only needed again for a binning method that hasn't been computed yet
+            if numeric_col.serie is None or numeric_col.serie.name != selected_numcol:
+                numeric_col.set_data(selected_numcol)
+            numeric_col.set_histogram(method=bin_method)
+            profile.charts[bin_method] = numeric_col.histogram
+        st.altair_chart(profile.charts[bin_method], use_container_width=True)
         st.write("Most Frequent Values")
-        st.dataframe(num_frequent)
+        st.dataframe(profile.frequent)
+    if st.session_state.get("show_performance"):
+        with st.expander("Performance"):
+            st.table(get_performance_table(numeric_col))
     """
     --------------------
     Description
@@ -24,16 +94,19 @@ def display_tab_num_content(file_path=None, df=None):
     -> display_tab_num_content (function): Function that will instantiate tab_num.logics.NumericColumn class, save it into Streamlit session state and call its tab_num.logics.NumericColumn.find_num_cols() method in order to find all numeric columns.
     Then it will display a Streamlit select box with the list of numeric columns found.
     Once the user select a numeric column from the select box, it will call the tab_num.logics.NumericColumn.set_data() method in order to compute all the information to be displayed.
+    In progressive mode (progressive in Streamlit session state), columns of at least common.progressive.PROGRESSIVE_MIN_ROWS rows are first profiled from a random sample (see tab_num.logics.NumericColumn.get_sample_profile) while their exact profile is computed by the common.progressive.ProgressiveRefiner in Streamlit session state, which replaces the sample profile once ready.
     Then it will display a Streamlit Expander container with the following contents:
     - the results of tab_num.logics.NumericColumn.get_summary() as a Streamlit Table
     - the graph from tab_num.logics.NumericColumn.histogram using Streamlit.altair_chart()
     - the results of tab_num.logics.NumericColumn.frequent using Streamlit.write
+    Finally, when the performance details are enabled (show_performance in Streamlit session state), it will display a Performance expander with the stages recorded by the instance (see common.instrumentation.get_performance_table), including the time spent rendering the expander.
  
     --------------------
     Parameters
     --------------------
     -> file_path (str): File path to uploaded CSV file (optional)
     -> df (pd.DataFrame): Loaded dataframe (optional)
+    -> chunksize (int): Number of rows per chunk in streaming mode (optional)
 
     --------------------
     Returns
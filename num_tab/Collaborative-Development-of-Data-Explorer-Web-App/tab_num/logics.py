@@ -1,6 +1,82 @@
+import numpy as np
 import pandas as pd
 import altair as alt
 
+from common.lazy import LazyDataset
+from common.instrumentation import instrument
+from common.streaming import NumericAccumulator, iter_csv_chunks, read_csv_sample
+from common.profile_store import ColumnProfile
+from common.frequent import HeavyHitters, get_top_k
+from common.sketches import KLLSketch, DEFAULT_KLL_K, DEFAULT_HLL_ERROR, count_distinct, format_distinct_count
+from common.progressive import PROGRESSIVE_SAMPLE_SIZE, sample_serie, get_proportion_interval, get_mean_interval, get_quantile_interval, format_interval
+
+# Binning methods available for the histogram
+BIN_METHODS = ['fixed', 'fd', 'quantile']
+
+# Ways of computing the median, percentiles and IQR: exact from the sorted values or approximate from a mergeable quantile sketch
+QUANTILE_MODES = ['exact', 'sketch']
+
+# Percentiles displayed in the summary
+DEFAULT_PERCENTILES = [1, 5, 25, 75, 95, 99]
+
+# Number of values whose deviations from the mean are computed at once for the standard deviation
+STD_BLOCK_SIZE = 1_048_576
+
+
+def get_sorted_quantiles(sorted_values, quantiles):
+    """
+    --------------------
+    Description
+    --------------------
+    -> get_sorted_quantiles (function): Function that reads quantiles from already sorted values with linear interpolation between the closest ranks (same results as pd.Series.quantile) without any extra selection pass
+
+    --------------------
+    Parameters
+    --------------------
+    -> sorted_values (np.ndarray): Sorted values without missing values
+    -> quantiles (array-like): Quantiles between 0 and 1
+
+    --------------------
+    Returns
+    --------------------
+    -> (np.ndarray): Quantiles values (NaN if there are no values)
+
+    """
+    quantiles = np.asarray(quantiles, dtype='float64')
+    if sorted_values.size == 0:
+        return np.full(quantiles.shape, np.nan)
+    positions = quantiles * (sorted_values.size - 1)
+    lower = np.floor(positions).astype('int64')
+    upper = np.ceil(positions).astype('int64')
+    lower_values = sorted_values[lower].astype('float64')
+    return lower_values + (sorted_values[upper].astype('float64') - lower_values) * (positions - lower)
+
+
+@instrument
+
+
+def coerce_numeric(serie):
+    """
+    --------------------
+    Description
+    --------------------
+    -> coerce_numeric (function): Function that converts a serie that isn't numeric to float64, values that aren't numbers becoming missing like in streaming mode. Columns are classified as numeric from their first rows only with a lazy dataset (see common.lazy.LazyDataset) and may hold text further down
+
+    --------------------
+    Parameters
+    --------------------
+    -> serie (pd.Series): Column listed as numeric
+
+    --------------------
+    Returns
+    --------------------
+    -> (pd.Series): Same serie if it is numeric, otherwise the coerced serie
+
+    """
+    if pd.api.types.is_numeric_dtype(serie.dtype):
+        return serie
+    return pd.to_numeric(serie, errors='coerce').astype('float64')
+
 
 class NumericColumn:
     """
@@ -14,6 +90,7 @@ class NumericColumn:
     --------------------
     -> file_path (str): Path to the uploaded CSV file (optional)
     -> df (pd.Dataframe): Pandas dataframe (optional)
+    -> chunksize (int): Number of rows read at once in streaming mode. If set, the CSV file is read chunk by chunk instead of being loaded as a whole (optional)
     -> cols_list (list): List of columns names of dataset that are numeric type (default set to empty list)
     -> serie (pd.Series): Pandas serie where the content of a column has been loaded (default set to None)
     -> n_unique (int): Number of unique value of a serie (default set to None)
@@ -25,13 +102,27 @@ class NumericColumn:
     -> col_median (int): Median value of a serie (default set to None)
     -> n_zeros (int): Number of times a serie has values equal to 0 (default set to None)
     -> n_negatives (int): Number of times a serie has negative values (default set to None)
+    -> histogram_data (pd.DataFrame): Dataframe containing the start, end and count of each histogram bin (default set to empty)
     -> histogram (alt.Chart): Altair histogram displaying the count for each bin value of a serie (default set to empty)
     -> frequent (pd.DataFrame): Datframe containing the most frequest value of a serie (default set to empty)
+    -> heavy_hitters (HeavyHitters): Approximate counts of the most frequent values computed in streaming mode (default set to None)
+    -> quantile_mode (str): Way of computing the median, percentiles and IQR, one of QUANTILE_MODES. Streaming mode always uses the sketch (default set to 'exact')
+    -> percentiles (list): Percentiles displayed in the summary (default set to DEFAULT_PERCENTILES)
+    -> sketch_k (int): Accuracy parameter of the quantile sketch (default set to DEFAULT_KLL_K)
+    -> sketch (KLLSketch): Quantile sketch of the serie, can be merged with the sketches of other chunks or workers (default set to None)
+    -> col_percentiles (dict): Percentiles values stored by percentile (default set to empty dict)
+    -> col_iqr (float): Interquartile range of a serie (default set to None)
+    -> quantile_error (float): Normalized rank error of the quantiles, 0 when they are exact (default set to None)
+    -> distinct_mode (str): Way of counting the unique values, one of common.sketches.DISTINCT_MODES. Streaming mode always uses the HyperLogLog sketch (default set to 'exact')
+    -> hll_error (float): Relative standard error of the HyperLogLog sketch (default set to DEFAULT_HLL_ERROR)
+    -> unique_error (float): Relative standard error of self.n_unique, None when it is exact (default set to None)
+    -> n_rows_total (int): Number of rows of the whole column when self.serie is a random sample of it, None otherwise (default set to None)
 
     """
-    def __init__(self, file_path=None, df=None):
+    def __init__(self, file_path=None, df=None, chunksize=None, quantile_mode='exact', percentiles=None, sketch_k=DEFAULT_KLL_K, distinct_mode='exact', hll_error=DEFAULT_HLL_ERROR):
         self.file_path = file_path
         self.df = df
+        self.chunksize = chunksize
         self.cols_list = []
         self.serie = None
         self.n_unique = None
@@ -43,12 +134,30 @@ class NumericColumn:
         self.col_median = None
         self.n_zeros = None
         self.n_negatives = None
+        self.histogram_data = pd.DataFrame(columns=['bin_start', 'bin_end', 'count'])
         self.histogram = alt.Chart()
         self.frequent = pd.DataFrame(columns=['value', 'occurrence', 'percentage'])
+        self.heavy_hitters = None
+        self.quantile_mode = quantile_mode
+        self.percentiles = DEFAULT_PERCENTILES if percentiles is None else list(percentiles)
+        self.sketch_k = sketch_k
+        self.sketch = None
+        self.col_percentiles = {}
+        self.col_iqr = None
+        self.quantile_error = None
+        self.distinct_mode = distinct_mode
+        self.hll_error = hll_error
+        self.unique_error = None
+        self.n_rows_total = None
 
     def find_num_cols(self):
         try:
-            numeric_cols = self.df.select_dtypes(include='number')
+            if self.df is None and self.chunksize is None:
+                # Only the header and the first rows are read, the analysed columns are read on demand
+                self.df = LazyDataset(self.file_path)
+            # In streaming mode only a sample of the CSV file is read to find the numeric columns
+            df = read_csv_sample(self.file_path) if self.chunksize is not None else self.df
+            numeric_cols = df.select_dtypes(include='number')
 
             if not numeric_cols.empty:
                 self.cols_list = numeric_cols.columns
@@ -61,7 +170,7 @@ class NumericColumn:
         --------------------
         Description
         --------------------
-        -> find_num_cols (method): Class method that will load the uploaded CSV file as Pandas DataFrame and store it as attribute (self.df) if it hasn't been provided before.
+        -> find_num_cols (method): Class method that will create a common.lazy.LazyDataset from the uploaded CSV file and store it as attribute (self.df) if no dataframe has been provided before, so only the analysed column is read from the file.
         Then it will find all columns of numeric data type and store the results in the relevant attribute (self.cols_list).
 
         --------------------
@@ -79,16 +188,13 @@ class NumericColumn:
 
     def set_data(self, col_name):
         if col_name is not None:
-            self.serie = self.df[col_name]
-            self.set_unique()
-            self.set_missing()
-            self.set_zeros()
-            self.set_negatives()
-            self.set_mean()
-            self.set_std()
-            self.set_min()
-            self.set_max()
-            self.set_median()
+            if self.chunksize is not None:
+                self.set_data_chunked(col_name)
+            else:
+                self.serie = coerce_numeric(self.df[col_name])
+                self.heavy_hitters = None
+                self.n_rows_total = None
+                self.set_stats()
         else:
             self.serie = pd.Series(dtype='object')
         """
@@ -96,6 +202,8 @@ class NumericColumn:
         Description
         --------------------
         -> set_data (method): Class method that sets the self.serie attribute with the relevant column from the dataframe and then computes all requested information from self.serie to be displayed in the Numeric section of Streamlit app 
+        All summary statistics are computed together by the fused kernel self.set_stats() instead of calling each set_* method separately.
+        In streaming mode (self.chunksize set) the statistics are computed by self.set_data_chunked() instead.
 
         --------------------
         Parameters
@@ -109,6 +217,230 @@ class NumericColumn:
 
         """
 
+    def set_data_chunked(self, col_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_data_chunked (method): Class method that reads the relevant column of the CSV file chunk by chunk and updates a common.streaming.NumericAccumulator with each chunk, so the memory used is bounded by self.chunksize.
+        Then it stores the results in the relevant attributes (self.n_missing, self.n_zeros, self.n_negatives, self.col_mean, self.col_std, self.col_min, self.col_max, self.col_median). The median, percentiles and IQR are approximated with the quantile sketch of the accumulator (see self.set_quantiles()) and the number of unique values with its HyperLogLog sketch (self.unique_error).
+        The most frequent values are approximated with a common.frequent.HeavyHitters summary stored in self.heavy_hitters.
+        self.serie is set to an empty serie named after the column.
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the numeric column to be analysed
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        accumulator = NumericAccumulator(sketch_k=self.sketch_k, hll_error=self.hll_error)
+        self.heavy_hitters = HeavyHitters()
+        for chunk in iter_csv_chunks(self.file_path, columns=[col_name], chunksize=self.chunksize):
+            accumulator.update(chunk[col_name])
+            self.heavy_hitters.update(chunk[col_name])
+
+        self.serie = pd.Series(dtype='float64', name=col_name)
+        self.n_unique = accumulator.distinct.get_count()
+        self.unique_error = accumulator.distinct.get_error()
+        self.n_missing = accumulator.n_missing
+        self.n_zeros = accumulator.n_zeros
+        self.n_negatives = accumulator.n_negatives
+        self.col_mean = accumulator.col_mean
+        self.col_std = accumulator.get_std()
+        self.col_min = accumulator.col_min
+        self.col_max = accumulator.col_max
+        self.set_quantiles(sketch=accumulator.sketch)
+
+    def set_data_sample(self, col_name, sample_size=PROGRESSIVE_SAMPLE_SIZE):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_data_sample (method): Class method that sets the self.serie attribute with a uniform random sample of the relevant column from the dataframe (see common.progressive.sample_serie) and computes the statistics of the sample with self.set_stats(). The number of rows of the whole column is stored in self.n_rows_total.
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the numeric column to be analysed
+        -> sample_size (int): Number of rows of the sample
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        serie = self.df[col_name]
+        self.n_rows_total = len(serie)
+        self.serie = coerce_numeric(sample_serie(serie, sample_size))
+        self.heavy_hitters = None
+        self.set_stats()
+
+    def get_values(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_values (method): Class method that extracts the underlying NumPy buffer of self.serie. Integer columns without missing values are kept as they are (nullable integers as their NumPy integer dtype), every other numeric column is returned as float64 with missing values set to NaN
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (np.ndarray): Values of the serie
+
+        """
+        if self.serie.dtype.kind in 'iu':
+            if isinstance(self.serie.dtype, np.dtype):
+                return self.serie.to_numpy()
+            # Nullable integers (e.g. Int64) give an object array when they hold missing values
+            if not self.serie.hasnans:
+                return self.serie.to_numpy(dtype=self.serie.dtype.numpy_dtype)
+        return self.serie.to_numpy(dtype='float64', na_value=np.nan)
+
+    def set_stats(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_stats (method): Class method that computes in a single fused kernel all the statistics displayed in the summary (self.n_unique, self.n_missing, self.n_zeros, self.n_negatives, self.col_mean, self.col_std, self.col_min, self.col_max, self.col_median, self.col_percentiles, self.col_iqr) if self.serie is not empty nor None.
+        The missing values are dropped once, then the remaining values are sorted once: minimum, maximum, median, percentiles, number of unique values, zeros and negatives are all read from the sorted buffer and only the mean and standard deviation need an extra vectorized pass.
+        With exact quantiles, the number of unique values is exact whatever self.distinct_mode since it comes for free with the sort.
+        In sketch mode (self.quantile_mode) the values are never sorted: minimum, maximum, zeros and negatives come from vectorized reductions, the number of unique values from common.sketches.count_distinct() and the quantiles from a KLL sketch built on the unsorted values.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if self.serie is not None and not self.serie.empty:
+            values = self.get_values()
+            self.unique_error = None
+
+            # Drop the missing values once so every statistic works on the same buffer
+            if values.dtype.kind == 'f':
+                missing_mask = np.isnan(values)
+                self.n_missing = int(np.count_nonzero(missing_mask))
+                if self.n_missing:
+                    values = values[~missing_mask]
+            else:
+                self.n_missing = 0
+
+            n_values = values.size
+            if n_values == 0:
+                self.n_unique = 0
+                self.n_zeros = 0
+                self.n_negatives = 0
+                self.col_mean = np.nan
+                self.col_std = np.nan
+                self.col_min = np.nan
+                self.col_max = np.nan
+                self.col_median = np.nan
+                self.set_quantiles(sorted_values=values)
+                return
+
+            if self.quantile_mode == 'sketch':
+                # No sorted copy of the values: reductions and counts in a few passes, quantiles from the sketch
+                sorted_values = None
+                self.col_min = values.min()
+                self.col_max = values.max()
+                self.n_unique, self.unique_error = count_distinct(values, self.distinct_mode, self.hll_error)
+                self.n_negatives = int(np.count_nonzero(values < 0)) if values.dtype.kind != 'u' else 0
+                self.n_zeros = int(np.count_nonzero(values == 0))
+            else:
+                # Sort once: order statistics and counts are then read with binary searches
+                sorted_values = np.sort(values)
+                self.col_min = sorted_values[0]
+                self.col_max = sorted_values[-1]
+                # Python scalars so that the sum of two narrow integers (e.g. int8) can't overflow
+                self.col_median = (sorted_values[(n_values - 1) // 2].item() + sorted_values[n_values // 2].item()) / 2
+                self.n_unique = int(np.count_nonzero(sorted_values[1:] != sorted_values[:-1])) + 1
+                self.n_negatives = int(np.searchsorted(sorted_values, 0, side='left'))
+                self.n_zeros = int(np.searchsorted(sorted_values, 0, side='right')) - self.n_negatives
+
+            # Compute mean and sample standard deviation (ddof=1 like pandas) in float64
+            self.col_mean = values.sum(dtype='float64') / n_values
+            if n_values > 1:
+                # Deviations by blocks so no temporary buffer as large as the column is allocated
+                squares = 0.0
+                for start in range(0, n_values, STD_BLOCK_SIZE):
+                    deviations = values[start:start + STD_BLOCK_SIZE] - self.col_mean
+                    squares += np.dot(deviations, deviations)
+                self.col_std = np.sqrt(squares / (n_values - 1))
+            else:
+                self.col_std = np.nan
+
+            # Median, percentiles and IQR
+            if sorted_values is None:
+                self.set_quantiles(values=values)
+            else:
+                self.set_quantiles(sorted_values=sorted_values)
+
+    def set_quantiles(self, sorted_values=None, sketch=None, values=None):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_quantiles (method): Class method that computes the median, the percentiles of self.percentiles and the interquartile range and stores the results in the relevant attributes (self.col_median, self.col_percentiles, self.col_iqr, self.quantile_error).
+        If a sketch is provided (streaming mode) or self.quantile_mode is 'sketch', the quantiles are estimated from a common.sketches.KLLSketch stored in self.sketch, within self.quantile_error of the requested ranks, built on the unsorted values. Otherwise they are read exactly from the sorted values.
+
+        --------------------
+        Parameters
+        --------------------
+        -> sorted_values (np.ndarray): Sorted values of the serie without missing values, computed from self.serie if not provided (optional)
+        -> sketch (KLLSketch): Quantile sketch already built on the serie (optional)
+        -> values (np.ndarray): Unsorted values of the serie without missing values, used instead of sorted_values in sketch mode (optional)
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        # The quartiles are always needed for the IQR
+        levels = sorted(set(self.percentiles) | {25, 50, 75})
+        quantiles = np.array(levels, dtype='float64') / 100
+
+        if sketch is None and sorted_values is None and values is None:
+            values = self.get_values()
+            if values.dtype.kind == 'f':
+                values = values[~np.isnan(values)]
+
+        if sketch is None and self.quantile_mode == 'sketch':
+            # The sketch ignores the order of the values, so they don't need to be sorted
+            sketch = KLLSketch(k=self.sketch_k)
+            sketch.update(values if values is not None else sorted_values)
+        elif sketch is None and sorted_values is None:
+            sorted_values = np.sort(values)
+
+        if sketch is not None:
+            self.sketch = sketch
+            self.quantile_error = sketch.get_rank_error()
+            results = dict(zip(levels, sketch.get_quantiles(quantiles)))
+        else:
+            self.sketch = None
+            self.quantile_error = 0.0
+            results = dict(zip(levels, get_sorted_quantiles(sorted_values, quantiles)))
+
+        self.col_median = results[50]
+        self.col_percentiles = {percentile: results[percentile] for percentile in self.percentiles}
+        self.col_iqr = results[75] - results[25]
+
     def convert_serie_to_num(self):
         
         """
@@ -159,7 +491,8 @@ class NumericColumn:
         --------------------
         Description
         --------------------
-        -> set_unique (method): Class method that computes the number of unique value of a column and store the results in the relevant attribute (self.n_unique) if self.serie is not empty nor None
+        -> set_unique (method): Class method that computes the number of unique value of a column and store the results in the relevant attribute (self.n_unique) if self.serie is not empty nor None.
+        In approximate mode (self.distinct_mode) columns of more than common.sketches.HLL_MIN_ROWS rows are counted with a HyperLogLog sketch whose relative standard error is stored in self.unique_error (see common.sketches.count_distinct).
 
         --------------------
         Parameters
@@ -173,7 +506,7 @@ class NumericColumn:
 
         """
         if self.serie is not None and not self.serie.empty:
-            self.n_unique = self.serie.nunique()
+            self.n_unique, self.unique_error = count_distinct(self.serie, self.distinct_mode, self.hll_error)
 
     def set_missing(self):
                 
@@ -353,26 +686,57 @@ class NumericColumn:
         """
         
 
-    def set_histogram(self):
-        if self.serie is not None and not self.serie.empty:
-            chart = alt.Chart(self.df).mark_bar().encode(
-                alt.X('{}'.format(self.serie.name), bin=alt.Bin(maxbins=20)),
-                alt.Y('count()')
-            ).properties(
-                title="Histogram"
-            )
-            self.histogram = chart
-    
+    def get_bin_edges(self, values, bins=20, method='fixed', max_bins=200):
         """
         --------------------
         Description
         --------------------
-        -> set_histogram (method): Class method that computes the Altair histogram displaying the count for each bin value of a serie and store the results in the relevant attribute (self.histogram) if self.serie is not empty nor None
+        -> get_bin_edges (method): Class method that computes the edges of the histogram bins of the provided values according to the selected binning method:
+        - 'fixed': bins of equal width
+        - 'fd': bins of equal width following the Freedman-Diaconis rule (limited to max_bins)
+        - 'quantile': bins containing roughly the same number of values
 
         --------------------
         Parameters
         --------------------
-        -> None
+        -> values (np.ndarray): Values without missing values
+        -> bins (int): Number of bins for the 'fixed' and 'quantile' methods
+        -> method (str): Binning method, one of BIN_METHODS
+        -> max_bins (int): Maximum number of bins for the 'fd' method
+
+        --------------------
+        Returns
+        --------------------
+        -> (np.ndarray): Sorted bin edges
+
+        """
+        if method == 'fixed':
+            return np.histogram_bin_edges(values, bins=bins)
+        if method == 'fd':
+            edges = np.histogram_bin_edges(values, bins='fd')
+            if len(edges) - 1 > max_bins:
+                edges = np.histogram_bin_edges(values, bins=max_bins)
+            return edges
+        if method == 'quantile':
+            edges = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)))
+            if len(edges) < 2:
+                edges = np.histogram_bin_edges(values, bins=1)
+            return edges
+        raise ValueError(f"Unknown binning method '{method}', expected one of {BIN_METHODS}.")
+
+    def set_histogram(self, bins=20, method='fixed'):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_histogram (method): Class method that computes the Altair histogram displaying the count for each bin value of a serie and store the results in the relevant attributes (self.histogram_data, self.histogram) if self.serie is not empty nor None.
+        The values are binned server-side with NumPy so only the bin edges and counts (one row per bin) are sent to the chart instead of the whole dataframe.
+
+        --------------------
+        Parameters
+        --------------------
+        -> bins (int): Number of bins for the 'fixed' and 'quantile' methods
+        -> method (str): Binning method, one of BIN_METHODS ('fixed', 'fd', 'quantile')
 
         --------------------
         Returns
@@ -380,23 +744,50 @@ class NumericColumn:
         -> None
 
         """
-        
+        if self.serie is not None and not self.serie.empty:
+            values = self.get_values()
+            if values.dtype.kind == 'f':
+                values = values[~np.isnan(values)]
+            if values.size == 0:
+                return
+
+            # Bin the values with vectorized counting
+            edges = self.get_bin_edges(values, bins=bins, method=method)
+            counts, edges = np.histogram(values, bins=edges)
+            self.histogram_data = pd.DataFrame({
+                'bin_start': edges[:-1],
+                'bin_end': edges[1:],
+                'count': counts,
+            })
+
+            # Build the chart from the aggregated bins only
+            chart = alt.Chart(self.histogram_data).mark_bar().encode(
+                alt.X('bin_start:Q', bin='binned', title='{}'.format(self.serie.name)),
+                alt.X2('bin_end:Q'),
+                alt.Y('count:Q', title='Count of Records')
+            ).properties(
+                title="Histogram"
+            )
+            self.histogram = chart
 
     def set_frequent(self, end=20):
         if self.serie is not None and not self.serie.empty:
-            frequent_values = self.serie.value_counts().reset_index()
-            frequent_values.columns = ['value', 'frequency']
-            frequent_values['percentage'] = (frequent_values['frequency'] / len(self.serie)) * 100
-            if end is not None:
-                frequent_values = frequent_values.head(end)
-            frequent_values.rename(columns={'frequency': 'occurrence'}, inplace=True)
+            frequent_values = get_top_k(self.serie, end)
+            frequent_values['percentage'] = (frequent_values['occurrence'] / len(self.serie)) * 100
+
+            self.frequent = frequent_values
+        elif self.heavy_hitters is not None and self.heavy_hitters.n:
+            # In streaming mode the occurrences are estimated from the heavy hitters summary
+            frequent_values = self.heavy_hitters.get_top_k(end)
+            frequent_values['percentage'] = (frequent_values['occurrence'] / self.heavy_hitters.n) * 100
 
             self.frequent = frequent_values
         """
         --------------------
         Description
         --------------------
-        -> set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie and store the results in the relevant attribute (self.frequent) if self.serie is not empty nor None
+        -> set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie and store the results in the relevant attribute (self.frequent) if self.serie is not empty nor None.
+        Only the end largest counts are selected (see common.frequent.get_top_k) instead of sorting the counts of all distinct values. In streaming mode they are estimated from self.heavy_hitters.
 
         --------------------
         Parameters
@@ -413,7 +804,7 @@ class NumericColumn:
         
     def get_summary(self):
         return [
-                {"Description": "Number of Unique Values", "Value": str(self.n_unique)},
+                {"Description": "Number of Unique Values", "Value": format_distinct_count(self.n_unique, self.unique_error)},
                 {"Description": "Number of Rows with Missing Values", "Value": str(self.n_missing)},
                 {"Description": "Number of Rows with 0", "Value": str(self.n_zeros)},
                 {"Description": "Number of Rows with Negative Values", "Value": str(self.n_negatives)},                        
@@ -421,7 +812,10 @@ class NumericColumn:
                 {"Description": "Standard Deviation Value", "Value": self.col_std},
                 {"Description": "Minimum Value", "Value": self.col_min},
                 {"Description": "Maximum Value", "Value": self.col_max},
-                {"Description": "Median Value", "Value": self.col_median}
+                {"Description": "Median Value", "Value": self.col_median},
+                *[{"Description": f"Percentile P{percentile}", "Value": value} for percentile, value in self.col_percentiles.items()],
+                {"Description": "Interquartile Range (IQR)", "Value": self.col_iqr},
+                {"Description": "Quantile Mode", "Value": self.get_quantile_mode_label()}
  
         ]
  
@@ -443,4 +837,123 @@ class NumericColumn:
         -> (pd.DataFrame): Formatted dataframe to be displayed on the Streamlit app
 
         """
-        
\ No newline at end of file
+
+    def get_profile(self, col_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_profile (method): Class method that computes everything displayed for a column in the Numeric tab (summary, most frequent values and histogram with the first binning method of BIN_METHODS) and gathers it into a common.profile_store.ColumnProfile
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the numeric column to be analysed
+
+        --------------------
+        Returns
+        --------------------
+        -> (ColumnProfile): Profile of the column
+
+        """
+        self.set_data(col_name)
+        self.set_frequent()
+        self.set_histogram(method=BIN_METHODS[0])
+        return ColumnProfile('num', col_name, self.get_summary(), self.frequent, charts={BIN_METHODS[0]: self.histogram}, details={'quantile_mode': self.quantile_mode, 'distinct_mode': self.distinct_mode})
+
+    def get_sample_summary(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_sample_summary (method): Class method that formats the statistics computed on a random sample (see self.set_data_sample()) as estimates for the whole column, in the same layout as self.get_summary().
+        Numbers of rows are scaled to the whole column with a Wilson interval, the average value has a normal interval and the median and percentiles a distribution-free interval from the order statistics of the sample (95% confidence). The sample only bounds the number of unique values, the minimum and the maximum.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (list): Rows of the summary as dicts with 2 keys: Description and Value
+
+        """
+        n_sample = len(self.serie)
+        n_rows = self.n_rows_total
+        values = self.get_values()
+        if values.dtype.kind == 'f':
+            values = values[~np.isnan(values)]
+        sorted_values = np.sort(values)
+        n_values_total = (n_sample - self.n_missing) / n_sample * n_rows if n_sample else 0
+        percentiles = [
+            {"Description": f"Percentile P{percentile}", "Value": format_interval(*get_quantile_interval(sorted_values, percentile / 100))}
+            for percentile in self.percentiles
+        ]
+        return [
+            {"Description": "Number of Unique Values", "Value": f"at least {self.n_unique} (sample)"},
+            {"Description": "Number of Rows with Missing Values", "Value": format_interval(*get_proportion_interval(self.n_missing, n_sample, n_rows), integer=True)},
+            {"Description": "Number of Rows with 0", "Value": format_interval(*get_proportion_interval(self.n_zeros, n_sample, n_rows), integer=True)},
+            {"Description": "Number of Rows with Negative Values", "Value": format_interval(*get_proportion_interval(self.n_negatives, n_sample, n_rows), integer=True)},
+            {"Description": "Average Value", "Value": format_interval(*get_mean_interval(values, n_values_total))},
+            {"Description": "Standard Deviation Value", "Value": format_interval(self.col_std, np.nan, np.nan)},
+            {"Description": "Minimum Value", "Value": f"at most {self.col_min} (sample)"},
+            {"Description": "Maximum Value", "Value": f"at least {self.col_max} (sample)"},
+            {"Description": "Median Value", "Value": format_interval(*get_quantile_interval(sorted_values, 0.5))},
+            *percentiles,
+            {"Description": "Interquartile Range (IQR)", "Value": format_interval(self.col_iqr, np.nan, np.nan)},
+            {"Description": "Quantile Mode", "Value": f"Random sample of {n_sample} rows out of {n_rows} (95% confidence intervals)"},
+        ]
+
+    def get_sample_profile(self, col_name, sample_size=PROGRESSIVE_SAMPLE_SIZE):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_sample_profile (method): Class method that computes a first profile of a column from a uniform random sample of its rows (summary with confidence intervals, most frequent values and histogram of the sample), displayed while the exact profile is computed by self.get_profile()
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the numeric column to be analysed
+        -> sample_size (int): Number of rows of the sample
+
+        --------------------
+        Returns
+        --------------------
+        -> (ColumnProfile): Profile of the sample, with its size (sample_size) and the number of rows of the column (n_rows) in its details
+
+        """
+        self.set_data_sample(col_name, sample_size)
+        self.set_frequent()
+        self.set_histogram(method=BIN_METHODS[0])
+        details = {'quantile_mode': self.quantile_mode, 'distinct_mode': self.distinct_mode, 'sample_size': len(self.serie), 'n_rows': self.n_rows_total}
+        return ColumnProfile('num', col_name, self.get_sample_summary(), self.frequent, charts={BIN_METHODS[0]: self.histogram}, details=details)
+
+    def get_quantile_mode_label(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_quantile_mode_label (method): Class method that describes how the median, percentiles and IQR of the summary have been computed, with the error bound of the sketch
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> (str): Label displayed in the summary
+
+        """
+        if self.quantile_error is None:
+            return str(None)
+        if self.sketch is None:
+            return "Exact"
+        if self.quantile_error == 0:
+            # No compaction happened: the sketch still holds every value
+            return f"Sketch (KLL, k={self.sketch.k}, exact)"
+        return f"Sketch (KLL, k={self.sketch.k}, rank error within {self.quantile_error:.2%})"
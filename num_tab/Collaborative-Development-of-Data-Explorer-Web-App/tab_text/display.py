@@ -1,8 +1,9 @@
 import streamlit as st
 
 from tab_text.logics import TextColumn
+from common.instrumentation import record_stage, get_performance_table
 
-def display_tab_text_content(file_path=None, df=None):
+def display_tab_text_content(file_path=None, df=None, chunksize=None):
     """
     --------------------
     Description
@@ -12,14 +13,16 @@ def display_tab_text_content(file_path=None, df=None):
     Once the user select a text column from the select box, it will call the tab_text.logics.TextColumn.set_data() method in order to compute all the information to be displayed.
     Then it will display a Streamlit Expander container with the following contents:
     - the results of tab_text.logics.TextColumn.get_summary() as a Streamlit Table
-    - the graph from tab_text.logics.TextColumn.histogram using Streamlit.altair_chart()
+    - the graph from tab_text.logics.TextColumn.barchart using Streamlit.altair_chart()
     - the results of tab_text.logics.TextColumn.frequent using Streamlit.write
+    Finally, when the performance details are enabled (show_performance in Streamlit session state), it will display a Performance expander with the stages recorded by the instance (see common.instrumentation.get_performance_table), including the time spent rendering the expander.
  
     --------------------
     Parameters
     --------------------
     -> file_path (str): File path to uploaded CSV file (optional)
     -> df (pd.DataFrame): Loaded dataframe (optional)
+    -> chunksize (int): Number of rows per chunk in streaming mode (optional)
 
     --------------------
     Returns
@@ -27,4 +30,65 @@ def display_tab_text_content(file_path=None, df=None):
     -> None
 
     """
-    
\ No newline at end of file
+    # Reuse the TextColumn instance cached with the uploaded dataset so its results survive reruns
+    cached_dataset = st.session_state.get("cached_dataset")
+    profile_store = st.session_state.get("profile_store")
+    dataset_key = cached_dataset.key if cached_dataset is not None and profile_store is not None else None
+    text_column = cached_dataset.columns.get("text_column") if cached_dataset is not None else None
+    if text_column is not None and text_column.chunksize == chunksize:
+        st.session_state.text_column = text_column
+    elif file_path is not None:
+        # Instantiate TextColumn class
+        text_column = TextColumn(file_path, df, chunksize)
+
+        # Save the instance to Streamlit session state
+        st.session_state.text_column = text_column
+
+        if dataset_key is not None:
+            # Profiles computed in the other mode (streaming or not) are not valid anymore
+            profile_store.invalidate(dataset_key, kind='text')
+        if cached_dataset is not None:
+            cached_dataset.columns["text_column"] = text_column
+
+        # Find text columns (or reuse the list stored for this dataset)
+        cols_list = profile_store.get_columns(dataset_key, 'text') if dataset_key is not None else None
+        if cols_list is None:
+            st.session_state.text_column.find_text_cols()
+            if dataset_key is not None:
+                profile_store.put_columns(dataset_key, 'text', st.session_state.text_column.cols_list)
+        else:
+            st.session_state.text_column.cols_list = cols_list
+
+    # Create a select box to choose a text column
+    selected_column = st.selectbox("Which text column do you want to explore?", st.session_state.text_column.cols_list)
+
+    if selected_column:
+        st.session_state.selected_text_col = selected_column
+
+        # Compute the profile of the column only if it hasn't been stored before with the same distinct-count mode
+        st.session_state.text_column.distinct_mode = st.session_state.get("distinct_mode") or 'exact'
+        profile = profile_store.get(dataset_key, selected_column, 'text') if dataset_key is not None else None
+        if profile is None or profile.details.get('distinct_mode') != st.session_state.text_column.distinct_mode:
+            profile = st.session_state.text_column.get_profile(selected_column)
+            if dataset_key is not None:
+                profile_store.put(dataset_key, profile)
+
+        # Create an expander container to show information
+        with record_stage(st.session_state.text_column, "streamlit.render"), st.expander(""):
+            # Display a summary table
+            st.write("Text Column")
+            st.table(profile.summary)
+
+            # Display a Bar Chart using Altair chart
+            st.write("Bar Chart")
+            chart = profile.charts.get('bar')
+            if chart is not None:
+                st.altair_chart(chart, use_container_width=True)
+
+            # Display the most frequent values
+            st.write(" Most Frequent Values")
+            st.write(profile.frequent)
+
+        if st.session_state.get("show_performance"):
+            with st.expander("Performance"):
+                st.table(get_performance_table(st.session_state.text_column))
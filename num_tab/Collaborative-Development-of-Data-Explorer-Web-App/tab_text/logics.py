@@ -1,6 +1,16 @@
+import numpy as np
 import pandas as pd
 import altair as alt
 
+from common.lazy import LazyDataset
+from common.instrumentation import instrument
+from common.streaming import TextAccumulator, iter_csv_chunks, read_csv_sample
+from common.profile_store import ColumnProfile
+from common.frequent import HeavyHitters, factorize_values, get_top_k_from_counts, select_top_k
+from common.text_kernels import count_text_properties
+from common.sketches import DEFAULT_HLL_ERROR, count_distinct, format_distinct_count
+
+@instrument
 class TextColumn:
     """
     --------------------
@@ -13,6 +23,7 @@ class TextColumn:
     --------------------
     -> file_path (str): Path to the uploaded CSV file (optional)
     -> df (pd.Dataframe): Pandas dataframe (optional)
+    -> chunksize (int): Number of rows read at once in streaming mode. If set, the CSV file is read chunk by chunk instead of being loaded as a whole (optional)
     -> cols_list (list): List of columns names of dataset that are text type (default set to empty list)
     -> serie (pd.Series): Pandas serie where the content of a column has been loaded (default set to None)
     -> n_unique (int): Number of unique value of a serie (default set to None)
@@ -26,11 +37,19 @@ class TextColumn:
     -> n_digit (int): Number of times a serie has only digit characters (default set to None)
     -> barchart (alt.Chart): Altair barchart displaying the count for each value of a serie (default set to empty)
     -> frequent (pd.DataFrame): Datframe containing the most frequest value of a serie (default set to empty)
+    -> heavy_hitters (HeavyHitters): Approximate counts of the most frequent values computed in streaming mode (default set to None)
+    -> codes (np.ndarray): Code of the distinct value of each row of a serie, -1 for missing values (default set to None)
+    -> uniques (pd.Index): Distinct values of a serie the codes refer to (default set to None)
+    -> counts (np.ndarray): Number of occurrences of each distinct value (default set to None)
+    -> distinct_mode (str): Way of counting the unique values, one of common.sketches.DISTINCT_MODES. Streaming mode always uses the HyperLogLog sketch (default set to 'exact')
+    -> hll_error (float): Relative standard error of the HyperLogLog sketch (default set to DEFAULT_HLL_ERROR)
+    -> unique_error (float): Relative standard error of self.n_unique, None when it is exact (default set to None)
 
     """
-    def __init__(self, file_path=None, df=None):
+    def __init__(self, file_path=None, df=None, chunksize=None, distinct_mode='exact', hll_error=DEFAULT_HLL_ERROR):
         self.file_path = file_path
         self.df = df
+        self.chunksize = chunksize
         self.cols_list = []
         self.serie = None
         self.n_unique = None
@@ -44,14 +63,22 @@ class TextColumn:
         self.n_digit = None
         self.barchart = alt.Chart()
         self.frequent = pd.DataFrame(columns=['value', 'occurrence', 'percentage'])
+        self.heavy_hitters = None
+        self.codes = None
+        self.uniques = None
+        self.counts = None
+        self.distinct_mode = distinct_mode
+        self.hll_error = hll_error
+        self.unique_error = None
     
     def find_text_cols(self):
         """
         --------------------
         Description
         --------------------
-        -> find_text_cols (method): Class method that will load the uploaded CSV file as Pandas DataFrame and store it as attribute (self.df) if it hasn't been provided before.
+        -> find_text_cols (method): Class method that will create a common.lazy.LazyDataset from the uploaded CSV file and store it as attribute (self.df) if no dataframe has been provided before, so only the analysed column is read from the file.
         Then it will find all columns of text data type and store the results in the relevant attribute (self.cols_list).
+        In streaming mode (self.chunksize set) only a sample of the CSV file is read to find the text columns.
 
         --------------------
         Parameters
@@ -64,6 +91,12 @@ class TextColumn:
         -> None
 
         """
+        if self.df is None and self.chunksize is None:
+            # Only the header and the first rows are read, the analysed columns are read on demand
+            self.df = LazyDataset(self.file_path)
+
+        df = read_csv_sample(self.file_path) if self.df is None else self.df
+        self.cols_list = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
         
 
     def set_data(self, col_name):
@@ -75,6 +108,40 @@ class TextColumn:
         Description
         --------------------
         -> set_data (method): Class method that sets the self.serie attribute with the relevant column from the dataframe and then computes all requested information from self.serie to be displayed in the Text section of Streamlit app 
+        The serie is factorized once by self.set_codes(): the number of unique values, the mode, the most frequent values and the counts of missing, empty, whitespace, lowercase, uppercase, alphabetical and digit values (computed together by self.set_text_stats()) all come from the counts of the distinct values.
+        In streaming mode (self.chunksize set) the statistics are computed by self.set_data_chunked() instead.
+        The most frequent values of the previous column (self.frequent) are cleared so they are not reused for the new one.
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the text column to be analysed
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+        """
+        self.frequent = pd.DataFrame(columns=['value', 'occurrence', 'percentage'])
+        if self.chunksize is not None:
+            self.set_data_chunked(col_name)
+            return
+
+        self.serie = self.df[col_name]
+        self.heavy_hitters = None
+        self.set_codes()
+        self.set_unique()
+        self.set_text_stats()
+        self.set_mode()
+
+    def set_data_chunked(self, col_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_data_chunked (method): Class method that reads the relevant column of the CSV file chunk by chunk and updates a common.streaming.TextAccumulator with each chunk, so the memory used is bounded by self.chunksize.
+        Then it stores the results in the relevant attributes (self.n_missing, self.n_empty, self.n_space, self.n_lower, self.n_upper, self.n_alpha, self.n_digit). The number of unique values is estimated with the HyperLogLog sketch of the accumulator (self.unique_error), the mode is not computed and the most frequent values are approximated with a common.frequent.HeavyHitters summary stored in self.heavy_hitters.
+        self.serie is set to an empty serie named after the column.
 
         --------------------
         Parameters
@@ -85,7 +152,28 @@ class TextColumn:
         Returns
         --------------------
         -> None
+
         """
+        accumulator = TextAccumulator(hll_error=self.hll_error)
+        self.heavy_hitters = HeavyHitters()
+        for chunk in iter_csv_chunks(self.file_path, columns=[col_name], chunksize=self.chunksize):
+            accumulator.update(chunk[col_name])
+            self.heavy_hitters.update(chunk[col_name])
+
+        self.serie = pd.Series(dtype='object', name=col_name)
+        self.codes = None
+        self.uniques = None
+        self.counts = None
+        self.n_unique = accumulator.distinct.get_count()
+        self.unique_error = accumulator.distinct.get_error()
+        self.n_mode = None
+        self.n_missing = accumulator.n_missing
+        self.n_empty = accumulator.n_empty
+        self.n_space = accumulator.n_space
+        self.n_lower = accumulator.n_lower
+        self.n_upper = accumulator.n_upper
+        self.n_alpha = accumulator.n_alpha
+        self.n_digit = accumulator.n_digit
         
 
     def convert_serie_to_text(self):
@@ -126,14 +214,52 @@ class TextColumn:
         -> (bool): Flag stating if the serie is empty or not
 
         """
+        return self.serie is None or self.serie.empty
         
 
+    def set_codes(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_codes (method): Class method that factorizes a serie once (see common.frequent.factorize_values) and counts each distinct value with np.bincount over the codes, then store the results in the relevant attributes (self.codes, self.uniques, self.counts).
+        Unused categories of a categorical serie are dropped so that every distinct value occurs at least once. If the serie is empty or none, the attributes are reset to None.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if not self.is_serie_none():
+            codes, uniques = factorize_values(self.serie)
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            used = counts > 0
+            if not used.all():
+                # Renumber the codes of the used categories
+                new_codes = np.cumsum(used) - 1
+                codes = np.where(codes >= 0, new_codes[codes], -1)
+                uniques, counts = uniques[used], counts[used]
+            self.codes = codes
+            self.uniques = uniques
+            self.counts = counts
+        else:
+            self.codes = None
+            self.uniques = None
+            self.counts = None
+
     def set_unique(self):
         """
         --------------------
         Description
         --------------------
         -> set_unique (method): Class method that computes the number of unique value of a serie and store the results in the relevant attribute(self.n_unique).
+        If the serie has been factorized (see self.set_codes()), it is the number of distinct values, exact whatever self.distinct_mode. Otherwise columns of more than common.sketches.HLL_MIN_ROWS rows are counted with a HyperLogLog sketch in approximate mode (see common.sketches.count_distinct).
 
         --------------------
         Parameters
@@ -146,7 +272,11 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            if self.counts is not None:
+                self.n_unique, self.unique_error = len(self.uniques), None
+            else:
+                self.n_unique, self.unique_error = count_distinct(self.serie, self.distinct_mode, self.hll_error)
 
     def set_missing(self):
         """
@@ -166,7 +296,8 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            self.n_missing = int(self.serie.isna().sum())
 
     def set_empty(self):
         """
@@ -186,7 +317,8 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            self.n_empty = int((self.serie.dropna().astype(str) == '').sum())
 
     def set_mode(self):
         """
@@ -194,6 +326,7 @@ class TextColumn:
         Description
         --------------------
         -> set_mode (method): Class method that computes the mode value of a serie and store the results in the relevant attribute(self.n_mode).
+        If the serie has been factorized (see self.set_codes()), it is the distinct value with the largest count.
 
         --------------------
         Parameters
@@ -206,7 +339,46 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            if self.counts is None:
+                self.set_codes()
+            positions = select_top_k(self.counts, 1)
+            self.n_mode = self.uniques[positions[0]] if len(positions) else None
+
+    def set_text_stats(self):
+        """
+        --------------------
+        Description
+        --------------------
+        -> set_text_stats (method): Class method that computes together the number of missing, empty, whitespace only, lowercase, uppercase, alphabetical and digit values of a serie and store the results in the relevant attributes (self.n_missing, self.n_empty, self.n_space, self.n_lower, self.n_upper, self.n_alpha, self.n_digit).
+        The serie is converted once to an Arrow string array and classified by vectorized kernels (see common.text_kernels.count_text_properties) instead of one .str loop per count as in self.set_missing(), self.set_empty(), self.set_whitespace(), self.set_lowercase(), self.set_uppercase(), self.set_alphabet() and self.set_digit().
+        If the serie has been factorized (see self.set_codes()), only its distinct values are classified, each one weighted by its count.
+
+        --------------------
+        Parameters
+        --------------------
+        -> None
+
+        --------------------
+        Returns
+        --------------------
+        -> None
+
+        """
+        if not self.is_serie_none():
+            if self.counts is not None:
+                counts = count_text_properties(pd.Series(self.uniques), weights=self.counts)
+                counts['n_missing'] = len(self.serie) - int(self.counts.sum())
+            else:
+                counts = count_text_properties(self.serie)
+            self.n_missing = counts['n_missing']
+            self.n_empty = counts['n_empty']
+            self.n_space = counts['n_space']
+            self.n_lower = counts['n_lower']
+            self.n_upper = counts['n_upper']
+            self.n_alpha = counts['n_alpha']
+            self.n_digit = counts['n_digit']
+
 
     def set_whitespace(self):
         """
@@ -226,7 +398,8 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            self.n_space = int(self.serie.dropna().astype(str).str.isspace().sum())
 
     def set_lowercase(self):
         """
@@ -246,7 +419,8 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            self.n_lower = int(self.serie.dropna().astype(str).str.islower().sum())
 
     def set_uppercase(self):
         """
@@ -266,7 +440,8 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            self.n_upper = int(self.serie.dropna().astype(str).str.isupper().sum())
     
     def set_alphabet(self):
         """
@@ -286,14 +461,15 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            self.n_alpha = int(self.serie.dropna().astype(str).str.isalpha().sum())
 
     def set_digit(self):
         """
         --------------------
         Description
         --------------------
-        -> set_digit (method): Class method that computes the number of times a serie has only digit characters and store the results in the relevant attribute(self.n_digit).
+        -> set_digit (method): Class method that computes the number of times a serie has only decimal digit characters (str.isdecimal, like common.text_kernels.count_text_properties) and store the results in the relevant attribute(self.n_digit).
 
         --------------------
         Parameters
@@ -306,7 +482,8 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none():
+            self.n_digit = int(self.serie.dropna().astype(str).str.isdecimal().sum())
 
     def set_barchart(self):  
         """
@@ -326,7 +503,23 @@ class TextColumn:
         -> None
 
         """
-        
+        if not self.is_serie_none() or (self.heavy_hitters is not None and self.heavy_hitters.n):
+            # Reuse the most frequent values if they have already been computed
+            if self.frequent.empty:
+                self.set_frequent()
+            value_counts = self.frequent[['value', 'occurrence']].copy()
+            value_counts['value'] = value_counts['value'].astype(str)
+
+            # Create a barchart using Altair
+            barchart = alt.Chart(value_counts)
+            barchart = barchart.mark_bar()
+            barchart = barchart.encode(
+                x=alt.X('value:N', title='Value', sort='-y'),
+                y=alt.Y('occurrence:Q', title='Count of Records')
+            )
+            # Store the Altair chart in the self.barchart attribute
+            self.barchart = barchart
+            return self.barchart
       
     def set_frequent(self, end=20):
         """
@@ -334,6 +527,7 @@ class TextColumn:
         Description
         --------------------
         -> set_frequent (method): Class method that computes the Dataframe containing the most frequest value of a serie and store the results in the relevant attribute(self.frequent).
+        Only the end largest counts of the distinct values (see self.set_codes()) are selected (see common.frequent.get_top_k_from_counts) instead of sorting the counts of all distinct values. In streaming mode they are estimated from self.heavy_hitters.
 
         --------------------
         Parameters
@@ -347,6 +541,17 @@ class TextColumn:
         -> None
 
         """
+        if not self.is_serie_none():
+            if self.counts is None:
+                self.set_codes()
+            frequent_values = get_top_k_from_counts(self.uniques, self.counts, end)
+            frequent_values['percentage'] = (frequent_values['occurrence'] / len(self.serie)) * 100
+            self.frequent = frequent_values
+        elif self.heavy_hitters is not None and self.heavy_hitters.n:
+            # In streaming mode the occurrences are estimated from the heavy hitters summary
+            frequent_values = self.heavy_hitters.get_top_k(end)
+            frequent_values['percentage'] = (frequent_values['occurrence'] / self.heavy_hitters.n) * 100
+            self.frequent = frequent_values
         
 
     def get_summary(self):
@@ -367,4 +572,37 @@ class TextColumn:
         -> (pd.DataFrame): Formatted dataframe to be displayed on the Streamlit app
 
         """
-        
+        return [
+            {"Description": "Number of Unique Values", "Value": format_distinct_count(self.n_unique, self.unique_error)},
+            {"Description": "Number of Rows with Missing Values", "Value": str(self.n_missing)},
+            {"Description": "Number of Empty Rows", "Value": str(self.n_empty)},
+            {"Description": "Number of Rows with Only Whitespace", "Value": str(self.n_space)},
+            {"Description": "Number of Rows with Only Lowercases", "Value": str(self.n_lower)},
+            {"Description": "Number of Rows with Only Uppercases", "Value": str(self.n_upper)},
+            {"Description": "Number of Rows with Only Alphabet", "Value": str(self.n_alpha)},
+            {"Description": "Number of Rows with Only Digits", "Value": str(self.n_digit)},
+            {"Description": "Mode Value", "Value": str(self.n_mode)},
+        ]
+
+    def get_profile(self, col_name):
+        """
+        --------------------
+        Description
+        --------------------
+        -> get_profile (method): Class method that computes everything displayed for a column in the Text tab (summary, most frequent values and barchart) and gathers it into a common.profile_store.ColumnProfile
+
+        --------------------
+        Parameters
+        --------------------
+        -> col_name (str): Name of the text column to be analysed
+
+        --------------------
+        Returns
+        --------------------
+        -> (ColumnProfile): Profile of the column
+
+        """
+        self.set_data(col_name)
+        self.set_frequent()
+        self.set_barchart()
+        return ColumnProfile('text', col_name, self.get_summary(), self.frequent, charts={'bar': self.barchart}, details={'distinct_mode': self.distinct_mode})
@@ -0,0 +1,6 @@
+# Import packages
+import sys
+from pathlib import Path
+
+# Set Python path so the tests import the modules like the app does
+sys.path.append(str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from common.ingest import ingest_csv
+
+
+CSV_CONTENTS = {
+    'signed_integers': "a,b\n+1,x\n2,y\n",
+    'header_only': "a,b\n",
+    'empty_column': "a,b\n1,\n2,\n",
+    'integral_floats': "a,b\n1.0,2\n3.0,4\n",
+    'uint64': "a,b\n1,18446744073709551615\n2,9223372036854775808\n",
+    'beyond_uint64': "a,b\n1,2\n2,36893488147419103232\n",
+    'missing_and_booleans': "a,b,c\n1.5,True,NA\n,False,text\n",
+}
+
+
+@pytest.mark.parametrize("name", CSV_CONTENTS)
+def test_pyarrow_engine_matches_pandas(tmp_path, name):
+    file_path = tmp_path / f"{name}.csv"
+    file_path.write_text(CSV_CONTENTS[name])
+    expected = pd.read_csv(file_path)
+    df, details = ingest_csv(str(file_path), engine='pyarrow')
+    pd.testing.assert_frame_equal(df, expected)
+    assert details['engine'] in ['pyarrow', 'pandas']
+
+
+def test_signed_integers_fall_back_to_pandas(tmp_path):
+    file_path = tmp_path / "signed.csv"
+    file_path.write_text(CSV_CONTENTS['signed_integers'])
+    df, details = ingest_csv(str(file_path), engine='pyarrow')
+    assert details['engine'] == 'pandas'
+    assert 'float64 by pyarrow' in details['fallback']
+
+
+def test_header_only_file_gives_object_columns(tmp_path):
+    file_path = tmp_path / "header.csv"
+    file_path.write_text(CSV_CONTENTS['header_only'])
+    df, details = ingest_csv(str(file_path), engine='pyarrow')
+    assert details['engine'] == 'pyarrow'
+    assert list(df.dtypes) == [object, object]
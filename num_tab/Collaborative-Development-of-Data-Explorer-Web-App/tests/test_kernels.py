@@ -0,0 +1,218 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tab_num.logics import NumericColumn, DEFAULT_PERCENTILES
+from tab_text.logics import TextColumn
+from common.date_kernels import count_date_properties
+from common.text_kernels import count_text_properties
+from common.frequent import HeavyHitters, get_top_k
+from common.sketches import KLLSketch
+from common.streaming import NumericAccumulator
+
+
+NUMERIC_SERIES = {
+    'float_with_nan': pd.Series([1.5, np.nan, -2.0, 0.0, 3.25, np.nan, 0.0, 7.0]),
+    'nan_only': pd.Series([np.nan, np.nan, np.nan]),
+    'single_value': pd.Series([4.0]),
+    'int8': pd.Series([-128, 0, 5, 127, 127, -3], dtype='int8'),
+    'uint8': pd.Series([0, 255, 255, 1, 7], dtype='uint8'),
+    'uint64': pd.Series([0, 2 ** 63, 3, 2 ** 64 - 1], dtype='uint64'),
+    'nullable_int': pd.Series([1, None, -4, 0], dtype='Int64'),
+    'nullable_int_without_missing': pd.Series([3, -1, 0, 3], dtype='Int64'),
+    'random': pd.Series(np.random.default_rng(0).normal(size=10_001)),
+}
+
+TEXT_SERIES = {
+    'object_with_nan': pd.Series(['a', 'B', None, 'a', '', ' ', '12', 'abc', 'a', np.nan], dtype='object'),
+    'nan_only': pd.Series([None, np.nan], dtype='object'),
+    'single_value': pd.Series(['only']),
+    'category': pd.Series(pd.Categorical(['x', 'Y', None, 'x', '7'], categories=['x', 'Y', '7', 'unused'])),
+    'arrow_strings': pd.Series(['a', None, 'A1', 'a', '  '], dtype='string[pyarrow]'),
+}
+
+
+def assert_same_number(actual, expected):
+    if pd.isna(expected):
+        assert pd.isna(actual)
+    else:
+        assert actual == pytest.approx(float(expected), rel=1e-9)
+
+
+@pytest.mark.parametrize("name", NUMERIC_SERIES)
+@pytest.mark.parametrize("quantile_mode", ['exact', 'sketch'])
+def test_numeric_stats_match_pandas(name, quantile_mode):
+    serie = NUMERIC_SERIES[name]
+    numeric_col = NumericColumn(df=serie.to_frame('x'), quantile_mode=quantile_mode)
+    numeric_col.set_data('x')
+
+    assert numeric_col.n_missing == serie.isna().sum()
+    assert numeric_col.n_unique == serie.nunique()
+    assert numeric_col.n_zeros == (serie == 0).sum()
+    assert numeric_col.n_negatives == (serie < 0).sum()
+    assert_same_number(numeric_col.col_mean, serie.astype('float64').mean())
+    assert_same_number(numeric_col.col_std, serie.astype('float64').std())
+    assert_same_number(numeric_col.col_min, serie.min())
+    assert_same_number(numeric_col.col_max, serie.max())
+    if quantile_mode == 'exact':
+        assert_same_number(numeric_col.col_median, serie.astype('float64').median())
+        for percentile in DEFAULT_PERCENTILES:
+            assert_same_number(numeric_col.col_percentiles[percentile], serie.astype('float64').quantile(percentile / 100))
+
+
+@pytest.mark.parametrize("name", NUMERIC_SERIES)
+def test_numeric_accumulator_chunks_match_pandas(name):
+    serie = NUMERIC_SERIES[name]
+    accumulator = NumericAccumulator()
+    for chunk in np.array_split(serie, 3):
+        accumulator.update(chunk)
+
+    assert accumulator.n_rows == len(serie)
+    assert accumulator.n_missing == serie.isna().sum()
+    assert accumulator.n_zeros == (serie == 0).sum()
+    assert accumulator.n_negatives == (serie < 0).sum()
+    assert_same_number(accumulator.col_mean, serie.astype('float64').mean())
+    assert_same_number(accumulator.get_std(), serie.astype('float64').std())
+    assert_same_number(accumulator.col_min, serie.astype('float64').min())
+    assert_same_number(accumulator.col_max, serie.astype('float64').max())
+
+
+@pytest.mark.parametrize("name", TEXT_SERIES)
+def test_text_codes_match_value_counts(name):
+    serie = TEXT_SERIES[name]
+    text_col = TextColumn(df=serie.to_frame('x'))
+    text_col.set_data('x')
+
+    expected = serie.value_counts()
+    expected = expected[expected > 0]
+    assert dict(zip(text_col.uniques, text_col.counts)) == expected.to_dict()
+    assert text_col.n_unique == serie.nunique()
+    # Each code points to the value of its row
+    present = text_col.codes >= 0
+    assert np.array_equal(present, serie.notna().to_numpy())
+    assert list(text_col.uniques.take(text_col.codes[present])) == list(serie[present])
+
+
+def test_text_column_reused_for_another_column():
+    df = pd.DataFrame({'x': ['a', 'a', 'b'], 'y': ['c', 'd', 'd']})
+    text_col = TextColumn(df=df)
+    text_col.set_data('x')
+    text_col.set_frequent()
+    text_col.set_data('y')
+    text_col.set_barchart()
+    assert list(text_col.barchart.data['value']) == ['d', 'c']
+    # An empty serie clears the codes of the previous column
+    text_col.serie = df['x'].iloc[:0]
+    text_col.set_codes()
+    assert text_col.codes is None and text_col.uniques is None and text_col.counts is None
+
+
+@pytest.mark.parametrize("name", TEXT_SERIES)
+def test_text_properties_match_str_methods(name):
+    serie = TEXT_SERIES[name]
+    texts = serie.dropna().astype(str)
+    expected = {
+        'n_missing': serie.isna().sum(),
+        'n_empty': (texts == '').sum(),
+        'n_space': texts.str.isspace().sum(),
+        'n_lower': texts.str.islower().sum(),
+        'n_upper': texts.str.isupper().sum(),
+        'n_alpha': texts.str.isalpha().sum(),
+        'n_digit': texts.str.isdecimal().sum(),
+    }
+    assert count_text_properties(serie) == {name: int(count) for name, count in expected.items()}
+
+
+DATE_SERIES = {
+    'with_nat': pd.Series(pd.to_datetime(['2021-03-06', None, '1900-01-01', '2035-01-01', '1970-01-01', '1969-12-28 13:00', '2021-03-08'], format='ISO8601')),
+    'nat_only': pd.Series(pd.to_datetime([None, None])),
+    'single_value': pd.Series(pd.to_datetime(['2020-02-29 23:59'])),
+    'timezone': pd.Series(pd.to_datetime(['2021-03-06 23:30', None, '2021-03-08 01:00'], format='ISO8601')).dt.tz_localize('Europe/Paris'),
+}
+
+
+@pytest.mark.parametrize("name", DATE_SERIES)
+def test_date_properties_match_pandas(name):
+    serie = DATE_SERIES[name]
+    now = pd.Timestamp('2024-01-01')
+    counts = count_date_properties(serie, now)
+    local = serie.dt.tz_localize(None) if serie.dt.tz is not None else serie
+
+    assert counts['n_rows'] == len(serie)
+    assert counts['n_missing'] == serie.isna().sum()
+    assert counts['n_weekend'] == (local.dt.dayofweek >= 5).sum()
+    assert counts['n_weekday'] == (local.dt.dayofweek < 5).sum()
+    assert counts['n_future'] == (local > now).sum()
+    assert counts['n_empty_1900'] == (local == pd.Timestamp('1900-01-01')).sum()
+    assert counts['n_empty_1970'] == (local == pd.Timestamp('1970-01-01')).sum()
+    for name, expected in [('col_min', local.min()), ('col_max', local.max())]:
+        assert (pd.isna(counts[name]) and pd.isna(expected)) or counts[name] == expected
+
+
+@pytest.mark.parametrize("serie", [
+    pd.Series(np.random.default_rng(1).zipf(1.5, size=5_000) % 500),
+    pd.Series(pd.Categorical(['b', 'a', 'b', None, 'c', 'b'], categories=['a', 'b', 'c', 'unused'])),
+    pd.Series(['z', None, 'y', 'z'], dtype='object'),
+])
+def test_top_k_matches_value_counts(serie):
+    expected = serie.value_counts()
+    expected = expected[expected > 0]
+    top_k = get_top_k(serie, k=20)
+    assert list(top_k['occurrence']) == list(expected.head(20))
+    assert all(expected[value] == occurrence for value, occurrence in zip(top_k['value'], top_k['occurrence']))
+
+
+def test_heavy_hitters_merge_is_exact_below_capacity():
+    serie = pd.Series(np.random.default_rng(2).integers(0, 50, size=3_000))
+    summaries = []
+    for chunk in np.array_split(serie, 3):
+        summary = HeavyHitters(capacity=100)
+        summary.update(chunk)
+        summaries.append(summary)
+    merged = summaries[0]
+    for summary in summaries[1:]:
+        merged.merge(summary)
+    assert merged.n == len(serie)
+    assert merged.max_error == 0
+    assert merged.counts.sort_index().to_dict() == serie.value_counts().sort_index().to_dict()
+
+
+def test_heavy_hitters_merge_counts_error_bound():
+    serie = pd.Series(np.random.default_rng(3).zipf(1.3, size=20_000))
+    summary = HeavyHitters(capacity=50)
+    for chunk in np.array_split(serie, 8):
+        summary.merge_counts(chunk.value_counts())
+    exact = serie.value_counts()
+    assert summary.max_error <= len(serie) / (summary.capacity + 1)
+    for value, count in summary.counts.items():
+        assert exact[value] - summary.max_error <= count <= exact[value]
+    # Every value more frequent than the error bound is kept
+    assert set(exact[exact > summary.max_error].index) <= set(summary.counts.index)
+
+
+def test_kll_merge_rank_error():
+    values = np.random.default_rng(4).normal(size=200_000)
+    merged = KLLSketch()
+    for chunk in np.array_split(values, 5):
+        sketch = KLLSketch()
+        sketch.update(chunk)
+        merged.merge(sketch)
+    assert merged.n == values.size
+    sorted_values = np.sort(values)
+    quantiles = np.array([0.01, 0.25, 0.5, 0.75, 0.99])
+    ranks = np.searchsorted(sorted_values, merged.get_quantiles(quantiles)) / values.size
+    assert np.all(np.abs(ranks - quantiles) <= 2 * merged.get_rank_error())
+
+
+def test_kll_small_and_missing_inputs():
+    sketch = KLLSketch()
+    assert np.isnan(sketch.get_quantiles([0.5])).all()
+    sketch.update(np.array([np.nan, np.nan]))
+    assert sketch.n == 0
+    sketch.update(np.array([3.0, np.nan, 1.0, 2.0], dtype='float64'))
+    other = KLLSketch()
+    other.update(np.array([5, 4], dtype='int8'))
+    sketch.merge(other)
+    # No compaction: the sketch still holds every value
+    assert sketch.get_rank_error() == 0.0
+    assert list(sketch.get_quantiles([0.0, 0.5, 1.0])) == [1.0, 3.0, 5.0]
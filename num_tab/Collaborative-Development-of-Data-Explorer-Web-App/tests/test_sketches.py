@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common.sketches import HyperLogLog
+
+
+@pytest.mark.parametrize("n_distinct", [1_000, 10_000, 40_000, 100_000, 1_000_000])
+def test_hyperloglog_error_within_standard_error(n_distinct):
+    # Each value is repeated so the sketch sees more values than distinct ones
+    values = np.repeat(np.arange(n_distinct, dtype='int64') * 7919, 2)
+    sketch = HyperLogLog()
+    sketch.update(values)
+    assert abs(sketch.get_count() / n_distinct - 1) <= 4 * sketch.get_error()
+
+
+def test_hyperloglog_merge_matches_single_pass():
+    values = pd.Series(np.random.default_rng(0).integers(0, 50_000, size=200_000))
+    whole = HyperLogLog()
+    whole.update(values)
+    merged = HyperLogLog()
+    for chunk in np.array_split(values, 4):
+        part = HyperLogLog()
+        part.update(chunk)
+        merged.merge(part)
+    assert np.array_equal(whole.registers, merged.registers)
+    assert merged.get_count() == whole.get_count()
+
+
+def test_hyperloglog_empty_and_missing_values():
+    sketch = HyperLogLog()
+    assert sketch.get_count() == 0
+    sketch.update(pd.Series([np.nan, np.nan]))
+    assert sketch.get_count() == 0
+    sketch.update(pd.Series([1, 1.0, -0.0, 0]))
+    assert sketch.get_count() == 2